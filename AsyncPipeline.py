@@ -0,0 +1,303 @@
+import asyncio
+import itertools
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from Documenter.Documenter import get_doc_from_file
+from Documenter.GlobalVariable import ASYNC_QUEUE_SIZE, ASYNC_READERS
+from Documenter.Output.outMulti import doc_to_formats
+from Documenter.ParseCache import prune_cache
+from Documenter.Reader import read_batch
+from Documenter.Stats import hooks_enabled, collect_events, replay_events
+from Documenter.Walker import iter_python_entries
+
+# the item which marks the end of a stage's queue
+_END = object()
+
+
+async def aget_doc_from_dir(path:str, start_dir=None, ignore_no_docstr:bool=False, cache_dir:str=None, fast:bool=False, walk_options:dict=None,
+                            workers:int=1, readers:int=ASYNC_READERS, queue_size:int=ASYNC_QUEUE_SIZE, executor=None):
+    """
+    Generates a documentation dictionary from a single path (includes all files in directory, and subdirectories), without blocking the event loop
+    (see aiter_doc_from_dir for the arguements)
+    :return: the documentation dictionary
+    """
+    return {name: mod async for name, mod in aiter_doc_from_dir(
+        path, start_dir, ignore_no_docstr, cache_dir, fast, walk_options, workers, readers, queue_size, executor
+    )}
+
+
+async def aget_doc_from_files(files, start_dir=None, ignore_no_docstr:bool=False, cache_dir:str=None, fast:bool=False,
+                              workers:int=1, readers:int=ASYNC_READERS, queue_size:int=ASYNC_QUEUE_SIZE, executor=None):
+    """
+    Generates a documentation dictionary from a list of files, without blocking the event loop
+    (see aiter_doc_from_files for the arguements)
+    :return: the documentation dictionary
+    """
+    return {name: mod async for name, mod in aiter_doc_from_files(
+        files, start_dir, ignore_no_docstr, cache_dir, fast, workers, readers, queue_size, executor
+    )}
+
+
+def aiter_doc_from_dir(path:str, start_dir=None, ignore_no_docstr:bool=False, cache_dir:str=None, fast:bool=False, walk_options:dict=None,
+                       workers:int=1, readers:int=ASYNC_READERS, queue_size:int=ASYNC_QUEUE_SIZE, executor=None):
+    """
+    Generates the documentation of each file in a path (includes all files in directory, and subdirectories), one module at a time,
+    without blocking the event loop (the directory is walked while the first files are being parsed)
+    :param path: the path to the files to generate documentation from
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param readers: the number of files to read at once
+    :param queue_size: the size of the queue between each stage, and the number of files in the pipeline at once
+    :param executor: the executor to parse the files in (None to create a process pool of the specified number of workers)
+    :return: an async generator of (dotted name, module doc) pairs
+    """
+
+    # if no start dir is specified, set it to the provided path
+    if start_dir is None:
+        start_dir = path
+
+    return aiter_doc_from_files(
+        aiter_python_files(path, walk_options, queue_size), start_dir, ignore_no_docstr, cache_dir, fast, workers, readers, queue_size, executor
+    )
+
+
+async def aiter_python_files(path:str, walk_options:dict=None, batch_size:int=ASYNC_QUEUE_SIZE):
+    """
+    Walks a directory on a thread, in batches, so the event loop is not blocked by the walk
+    :param path: the directory to walk
+    :param walk_options: the options of the directory walk (see Walker.iter_python_entries)
+    :param batch_size: the number of files found in each step of the walk
+    :return: an async generator of the path of each Python file (in the same order as find_python_files)
+    """
+
+    loop = asyncio.get_running_loop()
+    entries = iter_python_entries(path, **(walk_options or {}))
+
+    with ThreadPoolExecutor(max_workers=1) as walker:
+        while True:
+            batch = await loop.run_in_executor(walker, lambda: list(itertools.islice(entries, batch_size)))
+            if len(batch) == 0:
+                return
+            for entry in batch:
+                yield entry.path
+
+
+async def aiter_doc_from_files(files, start_dir=None, ignore_no_docstr:bool=False, cache_dir:str=None, fast:bool=False,
+                               workers:int=1, readers:int=ASYNC_READERS, queue_size:int=ASYNC_QUEUE_SIZE, executor=None):
+    """
+    Generates the documentation of each file, one module at a time, without blocking the event loop
+    The files go through a pipeline of stages, connected by limited queues:
+        discovery (iterating over the files), reading (on threads), parsing (in the executor), and the caller consuming the modules
+    A slow consumer stops the other stages once the queues are full, so the modules are never all held in memory
+    The modules are always yielded in the order of the provided files, so the output is the same as iter_doc_from_files
+    Closing the generator (or cancelling the task using it) stops every stage
+    :param files: the list (or async iterable) of the files to generate documentation from
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param readers: the number of files to read at once
+    :param queue_size: the size of the queue between each stage, and the number of files in the pipeline at once
+    :param executor: the executor to parse the files in (None to create a process pool of the specified number of workers)
+    :return: an async generator of (dotted name, module doc) pairs
+    """
+
+    # a value of 0 (or less) uses every core
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+    readers = max(1, readers)
+    queue_size = max(1, queue_size)
+
+    loop = asyncio.get_running_loop()
+
+    # the files are parsed in other processes, so the event loop is not blocked by the parser
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    io_executor = ThreadPoolExecutor(max_workers=readers)
+
+    # the hooks can not be called from the other processes, so their events are sent back with each result
+    collect = hooks_enabled() and isinstance(executor, ProcessPoolExecutor)
+
+    # the files to read, the files to parse, and the result of each file (in the order of the files)
+    to_read = asyncio.Queue(maxsize=queue_size)
+    to_parse = asyncio.Queue(maxsize=queue_size)
+    results = asyncio.Queue()
+
+    # the number of files in the pipeline (discovery waits for a file to be consumed once this is full)
+    in_flight = asyncio.Semaphore(queue_size)
+
+    async def discover():
+        """
+        sends each file to the readers (the first stage)
+        """
+        try:
+            if hasattr(files, "__aiter__"):
+                async for f in files:
+                    await send(f)
+            else:
+                for f in files:
+                    await send(f)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # the error is raised once the files before it have been consumed
+            await results.put(e)
+
+        await results.put(_END)
+        for _ in range(readers):
+            await to_read.put(_END)
+
+    async def send(filename):
+        """
+        sends a file to the readers, once there is room for it in the pipeline
+        :param filename: the path of the file
+        """
+        await in_flight.acquire()
+        result = loop.create_future()
+        await results.put(result)
+        await to_read.put((filename, result))
+
+    async def read():
+        """
+        reads the files, and sends them to the parsers (a file which can not be read raises its error when it is parsed)
+        """
+        while True:
+            item = await to_read.get()
+            if item is _END:
+                return
+
+            filename, result = item
+            source = (await loop.run_in_executor(io_executor, read_batch, [filename]))[0]
+            await to_parse.put((filename, source, result))
+
+    async def read_all():
+        """
+        runs the readers, and stops the parsers once every reader has stopped
+        """
+        await asyncio.gather(*(read() for _ in range(readers)))
+        for _ in range(workers):
+            await to_parse.put(_END)
+
+    async def parse():
+        """
+        parses the files in the executor, setting the result of each file
+        """
+        while True:
+            item = await to_parse.get()
+            if item is _END:
+                return
+
+            filename, source, result = item
+            try:
+                if collect:
+                    doc, events = await loop.run_in_executor(
+                        executor, collect_events, get_doc_from_file, filename, start_dir, ignore_no_docstr, cache_dir, fast, source
+                    )
+                    replay_events(events)
+                else:
+                    doc = await loop.run_in_executor(executor, get_doc_from_file, filename, start_dir, ignore_no_docstr, cache_dir, fast, source)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not result.done():
+                    result.set_exception(e)
+                continue
+
+            if not result.done():
+                result.set_result(doc)
+
+    tasks = [loop.create_task(discover()), loop.create_task(read_all())]
+    tasks += [loop.create_task(parse()) for _ in range(workers)]
+
+    try:
+        while True:
+            result = await results.get()
+            if result is _END:
+                break
+            if isinstance(result, Exception):
+                raise result
+
+            # wait for the next file in order (the files after it keep being read and parsed)
+            doc = await result
+            in_flight.release()
+
+            # yield each module of the file (files without any documentation are skipped)
+            for name, mod in doc.items():
+                yield name, mod
+
+        # keep the cache within its size limit
+        if cache_dir is not None:
+            await loop.run_in_executor(io_executor, prune_cache, cache_dir)
+
+    finally:
+        # stop every stage (this is also reached when the generator is closed, or the task using it is cancelled)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if hasattr(files, "aclose"):
+            await files.aclose()
+
+        # wait for the files which were already being parsed on a thread, so the event loop is not blocked
+        if own_executor:
+            await loop.run_in_executor(io_executor, executor.shutdown)
+        io_executor.shutdown(wait=False)
+
+
+async def adoc_to_formats(doc, targets, writers:dict=None):
+    """
+    outputs the doc dict in one or more file types, without blocking the event loop (the writers run on a thread)
+    When given an async generator (ex. aiter_doc_from_dir), each module is only parsed once the writers are ready for it
+    Cancelling the task stops the writers at the next module, and closes the async generator
+    :param doc: the doc dict, generator, or async generator of (dotted name, module doc) pairs to write
+    :param targets: a list of (file type, filename) pairs (ex. [("txt", "out.txt"), ("html", "out.html")], see OUTPUT_TYPES)
+    :param writers: the file types, and the function which writes each one (None for OUTPUT_TYPES)
+    :return: the list of the value returned by each output (see doc_to_formats)
+    """
+
+    loop = asyncio.get_running_loop()
+
+    if not hasattr(doc, "__anext__"):
+        return await loop.run_in_executor(None, doc_to_formats, doc, targets, writers)
+
+    stopped = threading.Event()
+
+    async def next_module():
+        """
+        gets the next module from the async generator
+        :return: the (dotted name, module doc) pair
+        """
+        return await doc.__anext__()
+
+    def modules():
+        """
+        gets each module from the async generator on the event loop (run on the writers' thread)
+        :return: a generator of (dotted name, module doc) pairs
+        """
+        while True:
+            if stopped.is_set():
+                raise asyncio.CancelledError()
+            try:
+                item = asyncio.run_coroutine_threadsafe(next_module(), loop).result()
+            except StopAsyncIteration:
+                return
+            yield item
+
+    future = loop.run_in_executor(None, doc_to_formats, modules(), targets, writers)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # wait for the writers to stop, before the async generator is closed
+        stopped.set()
+        await asyncio.wait([future])
+        future.exception()
+        raise
+    finally:
+        await doc.aclose()
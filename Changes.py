@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+from typing import List
+
+from Documenter.Documenter import parse_files
+from Documenter.ParseCache import prune_cache
+from Documenter.Stats import instrument_iter
+from Documenter.misc import find_python_files, path_to_dot_notation
+
+
+def path_key(path:str):
+    """
+    Normalizes a path, so the paths git reports can be compared with the paths found by the directory walk
+    (symbolic links are resolved, as git reports the real path of the repository, even if it was reached through a link)
+    :param path: the path
+    :return: the normalized real path
+    """
+    return os.path.normcase(os.path.realpath(path))
+
+
+def run_git(path:str, args:List[str]):
+    """
+    Runs a git command in a local repository (git only reads the repository, nothing is fetched)
+    :param path: a directory in the repository
+    :param args: the arguements of the git command (ex. ["diff", "--name-status"])
+    :return: the command's output (bytes)
+    """
+
+    try:
+        result = subprocess.run(["git", "-C", path] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
+        raise ValueError("Git Is Not Installed (Use --files-from Instead)")
+
+    if result.returncode != 0:
+        raise ValueError("Git Failed: {}".format(result.stderr.decode("utf-8", "replace").strip()))
+    return result.stdout
+
+
+def git_changed_files(path:str, since:str):
+    """
+    Finds the files in a directory of a local git repository which have changed since a revision
+    (the working tree is compared with the revision, so uncommitted and untracked files are included)
+    A renamed file is both a deleted file (its old path) and a changed file (its new path)
+    :param path: the directory (in the repository)
+    :param since: the revision to compare with (ex. "main", "HEAD~3", or a commit hash)
+    :return: the list of changed (added, modified, or renamed) files, and the list of deleted files (both absolute paths)
+    """
+
+    top = os.fsdecode(run_git(path, ["rev-parse", "--show-toplevel"]).strip())
+
+    # the paths are separated by null characters, so no path is quoted
+    output = run_git(path, ["diff", "--name-status", "--no-color", "-z", "-M", since, "--", "."])
+    fields = [os.fsdecode(f) for f in output.split(b"\0") if f != b""]
+
+    changed = []
+    deleted = []
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+
+        # a rename or copy is followed by the old and new paths
+        if status[0] in "RC":
+            old, new = fields[i + 1], fields[i + 2]
+            if status[0] == "R":
+                deleted.append(old)
+            changed.append(new)
+            i += 3
+            continue
+
+        if status[0] == "D":
+            deleted.append(fields[i + 1])
+        else:
+            changed.append(fields[i + 1])
+        i += 2
+
+    # the files which are not tracked yet are new files
+    untracked = run_git(path, ["ls-files", "--others", "--exclude-standard", "--full-name", "-z", "--", "."])
+    changed += [os.fsdecode(f) for f in untracked.split(b"\0") if f != b""]
+
+    return [os.path.normpath(os.path.join(top, f)) for f in changed], [os.path.normpath(os.path.join(top, f)) for f in deleted]
+
+
+def read_file_list(filename:str):
+    """
+    Reads a list of changed files, one path per line (ex. the output of "git diff --name-only")
+    Each listed file which does not exist is a deleted file
+    :param filename: the file of paths ("-" to read the paths from stdin)
+    :return: the list of changed files, and the list of deleted files (both absolute paths)
+    """
+
+    if filename == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(filename, 'r', encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    paths = [os.path.abspath(line.strip()) for line in lines if line.strip() != ""]
+    return [p for p in paths if os.path.exists(p)], [p for p in paths if not os.path.exists(p)]
+
+
+@instrument_iter
+def iter_doc_from_changes(path:str, changed:List[str], base=None, start_dir=None, ignore_no_docstr:bool=False, workers:int=1,
+                          cache_dir:str=None, fast:bool=False, io_stats:dict=None, walk_options:dict=None, symbols=None):
+    """
+    Generates the documentation of each file in a directory, only parsing the files which have changed, and reading every other
+    module from the documentation of a previous run (ex. a snapshot of the whole directory, written before the changes)
+    The directory is walked (which is fast compared to parsing), so the modules are in the same order as documenting the directory
+    at once, and the modules of deleted (or renamed) files are left out
+    The previous documentation must have been written from the files before the changes (with the same options),
+    any file which is not in it is parsed as well
+    :param path: the path to the files to generate documentation from
+    :param changed: the list of the files which have changed (see git_changed_files and read_file_list)
+    :param base: the previous documentation (a snapshot, see Snapshot.DocSnapshot, or a doc dict parsed from the files),
+        None to only document the changed files (a doc dict read from the json output is not the same, as tuples are written as lists)
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param symbols: the symbol index to add each module to as it is generated (see Symbols.SymbolIndex, None to not index them),
+        each arguement's dotted type is documented by its name when it is used (so the previous documentation should be as well)
+    :return: a generator of (dotted name, module doc) pairs
+    """
+
+    # if no start dir is specified, set it to the provided path
+    if start_dir is None:
+        start_dir = path
+
+    changed = set(path_key(f) for f in changed)
+    files = find_python_files(path, walk_options)
+    names = [path_to_dot_notation(f, start_dir) for f in files]
+
+    def missing(i):
+        """
+        checks if a file is not in the previous documentation (an empty file is never documented, so it is not missing)
+        :param i: the index of the file
+        :return: If the file is parsed, as it is not in the previous documentation
+        """
+        if base is None or names[i] in base:
+            return False
+        try:
+            return os.path.getsize(files[i]) > 0
+        except OSError:
+            return True
+
+    # the files which are parsed (without previous documentation, only the changed files are documented)
+    parse = [i for i in range(len(files)) if path_key(files[i]) in changed or missing(i)]
+    parsed = iter(parse_files([files[i] for i in parse], start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats, symbols is not None))
+    parse = set(parse)
+
+    for i in range(len(files)):
+        if i in parse:
+            modules = next(parsed).items()
+        elif base is not None and names[i] in base:
+            modules = [(names[i], base[names[i]])]
+        else:
+            continue
+
+        for name, mod in modules:
+            if symbols is not None:
+                symbols.add_module(name, mod)
+            yield name, mod
+
+    # keep the cache within its size limit
+    if cache_dir is not None:
+        prune_cache(cache_dir)
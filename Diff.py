@@ -0,0 +1,305 @@
+import hashlib
+import json
+
+# the size of each hash (in bytes)
+HASH_SIZE = 32
+
+# the symbols each change is marked with in the text report
+CHANGE_MARKS = {"added": "+", "removed": "-", "changed": "~"}
+
+
+def value_text(value):
+    """
+    converts an arguement's default value to the text it is hashed and reported as
+    The value is written the way it is read back from the json output (tuples are written as lists, and the keys of dicts as strings),
+    so a doc dict read from a JSON file compares the same as one parsed from the files
+    (the items of a set are sorted, as the order of a set is not the same in every run)
+    :param value: the default value
+    :return: the text of the value
+    """
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(value_text(v) for v in value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(value_text(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join("{}: {}".format(repr(json_key(k)), value_text(v)) for k, v in value.items()) + "}"
+    return repr(value)
+
+
+def json_key(key):
+    """
+    converts a key of a dict to the string the json module writes it as (ex. 1 is written as "1", and True as "true")
+    :param key: the key
+    :return: the key as a string (the text of a key which the json module does not write, ex. a tuple)
+    """
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    return repr(key)
+
+
+def function_hash(func):
+    """
+    hashes a function's arguements (their names, types, and default values) and docstring
+    :param func: the function's doc dict
+    :return: the hash (bytes)
+    """
+    h = hashlib.sha256(b"function\0")
+    for a in func["args"]:
+        h.update("{}\0{}\0{}\0".format(a["name"], a["type"], value_text(a["value"])).encode("utf-8", "surrogatepass"))
+    h.update(b"\1" + func["doc"].encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def class_hash(cls):
+    """
+    hashes a class's docstring, and the hash of each of its methods (a Merkle hash, so the methods are not compared
+    if the hashes of their classes are the same)
+    :param cls: the class's doc dict
+    :return: the hash (bytes)
+    """
+    h = hashlib.sha256(b"class\0" + cls["doc"].encode("utf-8", "surrogatepass") + b"\0")
+    for name in sorted(cls["func"]):
+        h.update(name.encode("utf-8", "surrogatepass") + b"\0" + function_hash(cls["func"][name]))
+    return h.digest()
+
+
+def module_hash(mod):
+    """
+    hashes the hash of each of a module's functions and classes (in the order of their names, so the order they are
+    defined in does not change the hash)
+    :param mod: the module's doc dict
+    :return: the hash (bytes)
+    """
+    h = hashlib.sha256(b"module\0")
+    for name in sorted(mod["functions"]):
+        h.update(b"f" + name.encode("utf-8", "surrogatepass") + b"\0" + function_hash(mod["functions"][name]))
+    for name in sorted(mod["classes"]):
+        h.update(b"c" + name.encode("utf-8", "surrogatepass") + b"\0" + class_hash(mod["classes"][name]))
+    return h.digest()
+
+
+def doc_module_hash(doc, name:str):
+    """
+    gets the hash of a module of a doc dict (the hash stored in a snapshot is read rather than hashing the module, see Snapshot.DocSnapshot)
+    :param doc: the doc dict (or snapshot)
+    :param name: the module's dotted name
+    :return: the hash (bytes)
+    """
+    if hasattr(doc, "module_hash"):
+        return doc.module_hash(name)
+    return module_hash(doc[name])
+
+
+def is_public(name:str):
+    """
+    checks if a name is part of the public API (it does not start with an underscore, or is a special method, ex. __init__)
+    :param name: the module's, class's, or function's name (the last part of a module's dotted name is checked)
+    :return: If the name is public
+    """
+    name = name.rsplit(".", 1)[-1]
+    return not name.startswith("_") or (name.startswith("__") and name.endswith("__"))
+
+
+def signature_text(func, defaults:bool=True):
+    """
+    generates a function's signature (ex. "(path: str, depth = 1)")
+    :param func: the function's doc dict
+    :param defaults: If the default values are included
+    :return: the signature
+    """
+    args = []
+    for a in func["args"]:
+        text = a["name"]
+        if a["type"] != "any":
+            text += ": " + a["type"]
+        if defaults and a["value"] is not None:
+            text += " = " + value_text(a["value"])
+        args.append(text)
+    return "(" + ", ".join(args) + ")"
+
+
+def diff_docs(old, new, public:bool=False):
+    """
+    Compares two versions of the documentation, and finds each module, class and function which was added, removed, or changed
+    Each module, class and function is compared by its Merkle hash first, so the parts which have not changed are skipped
+    without comparing their contents (the hashes stored in a snapshot are used without reading the modules at all)
+    Each change is a dict of:
+        change: "added", "removed", or "changed"
+        kind: "module", "class", or "function"
+        name: the full dotted name (ex. "package.module.Class.method")
+        signature: the signature of an added or removed function (ex. "(path: str, depth = 1)")
+        details: the list of the changes to a changed class or function, each a dict with the "field" which changed
+            ("signature", "default", or "docstring"), its "old" and "new" values, and the "arg" of a default value
+    :param old: the previous doc dict (or snapshot, see Snapshot.DocSnapshot)
+    :param new: the current doc dict (or snapshot)
+    :param public: If only the public API is compared (the names which do not start with an underscore, see is_public)
+    :return: the list of changes (the modules in the order of the current documentation, then the removed modules)
+    """
+
+    # generators of (dotted name, module doc) pairs are read into doc dicts, so each module can be found by its name
+    if not hasattr(old, "keys"):
+        old = dict(old)
+    if not hasattr(new, "keys"):
+        new = dict(new)
+
+    changes = []
+
+    for name in new:
+        if public and not is_public(name):
+            continue
+
+        if name not in old:
+            changes.append({"change": "added", "kind": "module", "name": name})
+
+        # only the modules whose hash has changed are compared
+        elif doc_module_hash(old, name) != doc_module_hash(new, name):
+            diff_module(changes, name, old[name], new[name], public)
+
+    for name in old:
+        if name not in new and (not public or is_public(name)):
+            changes.append({"change": "removed", "kind": "module", "name": name})
+
+    return changes
+
+
+def diff_module(changes:list, module:str, old:dict, new:dict, public:bool=False):
+    """
+    Compares two versions of a module (see diff_docs)
+    :param changes: the list to add each change to
+    :param module: the module's dotted name
+    :param old: the previous version of the module
+    :param new: the current version of the module
+    :param public: If only the public API is compared
+    """
+
+    diff_functions(changes, module + ".", old["functions"], new["functions"], public)
+
+    old_classes = old["classes"]
+    new_classes = new["classes"]
+    for name, cls in new_classes.items():
+        if public and not is_public(name):
+            continue
+
+        full_name = module + "." + name
+        if name not in old_classes:
+            changes.append({"change": "added", "kind": "class", "name": full_name})
+            continue
+
+        previous = old_classes[name]
+        if class_hash(previous) == class_hash(cls):
+            continue
+
+        # the class's docstring is reported with the class, and its methods on their own
+        if previous["doc"] != cls["doc"]:
+            changes.append({"change": "changed", "kind": "class", "name": full_name, "details": [
+                {"field": "docstring", "old": previous["doc"], "new": cls["doc"]}
+            ]})
+        diff_functions(changes, full_name + ".", previous["func"], cls["func"], public)
+
+    for name in old_classes:
+        if name not in new_classes and (not public or is_public(name)):
+            changes.append({"change": "removed", "kind": "class", "name": module + "." + name})
+
+
+def diff_functions(changes:list, prefix:str, old:dict, new:dict, public:bool=False):
+    """
+    Compares two versions of the functions of a module or class (see diff_docs)
+    :param changes: the list to add each change to
+    :param prefix: the start of the full dotted name of each function
+    :param old: the previous dict of functions
+    :param new: the current dict of functions
+    :param public: If only the public API is compared
+    """
+
+    for name, func in new.items():
+        if public and not is_public(name):
+            continue
+
+        if name not in old:
+            changes.append({"change": "added", "kind": "function", "name": prefix + name, "signature": signature_text(func)})
+            continue
+
+        previous = old[name]
+        if function_hash(previous) == function_hash(func):
+            continue
+
+        details = []
+
+        # the arguements' names and types, then the default value of each arguement which is in both versions
+        old_signature = signature_text(previous, False)
+        new_signature = signature_text(func, False)
+        if old_signature != new_signature:
+            details.append({"field": "signature", "old": old_signature, "new": new_signature})
+
+        old_values = {a["name"]: a["value"] for a in previous["args"]}
+        for a in func["args"]:
+            if a["name"] in old_values and value_text(old_values[a["name"]]) != value_text(a["value"]):
+                details.append({"field": "default", "arg": a["name"], "old": value_text(old_values[a["name"]]), "new": value_text(a["value"])})
+
+        if previous["doc"] != func["doc"]:
+            details.append({"field": "docstring", "old": previous["doc"], "new": func["doc"]})
+
+        # an arguement which was only added or removed changes the signature, so there is always a detail
+        changes.append({"change": "changed", "kind": "function", "name": prefix + name, "details": details})
+
+    for name, func in old.items():
+        if name not in new and (not public or is_public(name)):
+            changes.append({"change": "removed", "kind": "function", "name": prefix + name, "signature": signature_text(func)})
+
+
+def count_changes(changes:list):
+    """
+    Counts the changes of each type
+    :param changes: the list of changes (see diff_docs)
+    :return: a dict of the number of "added", "removed", and "changed" modules, classes and functions
+    """
+    output = {"added": 0, "removed": 0, "changed": 0}
+    for c in changes:
+        output[c["change"]] += 1
+    return output
+
+
+def format_diff(changes:list):
+    """
+    Formats the changes as text, one change per line (+ added, - removed, ~ changed), with the details of each changed class
+    and function below it
+    :param changes: the list of changes (see diff_docs)
+    :return: the text
+    """
+
+    lines = []
+    for c in changes:
+        line = "{} {} {}".format(CHANGE_MARKS[c["change"]], c["kind"], c["name"])
+        if "signature" in c:
+            line += c["signature"]
+        lines.append(line)
+
+        for d in c.get("details", ()):
+            if d["field"] == "signature":
+                lines.append("      signature: {} -> {}".format(d["old"], d["new"]))
+            elif d["field"] == "default":
+                lines.append("      default {}: {} -> {}".format(d["arg"], d["old"], d["new"]))
+            else:
+                lines.append("      docstring changed")
+
+    counts = count_changes(changes)
+    if len(changes) == 0:
+        lines.append("No Changes")
+    else:
+        lines.append("{} Added, {} Removed, {} Changed".format(counts["added"], counts["removed"], counts["changed"]))
+    return "\n".join(lines) + "\n"
+
+
+def diff_to_json(changes:list, indent:int=2):
+    """
+    Formats the changes as JSON (an object of the number of each type of change, and the list of changes)
+    :param changes: the list of changes (see diff_docs)
+    :param indent: the number of spaces to indent the JSON by
+    :return: the JSON text
+    """
+
+    output = count_changes(changes)
+    output["changes"] = changes
+    return json.dumps(output, indent=indent, ensure_ascii=False)
@@ -0,0 +1,180 @@
+import sys
+from abc import abstractmethod
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from Documenter.misc import iter_modules
+
+# shared empty containers, so functions without arguements and modules without functions or classes do not allocate any
+EMPTY_ARGS = ()
+EMPTY_MEMBERS = MappingProxyType({})
+
+
+class DocNode(Mapping):
+    """
+    The abstract base of the compact doc model classes (Mapping is an abstract base class, so the node itself can not be created)
+    Each node is a read-only mapping of its attributes, so it can be used anywhere a doc dict is used (ex. node["doc"])
+    """
+
+    __slots__ = ()
+
+    # the keys of the node's doc dict (set by each subclass)
+    KEYS = ()
+
+    def __getitem__(self, key):
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join("{}={!r}".format(k, getattr(self, k)) for k in self.KEYS))
+
+    def __reduce__(self):
+        # nodes are pickled by their constructor arguements (the read-only containers can not be pickled themselves)
+        return type(self), tuple(dict(v) if isinstance(v, MappingProxyType) else v for v in (getattr(self, k) for k in self.KEYS))
+
+    @abstractmethod
+    def to_dict(self):
+        """
+        Converts the node back to a plain doc dict (each subclass converts its own attributes)
+        :return: the doc dict
+        """
+
+
+class ArgDoc(DocNode):
+    """
+    The documentation of a function's arguement
+    """
+
+    __slots__ = ("name", "type", "value")
+    KEYS = ("name", "type", "value")
+
+    def __init__(self, name:str, type:str, value=None):
+        """
+        :param name: the arguement's name
+        :param type: the arguement's type name (names are interned, as the same few types are used everywhere)
+        :param value: the arguement's default value
+        """
+        self.name = sys.intern(name)
+        self.type = sys.intern(type)
+        self.value = value
+
+    def to_dict(self):
+        return {"name": self.name, "type": self.type, "value": self.value}
+
+
+class FunctionDoc(DocNode):
+    """
+    The documentation of a function or method
+    """
+
+    __slots__ = ("args", "doc")
+    KEYS = ("args", "doc")
+
+    def __init__(self, args, doc:str):
+        """
+        :param args: the list of the function's ArgDoc
+        :param doc: the function's docstring
+        """
+        self.args = tuple(args) or EMPTY_ARGS
+        self.doc = doc
+
+    def to_dict(self):
+        return {"args": [a.to_dict() for a in self.args], "doc": self.doc}
+
+
+class ClassDoc(DocNode):
+    """
+    The documentation of a class
+    """
+
+    __slots__ = ("func", "doc")
+    KEYS = ("func", "doc")
+
+    def __init__(self, func:dict, doc:str):
+        """
+        :param func: the dict of the class's method names, and their FunctionDoc
+        :param doc: the class's docstring
+        """
+        self.func = MappingProxyType(func) if len(func) > 0 else EMPTY_MEMBERS
+        self.doc = doc
+
+    def to_dict(self):
+        return {"func": {n: f.to_dict() for n, f in self.func.items()}, "doc": self.doc}
+
+
+class ModuleDoc(DocNode):
+    """
+    The documentation of a module (file)
+    """
+
+    __slots__ = ("functions", "classes", "file")
+    KEYS = ("functions", "classes", "file")
+
+    def __init__(self, functions:dict, classes:dict, file:str):
+        """
+        :param functions: the dict of the module's function names, and their FunctionDoc
+        :param classes: the dict of the module's class names, and their ClassDoc
+        :param file: the module's name in dot notation
+        """
+        self.functions = MappingProxyType(functions) if len(functions) > 0 else EMPTY_MEMBERS
+        self.classes = MappingProxyType(classes) if len(classes) > 0 else EMPTY_MEMBERS
+        self.file = file
+
+    def to_dict(self):
+        return {
+            "functions": {n: f.to_dict() for n, f in self.functions.items()},
+            "classes": {n: c.to_dict() for n, c in self.classes.items()},
+            "file": self.file
+        }
+
+
+def function_to_model(func:dict):
+    """
+    Converts a function's doc dict to a FunctionDoc
+    :param func: the function's doc dict
+    :return: the FunctionDoc
+    """
+    return FunctionDoc([ArgDoc(a["name"], a["type"], a["value"]) for a in func["args"]], func["doc"])
+
+
+def module_to_model(mod:dict):
+    """
+    Converts a module's doc dict to a ModuleDoc
+    :param mod: the module's doc dict
+    :return: the ModuleDoc
+    """
+    return ModuleDoc(
+        {sys.intern(n): function_to_model(f) for n, f in mod["functions"].items()},
+        {
+            sys.intern(n): ClassDoc({sys.intern(m): function_to_model(f) for m, f in c["func"].items()}, c["doc"])
+            for n, c in mod["classes"].items()
+        },
+        mod["file"]
+    )
+
+
+def compact_doc(doc):
+    """
+    Converts a doc dict to the compact doc model
+    Pass a generator (ex. iter_doc_from_dir) to avoid ever holding the full doc dict in memory
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to convert
+    :return: a dict of each module's dotted name, and its ModuleDoc
+    """
+    return {name: module_to_model(mod) for name, mod in iter_modules(doc)}
+
+
+def model_to_doc(model:dict):
+    """
+    Converts the compact doc model back to a plain doc dict
+    :param model: the dict of each module's dotted name, and its ModuleDoc
+    :return: the doc dict
+    """
+    return {name: mod.to_dict() for name, mod in model.items()}
+
@@ -1,29 +1,90 @@
 # region Imports
+import functools
+import importlib
 import os
 import sys
+import time
 from typing import List
 
 # these modules are imported thie way to allow the calling file to access them
 from Documenter.GlobalVariable import HELP_TEXT
-from Documenter.Output.outHTML import doc_to_html
-from Documenter.Output.outJSON import doc_to_json
-from Documenter.Output.outMySQL import doc_to_mysql
-from Documenter.Output.outTxt import doc_to_txt
-from Documenter.Output.outXML import doc_to_xml
-from Documenter.Output.outSQLite import doc_to_sqlite
-from Documenter.Output.outMD import doc_to_md
+from Documenter.Output.outMulti import doc_to_formats, OUTPUT_TYPES
+from Documenter.GlobalVariable import DEFAULT_CACHE_DIR, DEFAULT_EXCLUDES, SEARCH_LIMIT, LINK_OUTPUT_TYPES
+from Documenter.ParseCache import prune_cache, clear_cache
 from Documenter.Py2Dict import file_to_dict
-from Documenter.misc import path_to_dot_notation
+from Documenter.Reader import prefetch_sources, new_io_stats, format_io_stats
+from Documenter.Stats import StatsCollector, instrument, instrument_iter, hooks_enabled, collect_events, replay_events
+from Documenter.misc import path_to_dot_notation, find_python_files, pop_cli_option, pop_cli_options, pop_cli_flag
+
+# the functions the calling file can access, which are imported from their module the first time they are used
+# (so only the outputs which are used are imported)
+LAZY_IMPORTS = {
+    "doc_to_html": "Documenter.Output.outHTML",
+    "doc_to_json": "Documenter.Output.outJSON",
+    "doc_to_ndjson": "Documenter.Output.outJSON",
+    "iter_ndjson": "Documenter.Output.outJSON",
+    "doc_to_mysql": "Documenter.Output.outMySQL",
+    "doc_to_mysql_tsv": "Documenter.Output.outMySQL",
+    "doc_to_txt": "Documenter.Output.outTxt",
+    "doc_to_xml": "Documenter.Output.outXML",
+    "doc_to_sqlite": "Documenter.Output.outSQLite",
+    "doc_to_sqlite_db": "Documenter.Output.outSQLite",
+    "doc_to_md": "Documenter.Output.outMD",
+    "doc_to_html_pages": "Documenter.Output.outPages",
+    "doc_to_md_pages": "Documenter.Output.outPages",
+    "doc_to_pages": "Documenter.Output.outPages",
+    "search_docs": "Documenter.Search",
+    "format_results": "Documenter.Search",
+    "SymbolIndex": "Documenter.Symbols",
+    "build_symbol_index": "Documenter.Symbols",
+    "diff_docs": "Documenter.Diff",
+    "format_diff": "Documenter.Diff",
+    "diff_to_json": "Documenter.Diff",
+    "doc_to_snapshot": "Documenter.Snapshot",
+    "DocSnapshot": "Documenter.Snapshot",
+    "load_snapshot": "Documenter.Snapshot",
+    "is_snapshot": "Documenter.Snapshot",
+    "compact_doc": "Documenter.DocModel",
+    "model_to_doc": "Documenter.DocModel"
+}
+
+__all__ = [
+    "get_doc_from_file", "get_doc_from_files", "get_doc_from_dir", "iter_doc_from_files", "iter_doc_from_dir", "parse_files",
+    "doc_to_formats", "OUTPUT_TYPES", "HELP_TEXT", "DEFAULT_CACHE_DIR", "DEFAULT_EXCLUDES", "SEARCH_LIMIT", "prune_cache",
+    "clear_cache", "file_to_dict", "prefetch_sources", "new_io_stats", "format_io_stats", "StatsCollector", "path_to_dot_notation",
+    "find_python_files", "load_doc"
+] + list(LAZY_IMPORTS)
+
+
+def __getattr__(name:str):
+    """
+    Imports the functions in LAZY_IMPORTS the first time they are accessed (ex. from Documenter.Documenter import doc_to_html)
+    :param name: the name of the attribute
+    :return: the function
+    """
+
+    if name not in LAZY_IMPORTS:
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
+    value = getattr(importlib.import_module(LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
 # endregion
 
 
 # region File To Dict Converters (what the user calls)
-def get_doc_from_file(filename:str, start_dir=None, ignore_no_docstr:bool=False):
+def get_doc_from_file(filename:str, start_dir=None, ignore_no_docstr:bool=False, cache_dir:str=None, fast:bool=False, source:bytes=None,
+                      dotted_types:bool=False):
     """
     Generates a documentation dictionary from a single file
     :param filename: the name of the file to generate documentation from
     :param start_dir: the relative path to start the file's display name (in dot notation)
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param source: the contents of the file, if it has already been read (None to read the file)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
+        (used to link the types to their definitions, see Symbols.SymbolIndex)
     :return: the documentation dictionary
     """
 
@@ -32,7 +93,7 @@ def get_doc_from_file(filename:str, start_dir=None, ignore_no_docstr:bool=False)
         start_dir = os.path.dirname(filename)
 
     # generate the dictionary from the path
-    output = file_to_dict(filename, start_dir, ignore_no_docstr)
+    output = file_to_dict(filename, start_dir, ignore_no_docstr, cache_dir, fast, source, dotted_types)
 
     # if no output is created, set the value to an empty dict
     if output is None:
@@ -43,106 +104,547 @@ def get_doc_from_file(filename:str, start_dir=None, ignore_no_docstr:bool=False)
     return {path_to_dot_notation(filename, start_dir): output}
 
 
-def get_doc_from_files(files:List[str], start_dir=None, ignore_no_docstr:bool=False):
+def get_doc_from_files(files:List[str], start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False, io_stats:dict=None,
+                       symbols=None, compact:bool=False):
     """
     Generates a documentation dictionary from a list of files
     :param files: the list of the files to generate documentation from
     :param start_dir: the relative path to start each file's display name (in dot notation)
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param symbols: the symbol index to add each module to as it is documented (see Symbols.SymbolIndex, None to not index them)
+    :param compact: If each module is stored in the compact doc model as it is documented (see DocModel.compact_doc)
     :return: the documentation dictionary
     """
 
-    output = {}
+    docs = iter_doc_from_files(files, start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats, symbols)
 
-    # iterate over each file provided
-    for f in files:
+    # each module is converted as it is documented, so the full doc dict is never held in memory
+    if compact:
+        from Documenter.DocModel import compact_doc
+        return compact_doc(docs)
 
-        # get the documentation from each file
-        val = get_doc_from_file(f, start_dir, ignore_no_docstr)
+    # add the documentation of each file to the doc dict (in the order provided)
+    return dict(docs)
+
+
+@instrument
+def get_doc_from_dir(path:str, start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False, io_stats:dict=None, walk_options:dict=None,
+                     symbols=None, compact:bool=False):
+    """
+    Generates a documentation dictionary from a single path (includes all files in directory, and subdirectories)
+    :param path: the path to the files to generate documentation from
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param symbols: the symbol index to add each module to as it is documented (see Symbols.SymbolIndex, None to not index them)
+    :param compact: If each module is stored in the compact doc model as it is documented (see DocModel.compact_doc)
+    :return: the documentation dictionary
+    """
+
+    # if no start dir is specified, set it to the provided path
+    if start_dir is None:
+        start_dir = path
+
+    # document each Python file in the dir and subdirs
+    return get_doc_from_files(find_python_files(path, walk_options), start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats, symbols, compact)
+
+
+@instrument_iter
+def iter_doc_from_files(files:List[str], start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False, io_stats:dict=None,
+                        symbols=None):
+    """
+    Generates the documentation of each file in a list of files, one module at a time
+    (the doc_to_* functions accept this generator in place of a doc dict, so the whole project is never held in memory)
+    :param files: the list of the files to generate documentation from
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param symbols: the symbol index to add each module to as it is documented (see Symbols.SymbolIndex, None to not index them),
+        each arguement's dotted type is documented by its name when it is used, so the type can be linked to its definition
+    :return: a generator of (dotted name, module doc) pairs
+    """
+
+    # iterate over the documentation of each file provided (in the order provided)
+    for val in parse_files(files, start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats, symbols is not None):
 
         # if no value is specifed, skip the file
         if val == {}:
             continue
 
-        # add the value to the final output
-        output.update(val)
+        # yield the module (indexing it first, so the index is complete once the last module has been yielded)
+        for name, mod in val.items():
+            if symbols is not None:
+                symbols.add_module(name, mod)
+            yield name, mod
 
-    # return the doc dict
-    return output
+    # keep the cache within its size limit
+    if cache_dir is not None:
+        prune_cache(cache_dir)
 
 
-def get_doc_from_dir(path:str, start_dir=None, ignore_no_docstr:bool=False):
+def iter_doc_from_dir(path:str, start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False, io_stats:dict=None, walk_options:dict=None,
+                      symbols=None):
     """
-    Generates a documentation dictionary from a single path (includes all files in directory, and subdirectories)
+    Generates the documentation of each file in a path (includes all files in directory, and subdirectories), one module at a time
+    (the doc_to_* functions accept this generator in place of a doc dict, so the whole project is never held in memory)
     :param path: the path to the files to generate documentation from
     :param start_dir: the relative path to start each file's display name (in dot notation)
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
-    :return: the documentation dictionary
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param symbols: the symbol index to add each module to as it is documented (see Symbols.SymbolIndex, None to not index them)
+    :return: a generator of (dotted name, module doc) pairs
     """
 
     # if no start dir is specified, set it to the provided path
     if start_dir is None:
         start_dir = path
 
-    output = {}
+    # document each Python file in the dir and subdirs
+    return iter_doc_from_files(find_python_files(path, walk_options), start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats, symbols)
 
-    # iterate over each file in the dir and subdirs
-    for root, dirs, files in os.walk(path, topdown=False):
-        for name in files:
 
-            # ensure the file is a Python file (other files usualy cause errors)
-            if name.endswith(".py"):
+def parse_files(files:List[str], start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False, io_stats:dict=None,
+                dotted_types:bool=False):
+    """
+    Generates the documentation dictionary of each file, using a pool of processes if requested
+    The results are always yielded in the order of the provided files, so the output does not depend on the worker count
+    :param files: the list of the files to generate documentation from
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
+        (used to link the types to their definitions, see Symbols.SymbolIndex)
+    :return: a generator of the documentation dictionary of each file
+    """
 
-                # get a doc dict for the file
-                val = get_doc_from_file(os.path.join(root, name), start_dir, ignore_no_docstr)
+    # a value of 0 (or less) uses every core
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+
+    # parsing a single file (or using a single worker) does not benefit from a process pool
+    # the next batch of files is read on a background thread, while the current batch is parsed
+    if workers == 1 or len(files) < 2:
+        for f, source in prefetch_sources(files, stats=io_stats):
+            yield get_doc_from_file(f, start_dir, ignore_no_docstr, cache_dir, fast, source, dotted_types)
+
+        if io_stats is not None:
+            io_stats["total_time"] = time.perf_counter() - io_stats["start"]
+        return
+
+    def file_size(index):
+        """
+        gets the size of the file at the specified index (used to sort the files by size)
+        :param index: the index of the file in the file list
+        :return: the size of the file in bytes
+        """
+        try:
+            return os.path.getsize(files[index])
+        except OSError:
+            return 0
+
+    # each process reads its own files, so only the number of files and bytes are recorded
+    sizes = [file_size(i) for i in range(len(files))]
+    if io_stats is not None:
+        io_stats["files"] += len(files)
+        io_stats["bytes"] += sum(sizes)
+
+    # the hooks can not be called from the other processes, so their events are sent back with each result
+    collect = hooks_enabled()
+
+    # the process pool is only imported when it is used, as it is slow to import (most runs of the command line do not use it)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+
+        # submit the largest files first, so a few big files do not hold up the end of the run
+        futures = [None] * len(files)
+        for i in sorted(range(len(files)), key=sizes.__getitem__, reverse=True):
+            if collect:
+                futures[i] = pool.submit(collect_events, get_doc_from_file, files[i], start_dir, ignore_no_docstr, cache_dir, fast, None, dotted_types)
+            else:
+                futures[i] = pool.submit(get_doc_from_file, files[i], start_dir, ignore_no_docstr, cache_dir, fast, None, dotted_types)
+
+        # collect the results in the original order (this also re-raises any parsing errors in order)
+        for i in range(len(futures)):
+            result = futures[i].result()
+            if collect:
+                result, events = result
+                replay_events(events)
+
+            # release the result, so only the results which have not been written yet are kept in memory
+            futures[i] = None
+            yield result
+
+    if io_stats is not None:
+        io_stats["total_time"] = time.perf_counter() - io_stats["start"]
+
+
+def load_doc(path:str, workers:int=1, cache_dir:str=None, fast:bool=False, walk_options:dict=None):
+    """
+    Gets the documentation from a binary snapshot, a JSON file written by doc_to_json, or by documenting a directory
+    :param path: the snapshot, JSON file, or directory
+    :param workers: the number of processes to parse a directory's files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :return: the doc dict (or snapshot, which is read like a doc dict, see DocSnapshot)
+    """
 
-                # if no value is specifed, skip the file
-                if val == {}:
-                    continue
+    if os.path.isdir(path):
+        return get_doc_from_dir(path, workers=workers, cache_dir=cache_dir, fast=fast, walk_options=walk_options)
 
-                # add the value to the final output
-                output.update(val)
+    # a snapshot is read one module at a time, as each one is used
+    from Documenter.Snapshot import DocSnapshot, is_snapshot
+    if is_snapshot(path):
+        return DocSnapshot(path)
 
-    # return the doc dict
-    return output
+    import json
+    with open(path, 'r', encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except ValueError:
+            raise ValueError("{} Is Not A Snapshot, JSON File, Or Directory".format(path))
 # endregion
 
 
 # region Command Line Interface
 if __name__ == '__main__':
-    # the filetype and function call key value dict
-    output_types = {
-        "txt": doc_to_txt,
-        "json": doc_to_json,
-        "xml": doc_to_xml,
-        "mysql": doc_to_mysql,
-        "html": doc_to_html,
-        "sqlite": doc_to_sqlite,
-        "md": doc_to_md
-    }
+    # remove the options from the arguements, leaving only the positional arguements
+    args = sys.argv[1:]
+
+    # search a database (instead of documenting files)
+    if len(args) > 0 and args[0] == "search":
+        try:
+            limit = int(pop_cli_option(args, "--limit", SEARCH_LIMIT))
+        except ValueError as e:
+            print(e)
+            quit(-1)
+        raw = pop_cli_flag(args, "--raw")
+
+        if len(args) < 3:
+            print(HELP_TEXT)
+            quit(-1)
+
+        import sqlite3
+        from Documenter.Search import search_docs, format_results
+        try:
+            print(format_results(search_docs(args[1], " ".join(args[2:]), limit, raw)))
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(e)
+            quit(-1)
+        quit(0)
+
+    # compare two versions of the documentation (instead of documenting files)
+    if len(args) > 0 and args[0] == "diff":
+        as_json = pop_cli_flag(args, "--json")
+        public = pop_cli_flag(args, "--public")
+        diff_file = pop_cli_option(args, "--output")
+
+        if len(args) != 3:
+            print(HELP_TEXT)
+            quit(-1)
+
+        from Documenter.Diff import diff_docs, format_diff, diff_to_json
+        try:
+            # a directory skips the same directories as documenting it from the command line
+            walk_options = {"excludes": list(DEFAULT_EXCLUDES)}
+            changes = diff_docs(load_doc(args[1], walk_options=walk_options), load_doc(args[2], walk_options=walk_options), public)
+        except (OSError, ValueError) as e:
+            print(e)
+            quit(-1)
+
+        text = diff_to_json(changes) + "\n" if as_json else format_diff(changes)
+        if diff_file is None:
+            sys.stdout.write(text)
+        else:
+            with open(diff_file, 'w', encoding="utf-8") as f:
+                f.write(text)
+
+        # exit with a code of 1 if there are changes (the same as the diff command)
+        quit(1 if len(changes) > 0 else 0)
+
+    # merge the partial snapshots of each shard (instead of documenting files)
+    merge = len(args) > 0 and args[0] == "merge"
+    if merge:
+        del args[0]
+
+    try:
+        jobs = int(pop_cli_option(args, "--jobs", 1))      # the number of processes to parse with
+        cache_dir = pop_cli_option(args, "--cache-dir")     # the directory to cache parsed files in
+
+        # only document one shard of the files, and write it to a partial snapshot
+        shard = pop_cli_option(args, "--shard")
+        if shard is not None:
+            from Documenter.Shard import parse_shard
+            shard = parse_shard(shard)
+    except ValueError as e:
+        print(e)
+        quit(-1)
+
+    # the "--cache" flag uses the default cache directory
+    if pop_cli_flag(args, "--cache") and cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+
+    # use the fast extractor
+    fast = pop_cli_flag(args, "--fast")
+
+    # build a full text search index in the sqlitedb output, and only update the changed modules of an existing database
+    # (the options are bound to the writers when they are used, so only the selected outputs are imported)
+    search_index = pop_cli_flag(args, "--search-index")
+    incremental = pop_cli_flag(args, "--incremental")
+    writer_options = {}
+    if search_index or incremental:
+        writer_options["sqlitedb"] = {"search_index": search_index, "incremental": incremental}
+    if incremental:
+        writer_options["sqlite"] = {"incremental": True}
+        writer_options["mysql"] = {"incremental": True}
+
+    # indent the json output
+    try:
+        json_indent = pop_cli_option(args, "--json-indent")
+        if json_indent is not None:
+            writer_options["json"] = {"indent": int(json_indent)}
+    except ValueError as e:
+        print(e)
+        quit(-1)
+
+    # link the arguements' types to the modules, classes and functions which define them
+    # (the symbol index is filled as the files are parsed, so the writers only read it once every file has been parsed)
+    symbols = None
+    if pop_cli_flag(args, "--links"):
+        if incremental:
+            print("References Can Not Be Written In The Incremental Mode")
+            quit(-1)
+
+        from Documenter.Symbols import SymbolIndex
+        symbols = SymbolIndex()
+        for t in LINK_OUTPUT_TYPES:
+            writer_options.setdefault(t, {})["symbols"] = symbols
+
+    # print the I/O statistics once done
+    io_stats = new_io_stats() if pop_cli_flag(args, "--io-stats") else None
+
+    # the options of the directory walk
+    try:
+        walk_options = {
+            "includes": pop_cli_options(args, "--include") or None,
+            "excludes": pop_cli_options(args, "--exclude"),
+            "max_depth": pop_cli_option(args, "--max-depth"),
+            "max_file_size": pop_cli_option(args, "--max-file-size")
+        }
+        for key in ("max_depth", "max_file_size"):
+            if walk_options[key] is not None:
+                walk_options[key] = int(walk_options[key])
+    except ValueError as e:
+        print(e)
+        quit(-1)
+    walk_options["gitignore"] = pop_cli_flag(args, "--gitignore")
+    walk_options["follow_symlinks"] = pop_cli_flag(args, "--follow-symlinks")
+
+    # the default excludes are used as well as the specified ones, unless they are disabled
+    if not pop_cli_flag(args, "--no-default-excludes"):
+        walk_options["excludes"] = list(DEFAULT_EXCLUDES) + walk_options["excludes"]
+
+    # print the slowest files, and the time taken by each stage once done (or write them to a JSON file)
+    try:
+        stats_top = int(pop_cli_option(args, "--stats-top", 10))
+        stats_json = pop_cli_option(args, "--stats-json")
+    except ValueError as e:
+        print(e)
+        quit(-1)
+    stats = StatsCollector() if pop_cli_flag(args, "--stats") or stats_json is not None else None
+
+    # keep watching the input directory for changes after documenting it
+    watch = pop_cli_flag(args, "--watch")
+
+    # only parse the files which changed since a git revision (or are listed in a file), reading every other module from the
+    # documentation of a previous run (ex. a snapshot of the whole directory)
+    since = pop_cli_option(args, "--since")
+    files_from = pop_cli_option(args, "--files-from")
+    base_file = pop_cli_option(args, "--base")
+
+    # clear the cache if requested
+    if pop_cli_flag(args, "--clear-cache"):
+        clear_cache(cache_dir or DEFAULT_CACHE_DIR)
+
+        # clearing the cache does not require documenting anything
+        if len(args) == 0:
+            quit(0)
+
+    # a shard only has an input directory, and a partial snapshot file
+    if shard is not None:
+        if len(args) != 2 or merge or watch:
+            print(HELP_TEXT)
+            quit(-1)
+        if not os.path.isdir(args[0]):
+            print("Sharding Requires A Directory")
+            quit(-1)
+        args = ["", args[0], args[1]]
+
+    # the partial snapshots to merge are between the file type and the output file
+    snapshots = None
+    if merge:
+        if len(args) < 3 or watch:
+            print(HELP_TEXT)
+            quit(-1)
+        snapshots = args[1:-1]
+        args = [args[0], "", args[-1]]
+
+    # the changed files are found in a single directory (and are not watched, sharded, or merged)
+    changes = since is not None or files_from is not None
+    if changes and (shard is not None or merge or watch):
+        print(HELP_TEXT)
+        quit(-1)
+    if since is not None and files_from is not None:
+        print("--since And --files-from Can Not Be Used Together")
+        quit(-1)
+    if base_file is not None and not changes:
+        print("--base Requires --since Or --files-from")
+        quit(-1)
 
     # if an insufficient number of args are specified, display help text, and exit with code -1
-    if len(sys.argv) < 4:
+    if len(args) < 3:
         print(HELP_TEXT)
         quit(-1)
 
     # get the arguemsnts
-    output_type = sys.argv[1].lower()   # display type (ex. html, txt, xml)
-    input_file = sys.argv[2]            # the input file/directory
-    output_file = sys.argv[3]           # the output file
+    output_type = args[0].lower()   # display type (ex. html, txt, xml)
+    input_file = args[1]            # the input file/directory
+    output_file = args[2]           # the output file
+
+    # the snapshot module is only imported when a snapshot may be read
+    if os.path.isfile(input_file) or base_file is not None:
+        from Documenter.Snapshot import DocSnapshot, is_snapshot
+
+    # several file types (and their output files) can be separated by commas, so the files are only parsed once
+    targets = list(zip(output_type.split(","), output_file.split(","))) if shard is None else []
+    if shard is None and len(output_type.split(",")) != len(output_file.split(",")):
+        print("Each File Type Requires An Output File")
+        quit(-1)
 
     # if an invalid output type is selected, alert the user, and provide a list of expected inputs
     # also exit with a code of -1
-    if output_type not in output_types.keys():
-        print("{} Is An Invalid File Type. Please Select One From The Following List:\n{}".format(output_type, ", ".join(output_types.keys())))
-        quit(-1)
+    for t, _ in targets:
+        if t not in OUTPUT_TYPES:
+            print("{} Is An Invalid File Type. Please Select One From The Following List:\n{}".format(t, ", ".join(OUTPUT_TYPES.keys())))
+            quit(-1)
 
-    doc_dict = {}
+    # only the selected outputs are imported
+    writers = {t: functools.partial(OUTPUT_TYPES[t], **writer_options[t]) if t in writer_options else OUTPUT_TYPES[t] for t, _ in targets}
 
-    # if path is directory, get doc from dir
-    if os.path.isdir(input_file):
-        doc_dict = get_doc_from_dir(input_file)
+    doc_dict = {}
 
-    # create the file
-    output_types[output_type](doc_dict, output_file)
+    # in watch mode, the output is updated each time a file changes (until interrupted)
+    if watch:
+        if not os.path.isdir(input_file):
+            print("Watch Mode Requires A Directory")
+            quit(-1)
+
+        def write_formats(doc):
+            """
+            writes each output (the symbol index is updated before each write, see Watch.watch_dir)
+            :param doc: the doc dict
+            """
+            doc_to_formats(doc, targets, writers)
+
+        from Documenter.Watch import watch_dir
+        watch_dir(input_file, write_formats, workers=jobs, cache_dir=cache_dir, fast=fast, walk_options=walk_options, symbols=symbols)
+        quit(0)
+
+    if stats is not None:
+        stats.start()
+
+    # document this shard's files, and write them to the partial snapshot
+    if shard is not None:
+        from Documenter.Shard import write_shard
+        write_shard(input_file, output_file, shard[0], shard[1], workers=jobs, cache_dir=cache_dir, fast=fast, io_stats=io_stats,
+                    walk_options=walk_options, dotted_types=symbols is not None)
+
+    else:
+        # read the modules of each shard, in the same order as documenting the directory on a single machine
+        if merge:
+            from Documenter.Shard import iter_merged_shards
+            try:
+                doc_dict = iter_merged_shards(snapshots)
+            except (OSError, ValueError) as e:
+                print(e)
+                quit(-1)
+
+        elif changes and not os.path.isdir(input_file):
+            print("Changed Files Mode Requires A Directory")
+            quit(-1)
+
+        # if path is a binary snapshot, read each module from it as it is written (instead of documenting files)
+        elif os.path.isfile(input_file) and is_snapshot(input_file):
+            try:
+                doc_dict = DocSnapshot(input_file)
+            except (OSError, ValueError) as e:
+                print(e)
+                quit(-1)
+
+        # if path is directory, get doc from dir
+        # (each module is written to the output file as soon as it is parsed, unless the types are linked)
+        elif os.path.isdir(input_file):
+            if changes:
+                from Documenter.Changes import git_changed_files, read_file_list, iter_doc_from_changes
+                try:
+                    changed, _ = git_changed_files(input_file, since) if since is not None else read_file_list(files_from)
+                    base = None
+                    if base_file is not None:
+                        # a snapshot keeps the modules as they were parsed (the json output writes tuples as lists)
+                        if not is_snapshot(base_file):
+                            raise ValueError("--base Requires A Snapshot (Written With The snapshot File Type)")
+                        base = DocSnapshot(base_file)
+                except (OSError, ValueError) as e:
+                    print(e)
+                    quit(-1)
+
+                doc_dict = iter_doc_from_changes(input_file, changed, base, workers=jobs, cache_dir=cache_dir, fast=fast, io_stats=io_stats,
+                                                 walk_options=walk_options, symbols=symbols)
+                if symbols is not None:
+                    doc_dict = dict(doc_dict)
+
+            elif symbols is not None:
+                doc_dict = get_doc_from_dir(input_file, workers=jobs, cache_dir=cache_dir, fast=fast, io_stats=io_stats, walk_options=walk_options,
+                                            symbols=symbols)
+            else:
+                doc_dict = iter_doc_from_dir(input_file, workers=jobs, cache_dir=cache_dir, fast=fast, io_stats=io_stats,
+                                             walk_options=walk_options)
+
+        # the modules read from snapshots are indexed before any are written (the merged shards are only read once, so they are kept)
+        if symbols is not None and not os.path.isdir(input_file):
+            if not hasattr(doc_dict, "items"):
+                doc_dict = dict(doc_dict)
+            symbols.add_doc(doc_dict)
+
+        # create the files
+        doc_to_formats(doc_dict, targets, writers)
+
+    # the statistics are printed to stderr, so they are not mixed into output written to stdout
+    if stats is not None:
+        stats.stop()
+        if stats_json is not None:
+            with open(stats_json, 'w') as f:
+                f.write(stats.to_json(stats_top))
+        else:
+            print(stats.report(stats_top), file=sys.stderr)
+    if io_stats is not None:
+        print(format_io_stats(io_stats), file=sys.stderr)
 # endregion
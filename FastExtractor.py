@@ -0,0 +1,240 @@
+import re
+
+# the parts of the source which affect where statements start and end (everything else is skipped by the regex engine)
+# strings are matched whole, so brackets, comments, and line breaks inside of them are ignored
+_STRUCTURE = re.compile(r"""
+    (?P<string>
+        '''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''
+      | \"\"\"[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*\"\"\"
+      | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+      | "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+    )
+  | (?P<comment>\#[^\n]*)
+  | (?P<open>[(\[{])
+  | (?P<close>[)\]}])
+  | (?P<continuation>\\\n)
+  | (?P<newline>\n)
+  | (?P<error>['"\\])
+""", re.VERBOSE | re.DOTALL)
+
+# the indentation at the start of a line
+_INDENT = re.compile(r"[ \t\f]*")
+
+# the statements which the skeleton keeps (everything else is replaced, or skipped)
+_KEYWORD = re.compile(r"(?:async[ \t]+)?def\b|class\b|@|(?:else|elif|except|finally)\b")
+
+# the number of spaces used for each level of the skeleton
+_TAB = "    "
+
+
+class AmbiguousSource(ValueError):
+    """
+    Raised when the fast extractor can not be sure it understands a file (the file is then parsed by the ast module)
+    """
+
+
+def logical_lines(source:str):
+    """
+    Splits Python source into its logical lines (a statement which spans several physical lines is one logical line)
+    Blank lines, and lines which only contain a comment are skipped
+    :param source: the Python source
+    :return: a list of (indentation, start offset, end offset) of each logical line
+    """
+
+    output = []
+    depth = 0
+    line_start = 0
+
+    def add_line(end):
+        """
+        adds the logical line which started at line_start, and ends at the specified offset
+        :param end: the end offset of the line
+        """
+        start = _INDENT.match(source, line_start).end()
+
+        # skip blank and comment lines
+        if start >= end or source[start] == "#":
+            return
+
+        indent = source[line_start:start]
+        if "\t" in indent or "\f" in indent:
+            raise AmbiguousSource("Tabs In Indentation")
+        output.append((len(indent), start, end))
+
+    for match in _STRUCTURE.finditer(source):
+        kind = match.lastgroup
+
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if depth < 0:
+                raise AmbiguousSource("Unbalanced Brackets")
+        elif kind == "newline":
+            # line breaks inside of brackets do not end the statement
+            if depth == 0:
+                add_line(match.start())
+                line_start = match.end()
+        elif kind == "error":
+            raise AmbiguousSource("Unterminated String")
+
+    if depth != 0:
+        raise AmbiguousSource("Unbalanced Brackets")
+
+    # the last line may not end with a line break
+    add_line(len(source))
+
+    return output
+
+
+def skeleton_source(source:str):
+    """
+    Generates the skeleton of Python source, which only contains the top level functions and classes,
+    their methods, and the first statement of each body (which is where the docstring is)
+    Parsing the skeleton with the ast module gives the same doc dict as parsing the full source
+    (the syntax of the skipped code is not checked, so a syntax error in a function body does not stop the file being documented)
+    :param source: the Python source
+    :return: the skeleton source
+    """
+
+    lines = logical_lines(source)
+    output = []
+
+    # the first statement of a file can not be indented
+    if len(lines) > 0 and lines[0][0] != 0:
+        raise AmbiguousSource("Unexpected Indentation")
+
+    def text(i):
+        """
+        gets the source of a logical line
+        :param i: the index of the line
+        :return: the line's source
+        """
+        return source[lines[i][1]:lines[i][2]]
+
+    def keyword(i):
+        """
+        gets the keyword which starts a logical line
+        :param i: the index of the line
+        :return: "def", "async", "class", "@", a clause keyword (ex. "else"), or None
+        """
+        match = _KEYWORD.match(source, lines[i][1])
+        if match is None:
+            return None
+        return match.group(0).split()[0]
+
+    def opens_block(i):
+        """
+        checks if a logical line starts an indented block
+        :param i: the index of the line
+        :return: if the next line is indented further
+        """
+        return i + 1 < len(lines) and lines[i + 1][0] > lines[i][0]
+
+    def end_of_block(i):
+        """
+        finds the end of the block which a logical line starts
+        :param i: the index of the line
+        :return: the index of the first line after the block
+        """
+        j = i + 1
+        while j < len(lines) and lines[j][0] > lines[i][0]:
+            j += 1
+        return j
+
+    def add_function(i, level):
+        """
+        adds a function's signature, and the first statement of its body
+        :param i: the index of the function's line
+        :param level: the nesting level of the function in the skeleton
+        :return: the index of the first line after the function
+        """
+        output.append(_TAB * level + text(i) + "\n")
+
+        # the body is on the same line as the signature
+        if not opens_block(i):
+            return i + 1
+
+        # only the first statement is needed (it is the docstring if it is a string)
+        # a compound statement (or decorated definition) can never be a docstring, so it is replaced with "pass"
+        if opens_block(i + 1) or keyword(i + 1) == "@":
+            output.append(_TAB * (level + 1) + "pass\n")
+        else:
+            output.append(_TAB * (level + 1) + text(i + 1) + "\n")
+
+        return end_of_block(i)
+
+    def add_class(i, level):
+        """
+        adds a class's signature, its first statement, and its methods
+        :param i: the index of the class's line
+        :param level: the nesting level of the class in the skeleton
+        :return: the index of the first line after the class
+        """
+        output.append(_TAB * level + text(i) + "\n")
+
+        # the body is on the same line as the signature
+        if not opens_block(i):
+            return i + 1
+
+        end = end_of_block(i)
+        body_indent = lines[i + 1][0]
+        first = True
+
+        j = i + 1
+        while j < end:
+            indent = lines[j][0]
+
+            # skip the contents of each statement in the body
+            if indent > body_indent:
+                j += 1
+                continue
+
+            # a dedent which does not match an outer level is an indentation error
+            if indent < body_indent:
+                raise AmbiguousSource("Inconsistent Indentation")
+
+            kind = keyword(j)
+
+            # decorators belong to the next statement, and clauses (ex. else) belong to the previous statement
+            if kind in ("@", "else", "elif", "except", "finally"):
+                j += 1
+                continue
+
+            if kind in ("def", "async"):
+                j = add_function(j, level + 1)
+            elif kind == "class":
+                # nested classes are only needed for their name
+                output.append(_TAB * (level + 1) + text(j) + "\n")
+                if opens_block(j):
+                    output.append(_TAB * (level + 2) + "pass\n")
+                j += 1
+            elif first and not opens_block(j):
+                # the first statement may be the docstring
+                output.append(_TAB * (level + 1) + text(j) + "\n")
+                j += 1
+            else:
+                # other statements are only kept as placeholders (so the order of the methods in the body is the same)
+                output.append(_TAB * (level + 1) + "pass\n")
+                j += 1
+
+            first = False
+
+        return end
+
+    # iterate over each top level statement
+    i = 0
+    while i < len(lines):
+        if lines[i][0] != 0:
+            i += 1
+            continue
+
+        kind = keyword(i)
+        if kind == "def":
+            i = add_function(i, 0)
+        elif kind == "class":
+            i = add_class(i, 0)
+        else:
+            i += 1
+
+    return "".join(output)
@@ -1,6 +1,104 @@
+import os
+
 MISSING_DOCSTRING_MESSAGE = "N/A"
 
+# the version of the doc dict extraction (change this when the output of Py2Dict changes, to invalidate the parse cache)
+EXTRACTOR_VERSION = 1
+
+# the default location, and maximum size (in bytes) of the parse cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "Documenter")
+CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# the number of rows inserted in each transaction when writing directly to a SQLite3 database
+SQLITE_BATCH_SIZE = 50000
+
+# the maximum number of rows, and size in bytes of each INSERT statement in the files of SQL commands
+# (MySQL rejects statements larger than its max_allowed_packet setting, which is 4MB by default in older versions)
+SQL_INSERT_MAX_ROWS = 1000
+SQL_INSERT_MAX_BYTES = 1024 * 1024
+
+# the number of seconds between each check for changes in watch mode, and the time to wait for a burst of saves to end
+WATCH_INTERVAL = 0.5
+WATCH_DEBOUNCE = 0.2
+
+# the number of files read ahead of the parser
+PREFETCH_BATCH_SIZE = 64
+
+# the directories (and files) which the command line skips when documenting a directory, unless --no-default-excludes is used
+# (the API only skips them when they are passed in the walk options, ex. {"excludes": DEFAULT_EXCLUDES})
+# (version control, virtual environments, dependencies, build output, and caches)
+DEFAULT_EXCLUDES = (
+    ".git", ".hg", ".svn", ".venv", "venv", "node_modules", "build", "dist", "__pycache__",
+    ".tox", ".nox", ".eggs", "*.egg-info", ".mypy_cache", ".pytest_cache"
+)
+
+# the entry point group which other packages add output file types in (each entry point is the function which writes the output)
+OUTPUT_ENTRY_POINT_GROUP = "documenter.outputs"
+
+# the output file types which link each arguement's type to the module, class or function which defines it (see --links)
+LINK_OUTPUT_TYPES = ("html", "md", "htmlpages", "mdpages", "sqlite", "sqlitedb", "mysql", "mysqltsv")
+
+# the number of modules which can be waiting to be written by each output, when writing several file types at once
+MULTI_QUEUE_SIZE = 64
+
+# the number of threads which write the pages of the sharded outputs (one page per module)
+PAGE_WRITERS = 8
+
+# the default number of results returned by a search
+SEARCH_LIMIT = 20
+
+# the size of the queues between the stages of the asyncio pipeline (and the number of files in it at once),
+# and the default number of files it reads at once
+ASYNC_QUEUE_SIZE = 64
+ASYNC_READERS = 4
+
 HELP_TEXT = """
 SYNTAX:
-    Documenter FILETYPE FILES... OUTPUT_FILE
+    Documenter FILETYPE FILES... OUTPUT_FILE [OPTIONS]
+    Documenter FILETYPE,FILETYPE... FILES... OUTPUT_FILE,OUTPUT_FILE... [OPTIONS]
+        (writes several file types from a single parse, ex. "txt,html,md src out.txt,out.html,out.md")
+    Documenter FILETYPE DOC_SNAPSHOT OUTPUT_FILE [OPTIONS]
+        (writes the modules of a file written with the snapshot file type, instead of documenting files)
+    Documenter search DATABASE QUERY... [--limit N] [--raw]
+        (searches a database written with the sqlitedb file type and --search-index)
+    Documenter diff OLD NEW [--json] [--public] [--output FILE]
+        (lists the modules, classes and functions which were added, removed, or changed between two versions,
+        each a snapshot, a JSON file written with the json file type, or a directory, and exits with 1 if there are changes)
+    Documenter DIRECTORY SNAPSHOT_FILE --shard I/N [OPTIONS]
+        (documents the I-th of N parts of the files, and writes them to a partial snapshot for the merge command)
+    Documenter merge FILETYPE SNAPSHOT_FILE... OUTPUT_FILE [OPTIONS]
+        (combines the partial snapshots of every shard, the output is the same as documenting the directory at once)
+    Documenter FILETYPE DIRECTORY OUTPUT_FILE --since REV --base DOC_SNAPSHOT [OPTIONS]
+        (only parses the files which changed since a git revision, reading every other module from a snapshot of the previous run)
+
+OPTIONS:
+    --jobs N            parse the files with N processes (0 uses every CPU core)
+    --shard I/N         only document the I-th of N parts of the files (the files are split by the hash of their path)
+    --cache-dir DIR     cache the parsed files in DIR, so unchanged files are not parsed again
+                        (the entries are pickled, so only use a directory which only trusted users can write to)
+    --cache             cache the parsed files in the default cache directory
+    --clear-cache       clear the cache directory before documenting
+    --fast              only parse the signatures and docstrings of each file (faster for large files)
+    --include GLOB      only document the files matching GLOB (can be specified more than once, "*.py" by default)
+    --exclude GLOB      skip the directories and files matching GLOB (can be specified more than once)
+    --no-default-excludes   do not skip version control, virtual environment, and build directories (ex. .git, venv, build)
+    --gitignore         skip the directories and files ignored by .gitignore files
+    --max-depth N       only descend N levels of subdirectories
+    --max-file-size N   skip files larger than N bytes
+    --follow-symlinks   follow symbolic links to directories (each directory is only documented once)
+    --search-index      build a full text search index in the sqlitedb output (see the search command)
+    --json-indent N     indent the json output by N spaces
+    --incremental       update an existing database in the sqlitedb, sqlite and mysql outputs, only rewriting the changed modules
+    --links             link each arguement's type to the class or function which defines it in the html and md outputs,
+                        and write a references table in the SQL outputs (every file is parsed before the outputs are written)
+    --stats             print the slowest files, and the time taken by each stage once done
+    --stats-top N       the number of the slowest files to print (10 by default)
+    --stats-json FILE   write the statistics to FILE as JSON, instead of printing them
+    --io-stats          print the number of files and bytes read per second once done
+    --watch             keep running, and update the output whenever a Python file changes
+    --since REV         only parse the files which changed since REV in the local git repository (ex. main, HEAD~1),
+                        including uncommitted and untracked files, renames and deletions
+    --files-from FILE   only parse the files listed in FILE, one per line ("-" reads them from stdin), instead of using git
+    --base FILE         read every unchanged module from FILE (a snapshot of the previous run),
+                        without it only the changed files are documented
 """
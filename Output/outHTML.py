@@ -1,23 +1,19 @@
-from Documenter.Output.outTxt import dict2ascii
+from Documenter.Output.render import HTML_TEMPLATE, iter_rendered
+from Documenter.misc import write_output
+from Documenter.Stats import instrument_writer
 
 
-def doc_to_html(doc:dict, filename:str=None):
+@instrument_writer
+def doc_to_html(doc:dict, filename:str=None, symbols=None):
     """
     outputs the doc dict as an HTML file (as an ASCII tree format)
-    :param doc: the doc dict to write
-    :param filename: the output filename - leave blank to have value returned
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    :param symbols: the symbol index each arguement's type is linked with (see Symbols.SymbolIndex, None to not write links)
     """
 
-    # convert the dict to HTML, and write it to the file
-    output = dict2html(doc)
-
-    # if no output file is specified, return the value
-    if filename is None:
-        return output
-
-    tmp = open(filename, 'w')
-    tmp.write(output)
-    tmp.close()
+    # convert the dict to HTML, and write each module to the file as it is converted
+    return write_output(iter_html(doc, symbols), filename)
 
 
 def dict2html(mod_data:dict):
@@ -26,13 +22,21 @@ def dict2html(mod_data:dict):
     :param mod_data: the data to convert to HTML
     :return: the data in HTML format
     """
+    return "".join(iter_html(mod_data))
+
+
+def iter_html(mod_data, symbols=None):
+    """
+    this function generates the specified data as HTML, one module at a time
+    :param mod_data: the doc dict (or generator of (dotted name, module doc) pairs) to convert to HTML
+    :param symbols: the symbol index each arguement's type is linked with (see Symbols.SymbolIndex, None to not write links)
+    :return: a generator of HTML strings
+    """
 
-    # get an ASCII tree represenation of the doc dict
-    mod_data = dict2ascii(mod_data)
+    # the HTML data is placed between a pair of div tags
+    yield "<div>"
 
-    # convert each tab to 4 non-breaking space characters,
-    # and each end of line character to a line break tag (<br>)
-    mod_data = mod_data.replace("\t", "&nbsp;" * 4).replace("\n", "<br>")
+    # render each module's tree straight to HTML
+    yield from iter_rendered(mod_data, HTML_TEMPLATE, symbols)
 
-    # return the HTML data between a pair of div tags
-    return "<div>{}</div>".format(mod_data)
\ No newline at end of file
+    yield "</div>"
@@ -1,20 +1,198 @@
 import json
+import math
+import re
+from collections.abc import Mapping
 
+from Documenter.misc import iter_modules, write_output
+from Documenter.Stats import instrument_writer
 
-def doc_to_json(doc:dict, filename:str=None):
+# orjson is used for the NDJSON and indented outputs if it is installed, as it is much faster than the json module
+# (the default output is always written with the json module, so it does not depend on what is installed)
+# orjson writes some floats differently (ex. 1e16 rather than 1e+16, and null rather than NaN), does not support integers wider than 64 bits, and reads them as floats,
+# so the json module is used for the modules and lines which have them, and the output is the same with or without orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# a number too wide for orjson to read as an integer (a run of digits inside of a string is read with the json module as well)
+WIDE_NUMBER = re.compile(r"\d{19}")
+
+
+@instrument_writer
+def doc_to_json(doc:dict, filename:str=None, indent:int=None):
     """
     outputs the doc dict as a JSON file
-    :param doc: the doc dict to write
-    :param filename: the output filename - leave blank to have value returned
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    :param indent: the number of spaces to indent the JSON by (None to write it without line breaks)
+    """
+
+    # convert the dict to JSON, and write each module to the file as it is converted
+    if indent is not None:
+        return write_output(iter_indented_json(doc, indent), filename)
+    return write_output(iter_json(doc), filename)
+
+
+@instrument_writer
+def doc_to_ndjson(doc:dict, filename:str=None):
+    """
+    outputs the doc dict as a newline delimited JSON file, with each module on its own line (ex. {"name": "a.b", "module": {...}})
+    so the modules can be read one line at a time (see iter_ndjson)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    """
+
+    # convert each module to a line of JSON, and write it to the file as it is converted
+    return write_output((dumps_compact({"name": name, "module": mod}, plain_module(mod)) + "\n" for name, mod in iter_modules(doc)), filename)
+
+
+def iter_ndjson(filename):
+    """
+    Reads a newline delimited JSON file written by doc_to_ndjson, one module at a time
+    (the doc_to_* functions accept this generator in place of a doc dict)
+    :param filename: the filename, or an open file object
+    :return: a generator of (dotted name, module doc) pairs
+    """
+
+    f = open(filename, encoding="utf-8") if isinstance(filename, str) else filename
+    try:
+        for line in f:
+            if line.strip():
+                item = loads(line)
+                yield item["name"], item["module"]
+    finally:
+        if f is not filename:
+            f.close()
+
+
+def iter_json(doc):
+    """
+    generates the doc dict as a JSON object, one module at a time
+    (the output is the same as json.dumps on the whole doc dict)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to convert to JSON
+    :return: a generator of JSON strings
+    """
+
+    yield "{"
+
+    # add each module as a key of the JSON object
+    separator = ""
+    for name, mod in iter_modules(doc):
+        yield "{}{}: {}".format(separator, json.dumps(name), json.dumps(mod, default=json_default))
+        separator = ", "
+
+    yield "}"
+
+
+def iter_indented_json(doc, indent:int=2):
     """
+    generates the doc dict as an indented JSON object, one module at a time
+    (the output is the same as json.dumps on the whole doc dict, with ensure_ascii=False)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to convert to JSON
+    :param indent: the number of spaces to indent by
+    :return: a generator of JSON strings
+    """
+
+    # each module is indented one level further, as it is inside of the doc dict
+    padding = " " * indent
+    separator = "{\n"
+    for name, mod in iter_modules(doc):
+        yield "{}{}{}: {}".format(separator, padding, dumps_indented(name, indent), dumps_indented(mod, indent, plain_module(mod)).replace("\n", "\n" + padding))
+        separator = ",\n"
+
+    # an empty doc dict has no line breaks
+    yield "{}" if separator == "{\n" else "\n}"
+
+
+def dumps_compact(obj, plain:bool=True):
+    """
+    converts an object to JSON without any spaces (with orjson if it is installed)
+    :param obj: the object to convert
+    :param plain: If orjson writes the object the same as the json module (see plain_module)
+    :return: the JSON text
+    """
+    if orjson is not None and plain:
+        try:
+            return orjson.dumps(obj, default=json_default).decode("utf-8")
+        except TypeError:
+            # ex. a string with a lone surrogate, which orjson does not write
+            pass
+    return json.dumps(obj, default=json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_indented(obj, indent:int, plain:bool=True):
+    """
+    converts an object to indented JSON (with orjson if it is installed, which only indents by 2 spaces)
+    :param obj: the object to convert
+    :param indent: the number of spaces to indent by
+    :param plain: If orjson writes the object the same as the json module (see plain_module)
+    :return: the JSON text
+    """
+    if orjson is not None and plain and indent == 2:
+        try:
+            return orjson.dumps(obj, default=json_default, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, default=json_default, ensure_ascii=False, indent=indent)
+
 
-    # convert the dict to JSON, and write it to the file
-    output = json.dumps(doc)
+def loads(text:str):
+    """
+    converts a line of JSON to an object (with orjson if it is installed, unless the line has a number too wide for it)
+    :param text: the JSON text
+    :return: the object
+    """
+    if orjson is not None and WIDE_NUMBER.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            # ex. NaN and Infinity, which the json module writes
+            pass
+    return json.loads(text)
+
+
+def plain_value(value):
+    """
+    checks if orjson writes a value the same as the json module (strings, booleans, None, integers which fit in 64 bits,
+    finite floats written without an exponent, and lists and mappings of them)
+    :param value: the value
+    :return: If the value is written the same
+    """
+    if value is None or isinstance(value, (str, bool)):
+        return True
+    if isinstance(value, int):
+        return -2 ** 63 <= value < 2 ** 64
+    if isinstance(value, float):
+        return math.isfinite(value) and "e" not in repr(value)
+    if isinstance(value, (list, tuple)):
+        return all(plain_value(v) for v in value)
+    if isinstance(value, Mapping):
+        return all(isinstance(k, str) and plain_value(v) for k, v in value.items())
+    return False
 
-    # if no output file is specified, return the value
-    if filename is None:
-        return output
 
-    tmp = open(filename, 'w')
-    tmp.write(output)
-    tmp.close()
\ No newline at end of file
+def plain_module(mod):
+    """
+    checks if orjson writes a module the same as the json module
+    (only the arguements' default values are checked, as everything else in a module is a string)
+    :param mod: the module's doc dict
+    :return: If the module is written the same
+    """
+    for functions in [mod["functions"]] + [c["func"] for c in mod["classes"].values()]:
+        for func in functions.values():
+            for a in func["args"]:
+                if not plain_value(a["value"]):
+                    return False
+    return True
+
+
+def json_default(obj):
+    """
+    converts the objects which the json module does not support (ex. the compact doc model's read-only mappings)
+    :param obj: the object to convert
+    :return: the JSON compatible object
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
@@ -0,0 +1,114 @@
+import queue
+import threading
+
+from Documenter.GlobalVariable import MULTI_QUEUE_SIZE, OUTPUT_ENTRY_POINT_GROUP
+from Documenter.Output.registry import OutputRegistry
+from Documenter.misc import iter_modules
+
+# the output file types, and the function which writes each one
+# (each output's module is only imported when it is used, and other packages can add file types with entry points)
+OUTPUT_TYPES = OutputRegistry({
+    "txt": ("Documenter.Output.outTxt", "doc_to_txt"),
+    "json": ("Documenter.Output.outJSON", "doc_to_json"),
+    "ndjson": ("Documenter.Output.outJSON", "doc_to_ndjson"),
+    "xml": ("Documenter.Output.outXML", "doc_to_xml"),
+    "mysql": ("Documenter.Output.outMySQL", "doc_to_mysql"),
+    "mysqltsv": ("Documenter.Output.outMySQL", "doc_to_mysql_tsv"),
+    "html": ("Documenter.Output.outHTML", "doc_to_html"),
+    "sqlite": ("Documenter.Output.outSQLite", "doc_to_sqlite"),
+    "sqlitedb": ("Documenter.Output.outSQLite", "doc_to_sqlite_db"),
+    "md": ("Documenter.Output.outMD", "doc_to_md"),
+    "htmlpages": ("Documenter.Output.outPages", "doc_to_html_pages"),
+    "mdpages": ("Documenter.Output.outPages", "doc_to_md_pages"),
+    "snapshot": ("Documenter.Snapshot", "doc_to_snapshot")
+}, OUTPUT_ENTRY_POINT_GROUP)
+
+# the item which marks the end of the modules in each writer's queue
+_END = object()
+
+
+def doc_to_formats(doc, targets, writers:dict=None):
+    """
+    outputs the doc dict in several file types at once, while only iterating over the doc dict once
+    (pass a generator, such as iter_doc_from_dir, to only parse each file once)
+    Each output is written on its own thread
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param targets: a list of (file type, filename) pairs (ex. [("txt", "out.txt"), ("html", "out.html")], see OUTPUT_TYPES)
+    :param writers: the file types, and the function which writes each one (None for OUTPUT_TYPES)
+    :return: the list of the value returned by each output (ex. the text of an output which has no filename)
+    """
+
+    if writers is None:
+        writers = OUTPUT_TYPES
+
+    for output_type, _ in targets:
+        if output_type not in writers:
+            raise ValueError("{} Is An Invalid File Type".format(output_type))
+
+    # a single output does not need to be shared
+    if len(targets) == 1:
+        return [writers[targets[0][0]](doc, targets[0][1])]
+
+    # import each output before any are started
+    functions = [writers[t] for t, _ in targets]
+
+    # ensure the doc dict is not a single module (the same as iter_ascii)
+    if hasattr(doc, "items") and "functions" in doc:
+        doc = {"some_unused_string": doc}
+
+    # each output reads the modules from its own queue (the queues are limited, so the modules are not all held in memory)
+    queues = [queue.Queue(maxsize=MULTI_QUEUE_SIZE) for _ in targets]
+    results = [None] * len(targets)
+    errors = [None] * len(targets)
+    finished = [False] * len(targets)
+
+    def read_queue(index):
+        """
+        generates the items of a writer's queue, until the end of the modules
+        :param index: the index of the output in the targets list
+        :return: a generator of the items
+        """
+        while True:
+            item = queues[index].get()
+            if item is _END:
+                finished[index] = True
+                return
+            yield item
+
+    def write(index):
+        """
+        writes an output from its queue (run on the output's thread)
+        :param index: the index of the output in the targets list
+        """
+        try:
+            results[index] = functions[index](read_queue(index), targets[index][1])
+        except BaseException as e:
+            errors[index] = e
+        finally:
+            # keep emptying the queue if the output stopped early, so the other outputs are not blocked by it
+            if not finished[index]:
+                for _ in read_queue(index):
+                    pass
+
+    threads = [threading.Thread(target=write, args=(i,), daemon=True) for i in range(len(targets))]
+    for t in threads:
+        t.start()
+
+    try:
+        # send each module to every output
+        for item in iter_modules(doc):
+            for q in queues:
+                q.put(item)
+    finally:
+        # end each output, even if generating the modules failed
+        for q in queues:
+            q.put(_END)
+        for t in threads:
+            t.join()
+
+    # raise the first error (the outputs which did not fail are still written)
+    for e in errors:
+        if e is not None:
+            raise e
+
+    return results
@@ -1,20 +1,197 @@
-def doc_to_mysql(doc:dict, filename:str=None):
+import os
+
+from Documenter.GlobalVariable import SQL_INSERT_MAX_ROWS, SQL_INSERT_MAX_BYTES
+from Documenter.Output.sqlCommon import SQL_TABLES, SQL_REFERENCE_TABLES, SQL_STAGE_TABLES, SQL_UPSERT_PREPARE, SQL_UPSERT_APPLY, iter_rows, \
+    sql_value, sql_literal, reference_values, iter_insert_statements, upsert_statements
+from Documenter.misc import write_output
+from Documenter.Stats import instrument_writer
+
+# the statement which creates the tables if they are not there
+MYSQL_TABLES_STATEMENT = """
+    CREATE TABLE IF NOT EXISTS `files` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT,
+        `name` VARCHAR(50) NULL DEFAULT NULL,
+        `hash` CHAR(64) NULL DEFAULT NULL,
+        PRIMARY KEY (`id`),
+        KEY `files_name` (`name`)
+    );
+    CREATE TABLE IF NOT EXISTS `classes` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT,
+        `fileId` INT(11) NOT NULL,
+        `name` VARCHAR(50) NOT NULL,
+        `docstring` LONGTEXT NULL,
+        PRIMARY KEY (`id`),
+        KEY `classes_fileId` (`fileId`)
+    );
+    CREATE TABLE IF NOT EXISTS `functions` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT,
+        `classId` INT(11) NULL DEFAULT NULL,
+        `fileId` INT(11) NOT NULL,
+        `name` VARCHAR(50) NOT NULL,
+        `docstring` LONGTEXT NULL,
+        PRIMARY KEY (`id`),
+        KEY `functions_fileId` (`fileId`),
+        KEY `functions_classId` (`classId`)
+    );
+    CREATE TABLE IF NOT EXISTS `args` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT,
+        `functionId` INT(11) NOT NULL,
+        `order` INT(11) NOT NULL,
+        `name` TEXT NOT NULL,
+        `type` VARCHAR(50) NULL DEFAULT NULL,
+        `value` VARCHAR(50) NULL DEFAULT NULL,
+        PRIMARY KEY (`id`),
+        KEY `args_functionId` (`functionId`)
+    );
+"""
+
+# the statement which drops the tables if they are there, and creates them
+# (the references of a previous run are dropped as well, as they would no longer match the tables)
+MYSQL_CREATE_STATEMENT = """
+    DROP TABLE IF EXISTS `files`;
+    DROP TABLE IF EXISTS `classes`;
+    DROP TABLE IF EXISTS `functions`;
+    DROP TABLE IF EXISTS `args`;
+    DROP TABLE IF EXISTS `references`;""" + MYSQL_TABLES_STATEMENT
+
+# the statement which creates the table of the references of each arguement's type, when the tables are written with a symbol index
+# (references is a keyword, so the table's name is always quoted)
+MYSQL_REFERENCES_STATEMENT = """
+    CREATE TABLE `references` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT,
+        `argId` INT(11) NOT NULL,
+        `kind` VARCHAR(10) NOT NULL,
+        `symbol` VARCHAR(255) NOT NULL,
+        `fileId` INT(11) NOT NULL,
+        `classId` INT(11) NULL DEFAULT NULL,
+        `functionId` INT(11) NULL DEFAULT NULL,
+        PRIMARY KEY (`id`),
+        KEY `references_argId` (`argId`),
+        KEY `references_symbol` (`symbol`)
+    );
+"""
+
+# the temporary tables which the rows are loaded into in the incremental mode, before they are merged into the tables
+MYSQL_STAGE_STATEMENT = """
+    CREATE TEMPORARY TABLE `stage_files` (
+        `id` INT(11) NOT NULL, `name` VARCHAR(50) NULL, `hash` CHAR(64) NULL,
+        PRIMARY KEY (`id`), KEY (`name`)
+    );
+    CREATE TEMPORARY TABLE `stage_classes` (
+        `id` INT(11) NOT NULL, `fileId` INT(11) NOT NULL, `name` VARCHAR(50) NOT NULL, `docstring` LONGTEXT NULL,
+        PRIMARY KEY (`id`), KEY (`fileId`)
+    );
+    CREATE TEMPORARY TABLE `stage_functions` (
+        `id` INT(11) NOT NULL, `classId` INT(11) NULL, `fileId` INT(11) NOT NULL, `name` VARCHAR(50) NOT NULL, `docstring` LONGTEXT NULL,
+        PRIMARY KEY (`id`), KEY (`fileId`)
+    );
+    CREATE TEMPORARY TABLE `stage_args` (
+        `id` INT(11) NOT NULL AUTO_INCREMENT, `functionId` INT(11) NOT NULL, `order` INT(11) NOT NULL, `name` TEXT NOT NULL,
+        `type` VARCHAR(50) NULL, `value` VARCHAR(50) NULL,
+        PRIMARY KEY (`id`), KEY (`functionId`)
+    );
+"""
+
+# the statements which merge the temporary tables into the tables
+MYSQL_UPSERT_STATEMENTS = upsert_statements(SQL_UPSERT_PREPARE + SQL_UPSERT_APPLY, "TEMPORARY", "<=>") + [
+    "DROP TEMPORARY TABLE `{}`".format(table) for table in SQL_STAGE_TABLES
+]
+
+# the start of the INSERT statements used in the file of MySQL commands
+MYSQL_TEXT_INSERTS = {
+    "files": "INSERT INTO files (id, name, hash) VALUES ",
+    "classes": "INSERT INTO classes VALUES ",
+    "functions": "INSERT INTO functions VALUES ",
+    "args": "INSERT INTO args (`functionId`, `order`, `name`, `type`, `value`) VALUES ",
+    "references": "INSERT INTO `references` VALUES "
+}
+
+# the start of the INSERT statements which load the rows into the temporary tables in the incremental mode
+MYSQL_STAGE_TEXT_INSERTS = {
+    table: MYSQL_TEXT_INSERTS[table].replace(" {} ".format(table), " stage_{} ".format(table), 1) for table in SQL_TABLES
+}
+
+# the columns of each table, in the order they are written to the TSV files
+MYSQL_TSV_COLUMNS = {
+    "files": ("id", "name", "hash"),
+    "classes": ("id", "fileId", "name", "docstring"),
+    "functions": ("id", "classId", "fileId", "name", "docstring"),
+    "args": ("id", "functionId", "order", "name", "type", "value"),
+    "references": ("id", "argId", "kind", "symbol", "fileId", "classId", "functionId")
+}
+
+# the characters escaped in the TSV files (the defaults of LOAD DATA's "FIELDS ESCAPED BY '\\'")
+MYSQL_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+@instrument_writer
+def doc_to_mysql(doc:dict, filename:str=None, max_rows:int=SQL_INSERT_MAX_ROWS, max_bytes:int=SQL_INSERT_MAX_BYTES, incremental:bool=False,
+                 symbols=None):
     """
     outputs the doc dict as a file of MySQL Commands
-    :param doc: the doc dict to write
-    :param filename: the output filename - leave blank to have value returned
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    :param max_rows: the maximum number of rows in each INSERT statement
+    :param max_bytes: the maximum size of each INSERT statement in bytes (keep this below the server's max_allowed_packet)
+    :param incremental: If the commands update the tables of an existing database, rather than replacing them (see iter_mysql)
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
     """
 
-    # convert the dict to MySQL commands, and write it to the file
-    output = dict2mysql(doc)
+    # convert the dict to MySQL commands, and write each module's commands to the file as they are generated
+    return write_output(iter_mysql(doc, max_rows, max_bytes, incremental, symbols), filename)
 
-    # if no output file is specified, return the value
-    if filename is None:
-        return output
 
-    tmp = open(filename, 'w')
-    tmp.write(output)
-    tmp.close()
+@instrument_writer
+def doc_to_mysql_tsv(doc:dict, directory:str, symbols=None):
+    """
+    outputs the doc dict as a TSV file for each table, and a file of MySQL commands (load.sql) which loads them
+    with LOAD DATA LOCAL INFILE (much faster than running INSERT statements)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param directory: the directory to write the files to
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    tables = SQL_TABLES if symbols is None else SQL_REFERENCE_TABLES
+
+    # write the rows of each module to the table files as they are generated
+    files = {table: open(os.path.join(directory, table + ".tsv"), 'w', encoding="utf-8", newline="\n") for table in tables}
+    try:
+        for rows in iter_rows(doc, symbols):
+            for table, values in rows.items():
+                out = files[table]
+                for row in values:
+                    out.write("\t".join(tsv_value(v) for v in row) + "\n")
+    finally:
+        for f in files.values():
+            f.close()
+
+    # write the commands which create the tables, and load the files
+    with open(os.path.join(directory, "load.sql"), 'w') as f:
+        f.write(MYSQL_CREATE_STATEMENT if symbols is None else MYSQL_CREATE_STATEMENT + MYSQL_REFERENCES_STATEMENT)
+        for table in tables:
+            path = os.path.abspath(os.path.join(directory, table + ".tsv")).replace("\\", "/").replace("'", "\\'")
+            f.write(
+                "LOAD DATA LOCAL INFILE '{}' INTO TABLE `{}` CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({});\n".format(
+                    path, table, ", ".join("`{}`".format(c) for c in MYSQL_TSV_COLUMNS[table])
+                )
+            )
+
+
+def tsv_value(value):
+    """
+    converts a value to its text in a TSV file loaded by LOAD DATA
+    :param value: the value to convert
+    :return: the escaped text of the value
+    """
+
+    # null is written as \N
+    value = sql_value(value)
+    if value is None:
+        return "\\N"
+
+    return str(value).translate(MYSQL_TSV_ESCAPES)
 
 
 def dict2mysql(mod_data: dict):
@@ -23,200 +200,67 @@ def dict2mysql(mod_data: dict):
     :param mod_data: the data to convert to a file of MySQL commands
     :return: the data in MySQL command format
     """
+    return "".join(iter_mysql(mod_data))
 
-    # generate the create statement, and drop tables if they are there
-    create_statement = """
-        DROP TABLE IF EXISTS `files`;
-        DROP TABLE IF EXISTS `classes`;
-        DROP TABLE IF EXISTS `functions`;
-        DROP TABLE IF EXISTS `args`;
-        CREATE TABLE `files` (
-            `id` INT(11) NOT NULL AUTO_INCREMENT,
-            `name` VARCHAR(50) NULL DEFAULT NULL,
-            PRIMARY KEY (`id`)
-        );
-        CREATE TABLE `classes` (
-            `id` INT(11) NOT NULL AUTO_INCREMENT,
-            `fileId` INT(11) NOT NULL,
-            `name` VARCHAR(50) NOT NULL,
-            `docstring` LONGTEXT NULL,
-            PRIMARY KEY (`id`)
-        );
-        CREATE TABLE `functions` (
-            `id` INT(11) NOT NULL AUTO_INCREMENT,
-            `classId` INT(11) NULL DEFAULT NULL,
-            `fileId` INT(11) NOT NULL,
-            `name` VARCHAR(50) NOT NULL,
-            `docstring` LONGTEXT NULL,
-            PRIMARY KEY (`id`)
-        );
-        CREATE TABLE `args` (
-            `id` INT(11) NOT NULL AUTO_INCREMENT,
-            `functionId` INT(11) NOT NULL,
-            `order` INT(11) NOT NULL,
-            `name` TEXT NOT NULL,
-            `type` VARCHAR(50) NULL DEFAULT NULL,
-            `value` VARCHAR(50) NULL DEFAULT NULL,
-            PRIMARY KEY (`id`)
-        );
+
+def iter_mysql(mod_data, max_rows:int=SQL_INSERT_MAX_ROWS, max_bytes:int=SQL_INSERT_MAX_BYTES, incremental:bool=False, symbols=None):
     """
+    this function generates the specified data as MySQL commands, one module at a time
+    In the incremental mode, the commands update the tables of an existing database in a single transaction, rather than replacing them:
+    the rows are loaded into temporary tables, and only the rows of the modules which have changed (by the hash stored with each file)
+    or were removed are deleted and inserted again (tables written before the hash was stored must be replaced once,
+    and the references table is removed)
+    :param mod_data: the doc dict (or generator of (dotted name, module doc) pairs) to convert to MySQL commands
+    :param max_rows: the maximum number of rows in each INSERT statement
+    :param max_bytes: the maximum size of each INSERT statement in bytes
+    :param incremental: If the commands update the tables of an existing database
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
+    :return: a generator of MySQL command strings
+    """
+
+    if incremental and symbols is not None:
+        raise ValueError("References Can Not Be Written In The Incremental Mode")
 
-    sql = create_statement
-
-    # dictionaries to store the IDs of classes, functions and files
-    filenames = {}
-    functions = {}
-    classes = {}
-
-    # region File Names
-
-    # insert each file name with one command
-    sql += "INSERT INTO files (id, name) VALUES "
-    index = 1
-
-    # iterate over each file
-    for filename, data in mod_data.items():
-
-        # add to the SQL and dict
-        sql += "({}, '{}'), ".format(index, filename)
-        filenames[filename] = index
-        index += 1
-
-    # finish up the SQL statement
-    sql = sql[:-2] + ";\n"
-    # endregion
-
-    # region Write Functions
-    def insert_functions(func, fname, funcs, class_id=None):
-        """
-        this function adds the SQL commands for each function
-        :param func: the function objects
-        :param fname: the filename
-        :param funcs: the dictionary which stores the function names and IDs
-        :param class_id: the ID of the class which the function is in (None for not in a class)
-        :return: the function SQL commands
-        """
-
-        # if there are no functions, return an empty string
-        if len(func) == 0:
-            return ""
-
-        # if no class is specified, use null
-        if class_id is None:
-            class_id = "null"
-
-        # get the file ID
-        file_id = filenames[fname]
-
-        # get the initial ID of the function
-        try:
-            i = max(funcs.values()) + 1
-        except ValueError:
-            i = 1
-
-        # generate the start of the function and arguement query
-        query = "INSERT INTO functions VALUES "
-        args_sql = "INSERT INTO args (`functionId`, `order`, `name`, `type`, `value`) VALUES "
-
-        # iterate over each function
-        for name, d in func.items():
-
-            # add the ID to the function dict, with the key of filename.func_name
-            funcs["{}.{}".format(fname, name)] = i
-
-            # add the function and arg queries
-            query += "({}, {}, {}, '{}', '{}'), ".format(i, class_id, file_id, name, d['doc'])
-            args_sql += insert_args(d["args"], i)
-            i += 1
-
-        # return the func, and arg queries
-        return query[:-2] + ";\n" + args_sql[:-2] + ";\n"
-    # endregion
-
-    # region Arguements
-    def insert_args(args, function_id):
-        """
-        This function generates the SQL commands for each arguement
-        :param args: the list of args
-        :param function_id: the affiliated function ID
-        :return: the SQL string
-        """
-
-        statement = ""
-
-        # iterate over each arguement
-        order = 0
-        for a in args:
-
-            # if the arguement does not specify a value, set to null
-            if a['value'] is None:
-                val = 'null'
-            else:
-                # if the item is a number, do not surround with quotes
-                try:
-                    int(a['value'])
-                    val = a['value']
-                except (ValueError, TypeError):
-                    val = "'{}'".format(a['value'])
-
-            # add to the SQL statement
-            statement += "({}, {}, '{}', '{}', {}), ".format(function_id, order, a['name'], a['type'], val)
-            order += 1
-
-        # return the statement
-        return statement
-    # endregion
-
-    # region Class Writer
-    def insert_classes(c, fname, class_list):
-        """
-        this function generates the SQL for each class
-        :param c: the dict of classes
-        :param fname: the filename
-        :param class_list: the dict of class IDs
-        :return: the list of SQL statements for the class
-        """
-
-        # if there are no classes, return an empty string
-        if len(c) == 0:
-            return ""
-
-        statement = "INSERT INTO classes VALUES "
-
-        # get the initial class ID
-        try:
-            i = max(class_list.values()) + 1
-        except ValueError:
-            i = 1
-
-        # get the file ID
-        file_id = filenames[fname]
-
-        function_query = ""
-
-        # iterate over each class
-        for name, d in c.items():
-
-            # add to the SQL statement
-            func = d["func"]
-            doc = d["doc"]
-            statement += "({}, {}, '{}', '{}'), ".format(i, file_id, name, doc)
-
-            # add the ID to the dict in the format filename.class
-            class_list["{}.{}".format(fname, name)] = i
-            function_query += insert_functions(func, filename, functions, i)
-            i += 1
-
-        # finish off the statement, and return it
-        statement = statement[:-2] + ";\n" + function_query
-        return statement
-    # endregion
-
-    # iterate over each file in the doc dict
-    for filename, data in mod_data.items():
-        # add the function and class SQL to the main statement
-        sql += insert_functions(data["functions"], filename, functions)
-        sql += insert_classes(data["classes"], filename, classes)
-
-    # return the SQL statement
-    return sql
\ No newline at end of file
+    # generate the create statement, and drop tables if they are there
+    # (or create the tables if they are not there, and the temporary tables the rows are loaded into)
+    if incremental:
+        # the references table would no longer match the tables, it is dropped before the transaction (as dropping a table commits it)
+        yield MYSQL_TABLES_STATEMENT + "DROP TABLE IF EXISTS `references`;\nSTART TRANSACTION;\n" + MYSQL_STAGE_STATEMENT
+        inserts = MYSQL_STAGE_TEXT_INSERTS
+    elif symbols is not None:
+        yield MYSQL_CREATE_STATEMENT + MYSQL_REFERENCES_STATEMENT
+        inserts = MYSQL_TEXT_INSERTS
+    else:
+        yield MYSQL_CREATE_STATEMENT
+        inserts = MYSQL_TEXT_INSERTS
+
+    # iterate over the rows of each file in the doc dict
+    for rows in iter_rows(mod_data, symbols):
+
+        # convert each row to SQL
+        values = {
+            "files": ("({}, '{}', '{}')".format(i, name, digest) for i, name, digest in rows["files"]),
+            "classes": ("({}, {}, '{}', '{}')".format(i, file_id, name, doc) for i, file_id, name, doc in rows["classes"]),
+            "functions": (
+                "({}, {}, {}, '{}', '{}')".format(i, "null" if class_id is None else class_id, file_id, name, doc)
+                for i, class_id, file_id, name, doc in rows["functions"]
+            ),
+            "args": (
+                "({}, {}, '{}', '{}', {})".format(function_id, order, name, data_type, sql_literal(value))
+                for i, function_id, order, name, data_type, value in rows["args"]
+            ),
+            "references": reference_values(rows.get("references", ()))
+        }
+
+        # split the rows of each table into INSERT statements
+        sql = ""
+        for table in (SQL_TABLES if symbols is None else SQL_REFERENCE_TABLES):
+            for statement in iter_insert_statements(inserts[table], values[table], max_rows, max_bytes):
+                sql += statement
+
+        # return the module's SQL statements
+        yield sql
+
+    # merge the temporary tables into the tables
+    if incremental:
+        yield ";\n".join(MYSQL_UPSERT_STATEMENTS) + ";\nCOMMIT;\n"
@@ -0,0 +1,204 @@
+import hashlib
+import html
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from Documenter.GlobalVariable import PAGE_WRITERS
+from Documenter.Output.render import HTML_TEMPLATE, MD_TEMPLATE, TXT_TEMPLATE, render_module
+from Documenter.misc import iter_modules
+from Documenter.Stats import instrument_writer
+
+# the name of the manifest file, which lists each page and the hash of its contents
+MANIFEST_FILENAME = "manifest.json"
+
+# the name of the index page (without its file extension), which no module's page can use
+INDEX_NAME = "index"
+
+# the version of the manifest (change this when the pages change, so every page is written again)
+MANIFEST_VERSION = 1
+
+# the page types, their file extension, the template each module's page is rendered with, and the format of the page
+PAGE_TYPES = {
+    "html": (".html", HTML_TEMPLATE, "<div>{}</div>"),
+    "md": (".md", MD_TEMPLATE, "{}"),
+    "txt": (".txt", TXT_TEMPLATE, "{}")
+}
+
+
+@instrument_writer
+def doc_to_html_pages(doc:dict, directory:str, symbols=None):
+    """
+    outputs the doc dict as an HTML page for each module, and an index page (index.html) which links to each one
+    (see doc_to_pages)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param directory: the directory to write the pages to
+    :param symbols: the symbol index each arguement's type is linked with (see Symbols.SymbolIndex, None to not write links)
+    """
+    return doc_to_pages(doc, directory, "html", symbols=symbols)
+
+
+@instrument_writer
+def doc_to_md_pages(doc:dict, directory:str, symbols=None):
+    """
+    outputs the doc dict as a markdown page for each module, and an index page (index.md) which links to each one
+    (see doc_to_pages)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param directory: the directory to write the pages to
+    :param symbols: the symbol index each arguement's type is linked with (see Symbols.SymbolIndex, None to not write links)
+    """
+    return doc_to_pages(doc, directory, "md", symbols=symbols)
+
+
+def doc_to_pages(doc, directory:str, page_type:str="html", workers:int=PAGE_WRITERS, symbols=None):
+    """
+    outputs the doc dict as a page for each module, an index page, and a manifest (manifest.json) of the hash of each page
+    Pages whose contents have not changed since the last time they were written (according to the manifest) are not written again,
+    and the pages of modules which no longer exist are removed
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param directory: the directory to write the pages to (created if it does not exist)
+    :param page_type: the type of each page ("html", "md", or "txt")
+    :param workers: the number of threads to write the pages with
+    :param symbols: the symbol index each arguement's type is linked with (see Symbols.SymbolIndex, None to not write links),
+        each link is to the anchor on the page of the module which defines the symbol
+    :return: a dict of the number of pages "written", "unchanged", and "removed"
+    """
+
+    extension, template, page_format = PAGE_TYPES[page_type]
+
+    def href(symbol):
+        """
+        gets the location of a symbol's anchor on its module's page
+        :param symbol: the symbol (see Symbols.Symbol)
+        :return: the location
+        """
+        filename = page_filename(symbol.module, extension)
+        filename = html.escape(filename) if page_type == "html" else filename.replace(" ", "%20")
+        return filename + "#" + symbol.name
+
+    os.makedirs(directory, exist_ok=True)
+
+    # the hashes of the pages which were written last time (they are not used if the manifest was written by a different version)
+    previous = read_manifest(directory)
+    previous_pages = previous.get("pages", {})
+    if previous.get("version") != MANIFEST_VERSION or previous.get("type") != page_type:
+        previous_hashes = {}
+    else:
+        previous_hashes = previous_pages
+
+    pages = {}
+    output = {"written": 0, "unchanged": 0, "removed": 0}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = []
+
+        # render each page, and write the pages which have changed on the pool's threads
+        for name, mod in iter_modules(doc):
+            filename = page_filename(name, extension)
+            text = page_format.format(render_module(mod, template, name, symbols, href))
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            pages[name] = {"file": filename, "hash": digest}
+
+            old = previous_hashes.get(name)
+            if old is not None and old["hash"] == digest and old["file"] == filename and os.path.isfile(os.path.join(directory, filename)):
+                output["unchanged"] += 1
+                continue
+
+            pending.append(pool.submit(write_page, os.path.join(directory, filename), text))
+            output["written"] += 1
+
+            # only keep a few pages waiting to be written, so the rendered pages are not all held in memory
+            if len(pending) >= workers * 4:
+                pending.pop(0).result()
+
+        # wait for the remaining pages (this also raises any errors)
+        for f in pending:
+            f.result()
+
+    # remove the pages of modules which no longer exist (or were written as a different page type)
+    files = set(p["file"] for p in pages.values())
+    for page in previous_pages.values():
+        if page["file"] not in files:
+            try:
+                os.remove(os.path.join(directory, page["file"]))
+                output["removed"] += 1
+            except OSError:
+                pass
+
+    # the index is small, so it is always written
+    index = INDEX_NAME + extension
+    write_page(os.path.join(directory, index), render_index(pages, page_type))
+    if previous.get("index", index) != index and os.path.isfile(os.path.join(directory, previous["index"])):
+        os.remove(os.path.join(directory, previous["index"]))
+
+    # the manifest is written last, so an interrupted run writes every changed page again
+    write_page(os.path.join(directory, MANIFEST_FILENAME), json.dumps({
+        "version": MANIFEST_VERSION,
+        "type": page_type,
+        "index": index,
+        "pages": pages
+    }, indent=4))
+
+    return output
+
+
+def page_filename(name:str, extension:str):
+    """
+    gets the filename of a module's page
+    :param name: the module's dotted name
+    :param extension: the file extension of the page
+    :return: the filename
+    """
+
+    # path separators can not be used in the filename (the dotted name is already a valid filename otherwise)
+    name = name.replace("/", "_").replace("\\", "_")
+
+    # a module named like the index page (ignoring case, and any trailing underscores) is given another underscore,
+    # so it does not replace the index page, or the page of another module
+    if name.rstrip("_").lower() == INDEX_NAME:
+        name += "_"
+    return name + extension
+
+
+def render_index(pages:dict, page_type:str):
+    """
+    generates the index page, which links to the page of each module
+    :param pages: the dict of each module's dotted name, and its page (see doc_to_pages)
+    :param page_type: the type of the index page ("html", "md", or "txt")
+    :return: the index page
+    """
+
+    names = sorted(pages)
+
+    if page_type == "html":
+        return "<div><ul>{}</ul></div>".format("".join(
+            '<li><a href="{}">{}</a></li>'.format(html.escape(pages[n]["file"]), html.escape(n)) for n in names
+        ))
+    if page_type == "md":
+        return "".join("- [{}]({})\n".format(n, pages[n]["file"].replace(" ", "%20")) for n in names)
+    return "".join("{}\t{}\n".format(n, pages[n]["file"]) for n in names)
+
+
+def write_page(filename:str, text:str):
+    """
+    writes a page, replacing the previous page at once (so the page is never partly written)
+    :param filename: the page's filename
+    :param text: the page's contents
+    """
+    tmp = filename + ".tmp"
+    with open(tmp, 'w', encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, filename)
+
+
+def read_manifest(directory:str):
+    """
+    reads the manifest of a directory of pages
+    :param directory: the directory of pages
+    :return: the manifest (an empty dict if there is no manifest, or it can not be read)
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_FILENAME), 'r', encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
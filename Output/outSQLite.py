@@ -1,20 +1,345 @@
-def doc_to_sqlite(doc:dict, filename:str=None):
+import sqlite3
+
+from Documenter.GlobalVariable import SQLITE_BATCH_SIZE, SQL_INSERT_MAX_ROWS, SQL_INSERT_MAX_BYTES, MISSING_DOCSTRING_MESSAGE
+from Documenter.Output.sqlCommon import SQL_TABLES, SQL_REFERENCE_TABLES, SQL_STAGE_TABLES, SQL_UPSERT_PREPARE, SQL_UPSERT_APPLY, iter_rows, \
+    sql_value, sql_string, sql_literal, reference_values, iter_insert_statements, upsert_statements
+from Documenter.misc import write_output
+from Documenter.Stats import instrument_writer
+
+# the statement which creates the tables if they are not there
+SQLITE_TABLES_STATEMENT = """
+    CREATE TABLE IF NOT EXISTS `files` (
+        `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+        `name`	TEXT,
+        `hash`	TEXT
+    );
+    CREATE TABLE IF NOT EXISTS `classes` (
+        `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+        `fileId`	INTEGER NOT NULL,
+        `name`	TEXT,
+        `docstring`	TEXT
+    );
+    CREATE TABLE IF NOT EXISTS `functions` (
+        `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+        `classId`	INTEGER,
+        `fileId`	INTEGER NOT NULL,
+        `name`	TEXT NOT NULL,
+        `docstring`	TEXT
+    );
+    CREATE TABLE IF NOT EXISTS `args` (
+        `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+        `functionId`	INTEGER NOT NULL,
+        `order`	INTEGER NOT NULL,
+        `name`	TEXT NOT NULL,
+        `type`	TEXT,
+        `value`	TEXT
+    );
+"""
+
+# the statement which drops the tables if they are there, and creates them
+# (the references of a previous run are dropped as well, as they would no longer match the tables)
+SQLITE_CREATE_STATEMENT = """
+    DROP TABLE IF EXISTS `files`;
+    DROP TABLE IF EXISTS `classes`;
+    DROP TABLE IF EXISTS `functions`;
+    DROP TABLE IF EXISTS `args`;
+    DROP TABLE IF EXISTS `references`;""" + SQLITE_TABLES_STATEMENT
+
+# the statement which creates the table of the references of each arguement's type, when the tables are written with a symbol index
+# (references is a keyword, so the table's name is always quoted)
+SQLITE_REFERENCES_STATEMENT = """
+    CREATE TABLE `references` (
+        `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+        `argId`	INTEGER NOT NULL,
+        `kind`	TEXT NOT NULL,
+        `symbol`	TEXT NOT NULL,
+        `fileId`	INTEGER NOT NULL,
+        `classId`	INTEGER,
+        `functionId`	INTEGER
+    );
+"""
+
+# the statement used to insert the rows of each table
+SQLITE_INSERT_STATEMENTS = {
+    "files": "INSERT INTO `files` (`id`, `name`, `hash`) VALUES (?, ?, ?)",
+    "classes": "INSERT INTO `classes` (`id`, `fileId`, `name`, `docstring`) VALUES (?, ?, ?, ?)",
+    "functions": "INSERT INTO `functions` (`id`, `classId`, `fileId`, `name`, `docstring`) VALUES (?, ?, ?, ?, ?)",
+    "args": "INSERT INTO `args` (`id`, `functionId`, `order`, `name`, `type`, `value`) VALUES (?, ?, ?, ?, ?, ?)",
+    "references": "INSERT INTO `references` (`id`, `argId`, `kind`, `symbol`, `fileId`, `classId`, `functionId`) VALUES (?, ?, ?, ?, ?, ?, ?)"
+}
+
+# the start of the INSERT statements used in the file of SQLite3 commands
+SQLITE_TEXT_INSERTS = {
+    "files": "INSERT INTO files (id, name, hash) VALUES ",
+    "classes": "INSERT INTO classes VALUES ",
+    "functions": "INSERT INTO functions VALUES ",
+    "args": "INSERT INTO args (`functionId`, `order`, `name`, `type`, `value`) VALUES ",
+    "references": "INSERT INTO `references` VALUES "
+}
+
+# the indexes created after the data is loaded into a database (building them once is faster than updating them per row)
+SQLITE_INDEX_STATEMENT = """
+    CREATE INDEX IF NOT EXISTS `files_name` ON `files` (`name`);
+    CREATE INDEX IF NOT EXISTS `classes_fileId` ON `classes` (`fileId`);
+    CREATE INDEX IF NOT EXISTS `functions_fileId` ON `functions` (`fileId`);
+    CREATE INDEX IF NOT EXISTS `functions_classId` ON `functions` (`classId`);
+    CREATE INDEX IF NOT EXISTS `args_functionId` ON `args` (`functionId`);
+"""
+SQLITE_REFERENCES_INDEX_STATEMENT = """
+    CREATE INDEX IF NOT EXISTS `references_argId` ON `references` (`argId`);
+    CREATE INDEX IF NOT EXISTS `references_symbol` ON `references` (`symbol`);
+"""
+
+# stops the incremental file of SQLite3 commands before it changes anything, if the files table was written before the hash was stored
+# (a column can not be added only if it is missing in a script, so those tables must be replaced once, or updated by doc_to_sqlite_db)
+SQLITE_HASH_CHECK_STATEMENT = """
+    SELECT `hash` FROM `files` LIMIT 0;
+"""
+
+# the temporary tables which the rows are loaded into in the incremental mode, before they are merged into the tables
+SQLITE_STAGE_STATEMENT = """
+    CREATE TEMP TABLE `stage_files` (`id` INTEGER PRIMARY KEY, `name` TEXT, `hash` TEXT);
+    CREATE INDEX `temp`.`stage_files_name` ON `stage_files` (`name`);
+    CREATE TEMP TABLE `stage_classes` (`id` INTEGER PRIMARY KEY, `fileId` INTEGER, `name` TEXT, `docstring` TEXT);
+    CREATE TEMP TABLE `stage_functions` (`id` INTEGER PRIMARY KEY, `classId` INTEGER, `fileId` INTEGER, `name` TEXT, `docstring` TEXT);
+    CREATE TEMP TABLE `stage_args` (
+        `id` INTEGER PRIMARY KEY, `functionId` INTEGER, `order` INTEGER, `name` TEXT, `type` TEXT, `value` TEXT
+    );
+"""
+
+# the statements which load the rows into the temporary tables (the same as loading them into the tables)
+SQLITE_STAGE_INSERT_STATEMENTS = {
+    table: SQLITE_INSERT_STATEMENTS[table].replace("`{}`".format(table), "`stage_{}`".format(table), 1) for table in SQL_TABLES
+}
+SQLITE_STAGE_TEXT_INSERTS = {
+    table: SQLITE_TEXT_INSERTS[table].replace(" {} ".format(table), " stage_{} ".format(table), 1) for table in SQL_TABLES
+}
+
+# the statements which merge the temporary tables into the tables
+SQLITE_UPSERT_PREPARE = upsert_statements(SQL_UPSERT_PREPARE, "TEMP", "IS")
+SQLITE_UPSERT_APPLY = upsert_statements(SQL_UPSERT_APPLY, "TEMP", "IS")
+SQLITE_STAGE_DROP = ["DROP TABLE `temp`.`{}`".format(table) for table in SQL_STAGE_TABLES]
+
+# the full text search index of the module, class and function names and docstrings (built after the data is loaded)
+# the kind ("module", "class", or "function") and the id of the row it was built from are stored, but not searchable
+# (the rowid of each row is derived from the kind and id, so the rows of a module can be replaced in the incremental mode)
+SQLITE_SEARCH_CREATE = """
+    CREATE VIRTUAL TABLE `search` USING fts5(
+        `kind` UNINDEXED, `sourceId` UNINDEXED, `path`, `name`, `docstring`,
+        tokenize = 'unicode61'
+    )
+"""
+SQLITE_SEARCH_INSERTS = tuple(statement.replace("{{missing}}", MISSING_DOCSTRING_MESSAGE.replace("'", "''")) for statement in (
+    """INSERT INTO `search` (`rowid`, `kind`, `sourceId`, `path`, `name`, `docstring`)
+        SELECT `files`.`id` * 3, 'module', `files`.`id`, `files`.`name`, `files`.`name`, '' FROM `files` {where}""",
+    """INSERT INTO `search` (`rowid`, `kind`, `sourceId`, `path`, `name`, `docstring`)
+        SELECT `classes`.`id` * 3 + 1, 'class', `classes`.`id`, `files`.`name` || '.' || `classes`.`name`, `classes`.`name`,
+            NULLIF(`classes`.`docstring`, '{{missing}}')
+        FROM `classes` JOIN `files` ON `files`.`id` = `classes`.`fileId` {where}""",
+    """INSERT INTO `search` (`rowid`, `kind`, `sourceId`, `path`, `name`, `docstring`)
+        SELECT `functions`.`id` * 3 + 2, 'function', `functions`.`id`,
+            `files`.`name` || COALESCE('.' || `classes`.`name`, '') || '.' || `functions`.`name`, `functions`.`name`,
+            NULLIF(`functions`.`docstring`, '{{missing}}')
+        FROM `functions`
+            JOIN `files` ON `files`.`id` = `functions`.`fileId`
+            LEFT JOIN `classes` ON `classes`.`id` = `functions`.`classId` {where}"""
+))
+SQLITE_SEARCH_STATEMENT = "BEGIN;\n{};\n{};\nINSERT INTO `search` (`search`) VALUES ('optimize');\nCOMMIT;\n".format(
+    SQLITE_SEARCH_CREATE, ";\n".join(statement.format(where="") for statement in SQLITE_SEARCH_INSERTS)
+)
+
+# the statements which remove the search rows of the replaced files, and add the search rows of the written files (in the incremental mode)
+SQLITE_SEARCH_DELETES = (
+    "DELETE FROM `search` WHERE `rowid` IN (SELECT `id` * 3 FROM `stage_replaced`)",
+    "DELETE FROM `search` WHERE `rowid` IN (SELECT `id` * 3 + 1 FROM `classes` WHERE `fileId` IN (SELECT `id` FROM `stage_replaced`))",
+    "DELETE FROM `search` WHERE `rowid` IN (SELECT `id` * 3 + 2 FROM `functions` WHERE `fileId` IN (SELECT `id` FROM `stage_replaced`))"
+)
+SQLITE_SEARCH_UPSERTS = tuple(
+    statement.format(where="WHERE `files`.`id` IN (SELECT `fileId` FROM `stage_ids`)") for statement in SQLITE_SEARCH_INSERTS
+)
+
+
+@instrument_writer
+def doc_to_sqlite(doc:dict, filename:str=None, max_rows:int=SQL_INSERT_MAX_ROWS, max_bytes:int=SQL_INSERT_MAX_BYTES, incremental:bool=False,
+                  symbols=None):
     """
     outputs the doc dict as a file of SQLite3 Commands
-    :param doc: the doc dict to write
-    :param filename: the output filename - leave blank to have value returned
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    :param max_rows: the maximum number of rows in each INSERT statement
+    :param max_bytes: the maximum size of each INSERT statement in bytes
+    :param incremental: If the commands update the tables of an existing database, rather than replacing them
+        (the tables must have been written with the hash of each file, see iter_sqlite)
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
     """
 
-    # convert the dict to MySQL commands, and write it to the file
-    output = dict2sqlite(doc)
+    # convert the dict to SQLite3 commands, and write each module's commands to the file as they are generated
+    return write_output(iter_sqlite(doc, max_rows, max_bytes, incremental, symbols), filename)
 
-    # if no output file is specified, return the value
-    if filename is None:
-        return output
 
-    tmp = open(filename, 'w')
-    tmp.write(output)
-    tmp.close()
+@instrument_writer
+def doc_to_sqlite_db(doc:dict, filename:str, batch_size:int=SQLITE_BATCH_SIZE, search_index:bool=False, incremental:bool=False,
+                     symbols=None):
+    """
+    outputs the doc dict directly into a SQLite3 database file (replacing the tables if they are there)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the database filename
+    :param batch_size: the number of rows to insert in each transaction
+    :param search_index: If a full text search index (an FTS5 table named "search") is built, see Search.search_docs
+    :param incremental: If the tables of an existing database are updated in a single transaction, rather than replaced (see upsert_sqlite_db)
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
+    :return: the number of modules inserted, updated, unchanged, and removed (only in the incremental mode)
+    """
+
+    if incremental and symbols is not None:
+        raise ValueError("References Can Not Be Written In The Incremental Mode")
+
+    # the transactions are handled manually, so each batch of rows is inserted in a single transaction
+    conn = sqlite3.connect(filename, isolation_level=None)
+    try:
+        if incremental:
+            return upsert_sqlite_db(conn, doc, batch_size, search_index)
+
+        # the tables are rebuilt from scratch, so durability is traded for loading speed
+        conn.execute("PRAGMA journal_mode = MEMORY")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+
+        conn.executescript(SQLITE_CREATE_STATEMENT)
+        if symbols is not None:
+            conn.executescript(SQLITE_REFERENCES_STATEMENT)
+
+        # the search index of a previous run would no longer match the tables
+        conn.execute("DROP TABLE IF EXISTS `search`")
+
+        # the rows waiting to be inserted
+        pending = {table: [] for table in (SQL_TABLES if symbols is None else SQL_REFERENCE_TABLES)}
+        pending_count = 0
+
+        def flush():
+            """
+            inserts the pending rows in a single transaction
+            """
+            conn.execute("BEGIN")
+            for table, rows in pending.items():
+                if len(rows) > 0:
+                    conn.executemany(SQLITE_INSERT_STATEMENTS[table], rows)
+                    del rows[:]
+            conn.execute("COMMIT")
+
+        # add the rows of each module, and insert them once there is a full batch
+        for rows in iter_rows(doc, symbols):
+
+            # convert the default values of the arguements to the values stored
+            rows["args"] = [row[:5] + (sql_value(row[5]),) for row in rows["args"]]
+
+            for table, values in rows.items():
+                pending[table].extend(values)
+                pending_count += len(values)
+
+            if pending_count >= batch_size:
+                flush()
+                pending_count = 0
+
+        # insert the remaining rows, then build the indexes
+        flush()
+        conn.executescript(SQLITE_INDEX_STATEMENT)
+        if symbols is not None:
+            conn.executescript(SQLITE_REFERENCES_INDEX_STATEMENT)
+
+        # the search index is built from the loaded tables in a single transaction
+        if search_index:
+            conn.executescript(SQLITE_SEARCH_STATEMENT)
+    finally:
+        conn.close()
+
+
+def upsert_sqlite_db(conn, doc, batch_size:int=SQLITE_BATCH_SIZE, search_index:bool=False):
+    """
+    merges the doc dict into the tables of an existing SQLite3 database (the tables are created if they are not there)
+    Only the rows of the modules which have changed (by the hash stored with each file) or were removed are deleted and inserted again,
+    so the IDs of the rows of unchanged modules never change
+    Every change is made in a single transaction, so other connections see either the previous or the new documentation
+    The search index is kept up to date if the database has one, and the references table is removed (as it would no longer match the tables)
+    :param conn: the connection to the database (with isolation_level=None)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param batch_size: the number of rows to load into the temporary tables at once
+    :param search_index: If a full text search index is built, if the database does not have one
+    :return: a dict of the number of modules "inserted", "updated", "unchanged", and "removed"
+    """
+
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+
+    # databases written before the hash was stored are given the column (so each module is written again once)
+    conn.executescript(SQLITE_TABLES_STATEMENT)
+    if "hash" not in [column[1] for column in conn.execute("PRAGMA table_info(`files`)")]:
+        conn.execute("ALTER TABLE `files` ADD COLUMN `hash` TEXT")
+    conn.executescript(SQLITE_INDEX_STATEMENT)
+    conn.executescript(SQLITE_STAGE_STATEMENT)
+
+    has_search = conn.execute("SELECT COUNT(*) FROM `sqlite_master` WHERE `type` = 'table' AND `name` = 'search'").fetchone()[0] > 0
+
+    output = {"inserted": 0, "updated": 0, "unchanged": 0, "removed": 0}
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        stored = dict(conn.execute("SELECT `name`, `hash` FROM `files`"))
+        seen = set()
+
+        # the rows waiting to be loaded into the temporary tables
+        pending = {table: [] for table in SQL_TABLES}
+        pending_count = 0
+
+        def flush():
+            """
+            loads the pending rows into the temporary tables
+            """
+            for table, rows in pending.items():
+                if len(rows) > 0:
+                    conn.executemany(SQLITE_STAGE_INSERT_STATEMENTS[table], rows)
+                    del rows[:]
+
+        for rows in iter_rows(doc):
+            name, digest = rows["files"][0][1:]
+            seen.add(name)
+
+            # every file is loaded (so removed files can be found), but only the rows of changed files are
+            if name in stored and stored[name] == digest:
+                output["unchanged"] += 1
+                rows = {"files": rows["files"]}
+            else:
+                output["updated" if name in stored else "inserted"] += 1
+                rows["args"] = [row[:5] + (sql_value(row[5]),) for row in rows["args"]]
+
+            for table, values in rows.items():
+                pending[table].extend(values)
+                pending_count += len(values)
+
+            if pending_count >= batch_size:
+                flush()
+                pending_count = 0
+        flush()
+
+        output["removed"] = len(set(stored) - seen)
+
+        # merge the temporary tables into the tables (the search rows are replaced before the rows they were built from are removed)
+        statements = ["DROP TABLE IF EXISTS `references`"] + SQLITE_UPSERT_PREPARE + (list(SQLITE_SEARCH_DELETES) if has_search else []) + SQLITE_UPSERT_APPLY
+        statements += (list(SQLITE_SEARCH_UPSERTS) if has_search else []) + SQLITE_STAGE_DROP
+        for statement in statements:
+            conn.execute(statement)
+
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+    # a new search index is built from the updated tables
+    if search_index and not has_search:
+        conn.executescript(SQLITE_SEARCH_STATEMENT)
+
+    return output
 
 
 def dict2sqlite(mod_data: dict):
@@ -23,198 +348,70 @@ def dict2sqlite(mod_data: dict):
     :param mod_data: the data to convert to a file of SQLite3 commands
     :return: the data in SQLite3 command format
     """
+    return "".join(iter_sqlite(mod_data))
 
-    # generate the create statement, and drop tables if they are there
-    create_statement = """
-        DROP TABLE IF EXISTS `files`;
-        DROP TABLE IF EXISTS `classes`;
-        DROP TABLE IF EXISTS `functions`;
-        DROP TABLE IF EXISTS `args`;
-        CREATE TABLE `files` (
-            `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
-            `name`	TEXT
-        );
-        CREATE TABLE `classes` (
-            `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
-            `fileId`	INTEGER NOT NULL,
-            `name`	TEXT,
-            `docstring`	TEXT
-        );
-        CREATE TABLE `functions` (
-            `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
-            `classId`	INTEGER NOT NULL,
-            `fileId`	INTEGER NOT NULL,
-            `name`	TEXT NOT NULL,
-            `docstring`	TEXT
-        );
-        CREATE TABLE `args` (
-            `id`	INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
-            `functionId`	INTEGER NOT NULL,
-            `order`	INTEGER NOT NULL,
-            `name`	TEXT NOT NULL,
-            `type`	TEXT,
-            `value`	TEXT
-        );
+
+def iter_sqlite(mod_data, max_rows:int=SQL_INSERT_MAX_ROWS, max_bytes:int=SQL_INSERT_MAX_BYTES, incremental:bool=False, symbols=None):
+    """
+    this function generates the specified data as SQLite3 commands, one module at a time
+    In the incremental mode, the commands update the tables of an existing database in a single transaction, rather than replacing them:
+    the rows are loaded into temporary tables, and only the rows of the modules which have changed (by the hash stored with each file)
+    or were removed are deleted and inserted again (the search index is not updated, use doc_to_sqlite_db for that,
+    and the references table is removed)
+    Tables written before the hash was stored are not updated: the commands fail with "no such column: hash" before changing them
+    (run them with "sqlite3 -bail" so the remaining commands are not run), so replace the tables once, or update them with doc_to_sqlite_db
+    :param mod_data: the doc dict (or generator of (dotted name, module doc) pairs) to convert to SQLite3 commands
+    :param max_rows: the maximum number of rows in each INSERT statement
+    :param max_bytes: the maximum size of each INSERT statement in bytes
+    :param incremental: If the commands update the tables of an existing database
+    :param symbols: the symbol index the references table is written with (see Symbols.SymbolIndex, None to not write it)
+    :return: a generator of SQLite3 command strings
     """
 
-    sql = create_statement
-
-    # dictionaries to store the IDs of classes, functions and files
-    filenames = {}
-    functions = {}
-    classes = {}
-
-    # region File Names
-
-    # insert each file name with one command
-    sql += "INSERT INTO files (id, name) VALUES "
-    index = 1
-
-    # iterate over each file
-    for filename, data in mod_data.items():
-
-        # add to the SQL and dict
-        sql += "({}, '{}'), ".format(index, filename)
-        filenames[filename] = index
-        index += 1
-
-    # finish up the SQL statement
-    sql = sql[:-2] + ";\n"
-    # endregion
-
-    # region Write Functions
-    def insert_functions(func, fname, funcs, class_id=None):
-        """
-        this function adds the SQL commands for each function
-        :param func: the function objects
-        :param fname: the filename
-        :param funcs: the dictionary which stores the function names and IDs
-        :param class_id: the ID of the class which the function is in (None for not in a class)
-        :return: the function SQL commands
-        """
-
-        # if there are no functions, return an empty string
-        if len(func) == 0:
-            return ""
-
-        # if no class is specified, use null
-        if class_id is None:
-            class_id = "null"
-
-        # get the file ID
-        file_id = filenames[fname]
-
-        # get the initial ID of the function
-        try:
-            i = max(funcs.values()) + 1
-        except ValueError:
-            i = 1
-
-        # generate the start of the function and arguement query
-        query = "INSERT INTO functions VALUES "
-        args_sql = "INSERT INTO args (`functionId`, `order`, `name`, `type`, `value`) VALUES "
-
-        # iterate over each function
-        for name, d in func.items():
-
-            # add the ID to the function dict, with the key of filename.func_name
-            funcs["{}.{}".format(fname, name)] = i
-
-            # add the function and arg queries
-            query += "({}, {}, {}, '{}', \"{}\"), ".format(i, class_id, file_id, name, d['doc'].replace('"', "'"))
-            args_sql += insert_args(d["args"], i)
-            i += 1
-
-        # return the func, and arg queries
-        return query[:-2] + ";\n" + args_sql[:-2] + ";\n"
-    # endregion
-
-    # region Arguements
-    def insert_args(args, function_id):
-        """
-        This function generates the SQL commands for each arguement
-        :param args: the list of args
-        :param function_id: the affiliated function ID
-        :return: the SQL string
-        """
-
-        statement = ""
-
-        # iterate over each arguement
-        order = 0
-        for a in args:
-
-            # if the arguement does not specify a value, set to null
-            if a['value'] is None:
-                val = 'null'
-            else:
-                # if the item is a number, do not surround with quotes
-                try:
-                    int(a['value'])
-                    val = a['value']
-                except (ValueError, TypeError):
-                    val = "'{}'".format(a['value'])
-
-            # add to the SQL statement
-            if type(val) is bool:
-                val = int(val)
-            statement += "({}, {}, '{}', '{}', {}), ".format(function_id, order, a['name'], a['type'], val)
-            order += 1
-
-        # return the statement
-        return statement
-    # endregion
-
-    # region Class Writer
-    def insert_classes(c, fname, class_list):
-        """
-        this function generates the SQL for each class
-        :param c: the dict of classes
-        :param fname: the filename
-        :param class_list: the dict of class IDs
-        :return: the list of SQL statements for the class
-        """
-
-        # if there are no classes, return an empty string
-        if len(c) == 0:
-            return ""
-
-        statement = "INSERT INTO classes VALUES "
-
-        # get the initial class ID
-        try:
-            i = max(class_list.values()) + 1
-        except ValueError:
-            i = 1
-
-        # get the file ID
-        file_id = filenames[fname]
-
-        function_query = ""
-
-        # iterate over each class
-        for name, d in c.items():
-
-            # add to the SQL statement
-            func = d["func"]
-            doc = d["doc"]
-            statement += "({}, {}, '{}', '{}'), ".format(i, file_id, name, doc)
-
-            # add the ID to the dict in the format filename.class
-            class_list["{}.{}".format(fname, name)] = i
-            function_query += insert_functions(func, filename, functions, i)
-            i += 1
-
-        # finish off the statement, and return it
-        statement = statement[:-2] + ";\n" + function_query
-        return statement
-    # endregion
-
-    # iterate over each file in the doc dict
-    for filename, data in mod_data.items():
-        # add the function and class SQL to the main statement
-        sql += insert_functions(data["functions"], filename, functions)
-        sql += insert_classes(data["classes"], filename, classes)
-
-    # return the SQL statement
-    return sql
\ No newline at end of file
+    if incremental and symbols is not None:
+        raise ValueError("References Can Not Be Written In The Incremental Mode")
+
+    # generate the create statement, and drop tables if they are there
+    # (or create the tables if they are not there, and the temporary tables the rows are loaded into)
+    if incremental:
+        yield SQLITE_TABLES_STATEMENT + SQLITE_HASH_CHECK_STATEMENT + SQLITE_INDEX_STATEMENT + "BEGIN;\n" + SQLITE_STAGE_STATEMENT
+        inserts = SQLITE_STAGE_TEXT_INSERTS
+    elif symbols is not None:
+        yield SQLITE_CREATE_STATEMENT + SQLITE_REFERENCES_STATEMENT
+        inserts = SQLITE_TEXT_INSERTS
+    else:
+        yield SQLITE_CREATE_STATEMENT
+        inserts = SQLITE_TEXT_INSERTS
+
+    # iterate over the rows of each file in the doc dict
+    for rows in iter_rows(mod_data, symbols):
+
+        # convert each row to SQL
+        values = {
+            "files": ("({}, {}, '{}')".format(i, sql_string(name), digest) for i, name, digest in rows["files"]),
+            "classes": ("({}, {}, {}, {})".format(i, file_id, sql_string(name), sql_string(doc)) for i, file_id, name, doc in rows["classes"]),
+            "functions": (
+                "({}, {}, {}, '{}', \"{}\")".format(i, "null" if class_id is None else class_id, file_id, name, doc.replace('"', "'"))
+                for i, class_id, file_id, name, doc in rows["functions"]
+            ),
+            "args": (
+                "({}, {}, '{}', '{}', {})".format(function_id, order, name, data_type, sql_literal(value))
+                for i, function_id, order, name, data_type, value in rows["args"]
+            ),
+            "references": reference_values(rows.get("references", ()))
+        }
+
+        # split the rows of each table into INSERT statements
+        sql = ""
+        for table in (SQL_TABLES if symbols is None else SQL_REFERENCE_TABLES):
+            for statement in iter_insert_statements(inserts[table], values[table], max_rows, max_bytes):
+                sql += statement
+
+        # return the module's SQL statements
+        yield sql
+
+    # merge the temporary tables into the tables
+    if incremental:
+        yield ";\n".join(["DROP TABLE IF EXISTS `references`"] + SQLITE_UPSERT_PREPARE + SQLITE_UPSERT_APPLY + SQLITE_STAGE_DROP) + ";\nCOMMIT;\n"
+    elif symbols is not None:
+        yield SQLITE_REFERENCES_INDEX_STATEMENT
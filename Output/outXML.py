@@ -1,20 +1,17 @@
+from Documenter.misc import iter_modules, write_output
+from Documenter.Stats import instrument_writer
+
+
+@instrument_writer
 def doc_to_xml(doc:dict, filename:str=None):
     """
     outputs the doc dict as a XML file
-    :param doc: the doc dict to write
-    :param filename: the output filename - leave blank to have value returned
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open file object - leave blank to have value returned
     """
 
-    # convert the dict to XML, and write it to the file
-    output = dict2xml(doc)
-
-    # if no output file is specified, return the value
-    if filename is None:
-        return output
-
-    tmp = open(filename, 'w')
-    tmp.write(output)
-    tmp.close()
+    # convert the dict to XML, and write each module to the file as it is converted
+    return write_output(iter_xml(doc), filename)
 
 
 def dict2xml(data:dict):
@@ -23,86 +20,105 @@ def dict2xml(data:dict):
     :param data: the data to convert to XML
     :return: the data in XML format
     """
-    def get_function(xml_text, func_json, tab_level_adder=0):
-        """
-        this function converts a Python function to XML
-        :param xml_text: the current XML string
-        :param func_json: the JSON version of the function to convert
-        :param tab_level_adder: The number of extra tabs needed for the start of the XML
-        :return: 
-        """
+    return "".join(iter_xml(data))
 
-        # iterate over each function provided
-        for func, info in func_json["functions"].items():
 
-            # create the opening tag, which displays the function's name
-            xml_text += "\t" * (tab_level + tab_level_adder) + "<function name='{}'>\n".format(func)
+def iter_xml(data):
+    """
+    this function generates the specified data as XML, one module at a time
+    :param data: the doc dict (or generator of (dotted name, module doc) pairs) to convert to XML
+    :return: a generator of XML strings
+    """
 
-            # create the docstring tag
-            xml_text += "\t" * (tab_level + 1) + "<docstring>{}</docstring>\n".format(info["doc"])
+    # if this function is a single dict, put it in a parent dict
+    if hasattr(data, "items") and "functions" in data:
+        data = {"some_unused_string": data}
 
-            # add the arguement tags, which displays the function's name, type, and default value
-            for arg in info["args"]:
-                xml_text += "\t" * (tab_level + 1 + tab_level_adder) + "<arg name='{}' type='{}' value='{}'/>\n".format(arg['name'], arg['type'], arg['value'])
+    # create the XML shema line
+    yield "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<docs>\n"
 
-            # add the closing function tag
-            xml_text += "\t" * (tab_level + tab_level_adder) + "</function>\n"
+    # iterate over each module
+    for fname, d in iter_modules(data):
+        yield module2xml(fname, d)
 
-        # return the XML string
-        return xml_text
+    # finish up the XML
+    yield "</docs>"
 
-    def get_classes(xml_text, class_json):
-        """
-        This function converts each class to XML
-        :param xml_text: the full XML string
-        :param class_json: the JSON object we are working with
-        :return: the newly updated XML
-        """
 
-        # iterate over each class
-        for class_name, info in class_json["classes"].items():
+def module2xml(fname:str, d:dict, tab_level:int=1):
+    """
+    this function converts a single module to XML
+    :param fname: the module's name
+    :param d: the module's doc dict
+    :param tab_level: the number of tabs to place before the module tag
+    :return: the module in XML format
+    """
 
-            # create the opening tag, which contains the class name
-            xml_text += "\t" * tab_level + "<class name='{}'>\n".format(class_name)
+    # create the opening "module" tag, which contains the name
+    xml = "\t" * tab_level + "<module name='{}'>\n".format(fname)
 
-            # create the docstring tag
-            xml_text += "\t" * (tab_level + 1) +"<docstring>{}</docstring>\n".format(info["doc"])
+    # generate the functions and classes from the module
+    xml = get_classes(xml, d, tab_level + 1)
+    xml = get_function(xml, d, tab_level + 1)
 
-            # use the 'get_function' function to generate XML from the classes methods
-            xml_text = get_function(xml_text, {"functions": info["func"]}, 1)
+    # close the module tag
+    xml += "\t" * tab_level + "</module>\n"
+    return xml
 
-            # close the class tag
-            xml_text += "\t" * tab_level + "</class>\n"
 
-            # return the XML string
-        return xml_text
+def get_function(xml_text, func_json, tab_level, tab_level_adder=0):
+    """
+    this function converts a Python function to XML
+    :param xml_text: the current XML string
+    :param func_json: the JSON version of the function to convert
+    :param tab_level: The number of tabs needed for the start of the XML
+    :param tab_level_adder: The number of extra tabs needed for the start of the XML
+    :return: the newly updated XML
+    """
 
-    # if this function is a single dict, put it in a parent dict
-    if "functions" in data:
-        data = {"some_unused_string": data}
+    # iterate over each function provided
+    for func, info in func_json["functions"].items():
 
-    tab_level = 0
+        # create the opening tag, which displays the function's name
+        xml_text += "\t" * (tab_level + tab_level_adder) + "<function name='{}'>\n".format(func)
 
-    # create the XML shema line
-    xml = "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<docs>\n"
+        # create the docstring tag
+        xml_text += "\t" * (tab_level + 1) + "<docstring>{}</docstring>\n".format(info["doc"])
 
-    # iterate over each module
-    tab_level += 1
-    for fname, d in data.items():
+        # add the arguement tags, which displays the function's name, type, and default value
+        for arg in info["args"]:
+            xml_text += "\t" * (tab_level + 1 + tab_level_adder) + "<arg name='{}' type='{}' value='{}'/>\n".format(arg['name'], arg['type'], arg['value'])
+
+        # add the closing function tag
+        xml_text += "\t" * (tab_level + tab_level_adder) + "</function>\n"
+
+    # return the XML string
+    return xml_text
 
-        # create the opening "module" tag, which contains the name
-        xml += "\t" * tab_level + "<module name='{}'>\n".format(fname)
-        tab_level += 1
 
-        # generate the functions and classes from the module
-        xml = get_classes(xml, d)
-        xml = get_function(xml, d)
+def get_classes(xml_text, class_json, tab_level):
+    """
+    This function converts each class to XML
+    :param xml_text: the full XML string
+    :param class_json: the JSON object we are working with
+    :param tab_level: The number of tabs needed for the start of the XML
+    :return: the newly updated XML
+    """
 
-        tab_level -= 1
+    # iterate over each class
+    for class_name, info in class_json["classes"].items():
 
-        # close the module tag
-        xml += "\t" * tab_level + "</module>\n"
+        # create the opening tag, which contains the class name
+        xml_text += "\t" * tab_level + "<class name='{}'>\n".format(class_name)
 
-    # finish up the XML and return it
-    xml += "</docs>"
-    return xml
+        # create the docstring tag
+        xml_text += "\t" * (tab_level + 1) +"<docstring>{}</docstring>\n".format(info["doc"])
+
+        # use the 'get_function' function to generate XML from the classes methods
+        xml_text = get_function(xml_text, {"functions": info["func"]}, tab_level, 1)
+
+        # close the class tag
+        xml_text += "\t" * tab_level + "</class>\n"
+
+        # return the XML string
+    return xml_text
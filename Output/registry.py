@@ -0,0 +1,111 @@
+import importlib
+from collections.abc import Mapping
+
+
+def iter_entry_points(group:str):
+    """
+    Finds the entry points installed packages have registered in a group
+    (importlib.metadata was added in Python 3.8, the importlib_metadata package is used on older versions if it is installed)
+    :param group: the entry point group
+    :return: a list of the entry points (each has a name, and a load method)
+    """
+
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            return []
+
+    found = entry_points()
+
+    # newer versions return an object which is selected from, older ones return a dict of groups
+    if hasattr(found, "select"):
+        return list(found.select(group=group))
+    return list(found.get(group, []))
+
+
+def load_writer(target):
+    """
+    Imports the function which writes an output
+    :param target: the function, a (module name, function name) pair, a "module:function" string, or an entry point
+    :return: the function
+    """
+
+    if callable(target):
+        return target
+    if hasattr(target, "load"):
+        return target.load()
+    if isinstance(target, str):
+        target = target.split(":", 1)
+    module, name = target
+    return getattr(importlib.import_module(module), name)
+
+
+class OutputRegistry(Mapping):
+    """
+    The output file types, and the function which writes each one
+    Each function is only imported the first time its file type is used, so a run only imports the outputs it writes
+    The entry points installed packages have registered in the group are added the first time a file type
+    which is not already registered is looked up, or every file type is listed
+    """
+
+    def __init__(self, outputs:dict, group:str=None):
+        """
+        :param outputs: the file types, and the function (or (module name, function name) pair) which writes each one
+        :param group: the entry point group which other packages register file types in (None to not look for any)
+        """
+        self._targets = dict(outputs)
+        self._writers = {}
+        self._group = group
+
+    def register(self, output_type:str, target):
+        """
+        Adds a file type (or replaces the function which writes it)
+        :param output_type: the file type
+        :param target: the function, a (module name, function name) pair, or a "module:function" string
+        """
+        self._targets[output_type] = target
+        self._writers.pop(output_type, None)
+
+    def load_entry_points(self):
+        """
+        Adds the file types installed packages have registered (the registered file types are not replaced), once
+        """
+
+        if self._group is None:
+            return
+
+        for entry_point in iter_entry_points(self._group):
+            self._targets.setdefault(entry_point.name, entry_point)
+        self._group = None
+
+    def __getitem__(self, output_type:str):
+        if output_type in self._writers:
+            return self._writers[output_type]
+
+        if output_type not in self._targets:
+            self.load_entry_points()
+        if output_type not in self._targets:
+            raise KeyError(output_type)
+
+        writer = load_writer(self._targets[output_type])
+        self._writers[output_type] = writer
+        return writer
+
+    def __contains__(self, output_type):
+        if output_type not in self._targets:
+            self.load_entry_points()
+        return output_type in self._targets
+
+    def __iter__(self):
+        self.load_entry_points()
+        return iter(self._targets)
+
+    def __len__(self):
+        self.load_entry_points()
+        return len(self._targets)
+
+    def __repr__(self):
+        return "OutputRegistry({})".format(", ".join(self._targets))
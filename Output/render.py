@@ -0,0 +1,253 @@
+from Documenter.GlobalVariable import MISSING_DOCSTRING_MESSAGE
+from Documenter.misc import iter_modules
+
+# the deepest level of indentation the tree uses (a method's arguements)
+MAX_DEPTH = 8
+
+
+class Template:
+    """
+    The text which the ASCII tree based outputs (txt, html and md) are rendered with
+    The fixed parts of the tree (indentation, headings) are prepared once, so only the names, docstrings and arguements
+    of each module are escaped while it is rendered
+    """
+
+    __slots__ = ("tab", "newline", "anchor_format", "link_format", "plain", "indent", "empty", "classes", "methods", "functions",
+                 "arguements")
+
+    def __init__(self, tab:str="\t", newline:str="\n", anchor_format:str=None, link_format:str=None):
+        """
+        :param tab: the text each level of indentation is written as
+        :param newline: the text the end of each line is written as
+        :param anchor_format: the format of a name which can be linked to, with {id} and {text} (None to write names as is)
+        :param link_format: the format of a link to a name, with {href} and {text} (None to write linked text as is)
+        """
+        self.tab = tab
+        self.newline = newline
+        self.anchor_format = anchor_format
+        self.link_format = link_format
+
+        # the text needs no escaping if it is written as is
+        self.plain = tab == "\t" and newline == "\n"
+
+        self.indent = [tab * i for i in range(MAX_DEPTH + 1)]
+        self.empty = self.indent[1] + "This File Does Not Contain Any Functions Or Classes." + newline + newline
+        self.classes = self.indent[1] + "Classes:" + newline
+        self.methods = self.indent[3] + "Methods:" + newline
+        self.functions = self.indent[1] + "Functions:" + newline
+        self.arguements = "Arguements:" + newline
+
+    def escape(self, text:str):
+        """
+        Converts the tabs and line breaks in a part of the tree
+        :param text: the text
+        :return: the escaped text
+        """
+        if self.plain or ("\t" not in text and "\n" not in text):
+            return text
+        return text.replace("\t", self.tab).replace("\n", self.newline)
+
+    def anchor(self, anchor_id:str, text:str):
+        """
+        Marks a part of the tree, so it can be linked to
+        :param anchor_id: the id of the anchor (the symbol's full dotted name, see Symbols.Symbol)
+        :param text: the escaped text
+        :return: the text with its anchor
+        """
+        if self.anchor_format is None:
+            return text
+        return self.anchor_format.format(id=anchor_id, text=text)
+
+    def link(self, href:str, text:str):
+        """
+        Links a part of the tree to an anchor
+        :param href: the location of the anchor
+        :param text: the escaped text
+        :return: the linked text
+        """
+        if self.link_format is None:
+            return text
+        return self.link_format.format(href=href, text=text)
+
+
+# the text file's template (the ASCII tree as is)
+TXT_TEMPLATE = Template()
+
+# the HTML template (each tab is 4 non-breaking space characters, and each end of line is a line break tag)
+HTML_TEMPLATE = Template("&nbsp;" * 4, "<br>", '<a id="{id}">{text}</a>', '<a href="{href}">{text}</a>')
+
+# the markdown template (each tab is 4 non-breaking space characters, and each end of line is a blank line, so each line is a paragraph)
+MD_TEMPLATE = Template("&nbsp;" * 4, "\n\n", '<a id="{id}"></a>{text}', "[{text}]({href})")
+
+
+def symbol_href(symbol):
+    """
+    gets the location of a symbol's anchor in the same file (the default location of each link)
+    :param symbol: the symbol (see Symbols.Symbol)
+    :return: the location
+    """
+    return "#" + symbol.name
+
+
+def iter_rendered(mod_data, template:Template, symbols=None, href=symbol_href):
+    """
+    Renders the ASCII tree of each module in the specified data
+    :param mod_data: the doc dict (or generator of (dotted name, module doc) pairs) to render
+    :param template: the template to render with
+    :param symbols: the symbol index the arguements' types are linked with (see Symbols.SymbolIndex, None to not write links)
+    :param href: the function which gets the location of a symbol's anchor
+    :return: a generator of the rendered text of each module
+    """
+
+    # ensure the module is not a single module
+    if hasattr(mod_data, "items") and "functions" in mod_data:
+        mod_data = {"some_unused_string": mod_data}
+
+    for name, mod in iter_modules(mod_data):
+        yield render_module(mod, template, name, symbols, href)
+
+
+def render_module(mod:dict, template:Template, name:str=None, symbols=None, href=symbol_href):
+    """
+    Renders a single module's ASCII tree, walking the module once
+    With a symbol index, each module, class and function is written with an anchor, and each arguement's type which refers
+    to one of them is linked to it
+    :param mod: the module's doc dict
+    :param template: the template to render with
+    :param name: the module's dotted name (None for the module's file name)
+    :param symbols: the symbol index the arguements' types are linked with (see Symbols.SymbolIndex, None to not write links)
+    :param href: the function which gets the location of a symbol's anchor
+    :return: the rendered module
+    """
+
+    functions = mod["functions"]
+    classes = mod["classes"]
+    indent = template.indent
+    newline = template.newline
+    escape = template.escape
+
+    # the anchors are the full dotted names of each symbol
+    links = None
+    prefix = None
+    if symbols is not None:
+        module = mod["file"] if name is None else name
+        prefix = module + "."
+
+        def links(data_type):
+            """
+            gets the location of the symbol an arguement's type refers to
+            :param data_type: the arguement's type
+            :return: the location (None if the type does not refer to a symbol)
+            """
+            symbol = symbols.resolve(data_type, module)
+            return None if symbol is None else href(symbol)
+
+    # each part is added to a list, and joined once the module is done
+    if prefix is None:
+        parts = [escape(mod["file"]) + newline]
+    else:
+        parts = [template.anchor(module, escape(mod["file"])) + newline]
+    write = parts.append
+
+    # if the module has no functions, and no classes, output the "no functions or classes" message
+    if len(classes) < 1 and len(functions) < 1:
+        write(template.empty)
+
+    if len(classes) > 0:
+        write(template.classes)
+
+        for class_name, c in classes.items():
+            if prefix is None:
+                write(indent[2] + escape(class_name) + newline)
+            else:
+                write(indent[2] + template.anchor(prefix + class_name, escape(class_name)) + newline)
+
+            # add a docstring line if the class has a docstring
+            if c["doc"] != MISSING_DOCSTRING_MESSAGE:
+                doc = c["doc"].replace("\n\t", "\n").replace(":param ", "").replace(":return: ", "Returns ")
+                write(indent[3] + escape(doc) + newline)
+
+            # display the class's methods (apart from the private ones)
+            write(template.methods)
+            for n, f in c["func"].items():
+                if not n.startswith("__"):
+                    render_function(write, template, 4, n, f, None if prefix is None else prefix + class_name + "." + n, links)
+
+    if len(functions) > 0:
+        write(template.functions)
+        for n, f in functions.items():
+            render_function(write, template, 2, n, f, None if prefix is None else prefix + n, links)
+
+    return "".join(parts)
+
+
+def render_function(write, template:Template, tab_level:int, func_name:str, func:dict, anchor:str=None, links=None):
+    """
+    Renders a function's part of the ASCII tree
+    :param write: the function which each rendered part is passed to
+    :param template: the template to render with
+    :param tab_level: the function's level of indentation
+    :param func_name: the function's display name
+    :param func: the function as a dict
+    :param anchor: the id of the function's anchor (None to write the function without one)
+    :param links: the function which gets the location an arguement's type is linked to (None to not write links)
+    """
+
+    indent = template.indent
+    newline = template.newline
+    escape = template.escape
+    base_tab = indent[tab_level]
+    line_tab = indent[tab_level + 2]
+    doc = func["doc"]
+
+    if anchor is None:
+        write(base_tab + escape(func_name) + newline)
+    else:
+        write(base_tab + template.anchor(anchor, escape(func_name)) + newline)
+
+    # if the function has a docstring, add each of its lines (without their indentation)
+    if doc != MISSING_DOCSTRING_MESSAGE:
+        text = doc.replace("\t", "") if "\t" in doc else doc
+        described = ":param " in doc or ":return:" in doc
+
+        # the lines which describe the arguements are only found before their tabs are removed,
+        # so the whole docstring is converted at once, unless removing the tabs would make another line describe one
+        if described and (text.count(":param ") != doc.count(":param ") or text.count(":return:") != doc.count(":return:")):
+            for line in doc.split("\n"):
+                if ":param " in line or ":return:" in line:
+                    line = line.replace("\t", "").replace(":param ", "").replace(":return:", "Returns")
+                else:
+                    line = line.replace("\t", "")
+                write(line_tab + escape(line) + newline)
+        else:
+            if described:
+                text = text.replace(":param ", "").replace(":return:", "Returns")
+
+            # the docstring has no tabs left, so each of its line breaks is escaped and indented at once
+            write(line_tab + text.replace("\n", newline + line_tab) + newline)
+
+    # the arguements are only listed if the docstring does not describe them
+    args = func["args"]
+    if len(args) > 0 and not (":param " in doc or ":return:" in doc):
+        write(indent[tab_level + 1] + template.arguements)
+
+        for arg in args:
+            data_type = arg["type"]
+            location = None if links is None or data_type == "any" else links(data_type)
+
+            if location is None:
+                text = arg["name"]
+                if data_type != "any":
+                    text += " (" + data_type + ")"
+                if arg["value"] is not None:
+                    text += " = " + str(arg["value"])
+                write(line_tab + escape(text) + newline)
+                continue
+
+            # the linked type is escaped on its own, so the link is not escaped
+            text = escape(arg["name"]) + " (" + template.link(location, escape(data_type)) + ")"
+            if arg["value"] is not None:
+                text += escape(" = " + str(arg["value"]))
+            write(line_tab + text + newline)
+
+        write(newline)
@@ -0,0 +1,299 @@
+import hashlib
+import itertools
+
+from Documenter.GlobalVariable import SQL_INSERT_MAX_ROWS, SQL_INSERT_MAX_BYTES
+from Documenter.misc import iter_modules
+
+# the tables of the SQL outputs, in the order their rows are written
+SQL_TABLES = ("files", "classes", "functions", "args")
+
+# the tables of the SQL outputs which are written with a symbol index (the references of each arguement's type, see iter_rows)
+SQL_REFERENCE_TABLES = SQL_TABLES + ("references",)
+
+# the statements which merge the rows of the staging tables (the rows of every module, see iter_rows) into the tables of an
+# existing database, in the incremental mode of the SQL outputs
+# Only the rows of the modules whose hash has changed (or which were removed) are deleted and inserted again,
+# so the IDs of the rows of unchanged modules never change
+#     {temporary}: the keyword which creates a temporary table
+#     {same}: the operator which compares two values, where null is the same as null (SQLite's IS, MySQL's <=>)
+# the files which are written again (new, or changed), and the stored files which are replaced (changed, or removed)
+SQL_UPSERT_PREPARE = (
+    """CREATE {temporary} TABLE `stage_written` AS
+        SELECT `s`.`id` AS `stageId`, `s`.`name` AS `name` FROM `stage_files` `s` LEFT JOIN `files` `f` ON `f`.`name` = `s`.`name`
+        WHERE `f`.`id` IS NULL OR NOT (`f`.`hash` {same} `s`.`hash`)""",
+    """CREATE {temporary} TABLE `stage_replaced` AS
+        SELECT `f`.`id` AS `id` FROM `files` `f` LEFT JOIN `stage_files` `s` ON `s`.`name` = `f`.`name`
+        WHERE `s`.`id` IS NULL OR NOT (`f`.`hash` {same} `s`.`hash`)"""
+)
+
+# removes the rows of the replaced files (changed files keep their ID), and inserts the rows of the files which are written
+SQL_UPSERT_APPLY = (
+    """DELETE FROM `args` WHERE `functionId` IN (
+        SELECT `functions`.`id` FROM `functions` JOIN `stage_replaced` ON `stage_replaced`.`id` = `functions`.`fileId`
+    )""",
+    "DELETE FROM `functions` WHERE `fileId` IN (SELECT `id` FROM `stage_replaced`)",
+    "DELETE FROM `classes` WHERE `fileId` IN (SELECT `id` FROM `stage_replaced`)",
+    "DELETE FROM `files` WHERE `id` IN (SELECT `id` FROM `stage_replaced`) AND `name` NOT IN (SELECT `name` FROM `stage_files`)",
+    """UPDATE `files` SET `hash` = (SELECT `hash` FROM `stage_files` WHERE `stage_files`.`name` = `files`.`name` LIMIT 1)
+        WHERE `id` IN (SELECT `id` FROM `stage_replaced`)""",
+    """INSERT INTO `files` (`name`, `hash`)
+        SELECT `s`.`name`, `s`.`hash` FROM `stage_files` `s` JOIN `stage_written` `w` ON `w`.`stageId` = `s`.`id`
+        WHERE `s`.`name` NOT IN (SELECT `name` FROM `files`) ORDER BY `s`.`id`""",
+    """CREATE {temporary} TABLE `stage_ids` AS
+        SELECT `w`.`stageId` AS `stageId`, `f`.`id` AS `fileId` FROM `stage_written` `w` JOIN `files` `f` ON `f`.`name` = `w`.`name`""",
+    """INSERT INTO `classes` (`fileId`, `name`, `docstring`)
+        SELECT `i`.`fileId`, `c`.`name`, `c`.`docstring` FROM `stage_classes` `c` JOIN `stage_ids` `i` ON `i`.`stageId` = `c`.`fileId`
+        ORDER BY `c`.`id`""",
+    """INSERT INTO `functions` (`classId`, `fileId`, `name`, `docstring`)
+        SELECT `k`.`id`, `i`.`fileId`, `fn`.`name`, `fn`.`docstring` FROM `stage_functions` `fn`
+            JOIN `stage_ids` `i` ON `i`.`stageId` = `fn`.`fileId`
+            LEFT JOIN `stage_classes` `c` ON `c`.`id` = `fn`.`classId`
+            LEFT JOIN `classes` `k` ON `k`.`fileId` = `i`.`fileId` AND `k`.`name` = `c`.`name`
+        ORDER BY `fn`.`id`""",
+    """INSERT INTO `args` (`functionId`, `order`, `name`, `type`, `value`)
+        SELECT `f`.`id`, `a`.`order`, `a`.`name`, `a`.`type`, `a`.`value` FROM `stage_args` `a`
+            JOIN `stage_functions` `fn` ON `fn`.`id` = `a`.`functionId`
+            JOIN `stage_ids` `i` ON `i`.`stageId` = `fn`.`fileId`
+            LEFT JOIN `stage_classes` `c` ON `c`.`id` = `fn`.`classId`
+            LEFT JOIN `classes` `k` ON `k`.`fileId` = `i`.`fileId` AND `k`.`name` = `c`.`name`
+            JOIN `functions` `f` ON `f`.`fileId` = `i`.`fileId` AND `f`.`name` = `fn`.`name` AND `f`.`classId` {same} `k`.`id`
+        ORDER BY `a`.`id`"""
+)
+
+# the staging tables, which are removed once the rows have been merged
+SQL_STAGE_TABLES = ("stage_files", "stage_classes", "stage_functions", "stage_args", "stage_written", "stage_replaced", "stage_ids")
+
+
+def id_allocator(start:int=1):
+    """
+    Creates a monotonic ID allocator (call next() on it to get the next ID)
+    This is shared by every file and class, so getting an ID never depends on the number of rows already written
+    :param start: the first ID
+    :return: the ID allocator
+    """
+    return itertools.count(start)
+
+
+def iter_rows(mod_data, symbols=None):
+    """
+    this function generates the database rows of each module
+    The rows of each table are tuples in the column order:
+        files: (id, name, hash) (the hash of the module's rows, see rows_hash)
+        classes: (id, fileId, name, docstring)
+        functions: (id, classId, fileId, name, docstring)
+        args: (id, functionId, order, name, type, value)
+    With a symbol index, the rows of each arguement whose type refers to a module, class or function are also generated:
+        references: (id, argId, kind, symbol, fileId, classId, functionId) (the IDs of the row of the symbol, see Symbols.SymbolIndex)
+    A reference to a symbol which is defined in a later module is generated with the rows of that module
+    :param mod_data: the doc dict (or generator of (dotted name, module doc) pairs) to convert to rows
+    :param symbols: the symbol index the arguements' types are resolved with (None to not generate the references)
+    :return: a generator of dicts, containing the list of rows of each table for each module
+    """
+
+    # the ID allocators of each table
+    file_ids = id_allocator()
+    class_ids = id_allocator()
+    function_ids = id_allocator()
+    arg_ids = id_allocator()
+    reference_ids = id_allocator()
+
+    # the IDs of the row of each symbol which has been generated (fileId, classId, functionId),
+    # and the arguements which refer to each symbol which has not been generated yet
+    defined = {}
+    waiting = {}
+
+    def define(rows, name, ids):
+        """
+        stores the IDs of the row of a symbol, and adds the references which were waiting for it
+        :param rows: the dict of rows to add to
+        :param name: the symbol's full dotted name
+        :param ids: the IDs of the symbol's row (fileId, classId, functionId)
+        """
+        defined[name] = ids
+        for arg_id, symbol in waiting.pop(name, ()):
+            rows["references"].append((next(reference_ids), arg_id, symbol.kind, symbol.name) + ids)
+
+    def function_rows(func, rows, file_id, class_id=None, prefix=None, module=None):
+        """
+        adds the rows of each function, and its arguements
+        :param func: the dict of functions
+        :param rows: the dict of rows to add to
+        :param file_id: the ID of the file which the functions are in
+        :param class_id: the ID of the class which the functions are in (None for not in a class)
+        :param prefix: the start of the full dotted name of each function (None to not generate the references)
+        :param module: the dotted name of the module which the functions are in
+        """
+        for name, d in func.items():
+            function_id = next(function_ids)
+            rows["functions"].append((function_id, class_id, file_id, name, d["doc"]))
+
+            for order, a in enumerate(d["args"]):
+                arg_id = next(arg_ids)
+                rows["args"].append((arg_id, function_id, order, a["name"], a["type"], a["value"]))
+
+                # the reference is added once the row of the symbol has been generated
+                symbol = None if prefix is None else symbols.resolve(a["type"], module)
+                if symbol is not None:
+                    if symbol.name in defined:
+                        rows["references"].append((next(reference_ids), arg_id, symbol.kind, symbol.name) + defined[symbol.name])
+                    else:
+                        waiting.setdefault(symbol.name, []).append((arg_id, symbol))
+
+            if prefix is not None:
+                define(rows, prefix + name, (file_id, class_id, function_id))
+
+    # iterate over each file in the doc dict
+    for filename, data in iter_modules(mod_data):
+        rows = {table: [] for table in (SQL_TABLES if symbols is None else SQL_REFERENCE_TABLES)}
+
+        file_id = next(file_ids)
+        rows["files"].append((file_id, filename))
+
+        prefix = None
+        if symbols is not None:
+            prefix = filename + "."
+            define(rows, filename, (file_id, None, None))
+
+        # add the module's functions, then each class and its methods
+        function_rows(data["functions"], rows, file_id, None, prefix, filename)
+        for name, d in data["classes"].items():
+            class_id = next(class_ids)
+            rows["classes"].append((class_id, file_id, name, d["doc"]))
+            if prefix is None:
+                function_rows(d["func"], rows, file_id, class_id)
+            else:
+                define(rows, prefix + name, (file_id, class_id, None))
+                function_rows(d["func"], rows, file_id, class_id, prefix + name + ".", filename)
+
+        # the hash is stored with the file, so the incremental mode of the SQL outputs can skip unchanged modules
+        rows["files"][0] = (file_id, filename, rows_hash(rows))
+
+        yield rows
+
+
+def rows_hash(rows:dict):
+    """
+    Hashes the rows of a module (see iter_rows), without their IDs, so the hash only changes when the module's stored values change
+    The rows which refer to other rows are hashed with their position in the module, rather than their ID
+    :param rows: the dict of the list of rows of each table (the module's rows must have consecutive IDs)
+    :return: the hash
+    """
+
+    # the first ID of each table in the module
+    first = {table: values[0][0] if len(values) > 0 else 0 for table, values in rows.items()}
+
+    data = (
+        [row[1] for row in rows["files"]],
+        [(name, doc) for _, _, name, doc in rows["classes"]],
+        [(None if class_id is None else class_id - first["classes"], name, doc) for _, class_id, _, name, doc in rows["functions"]],
+        [(function_id - first["functions"], order, name, data_type, sql_value(value))
+         for _, function_id, order, name, data_type, value in rows["args"]]
+    )
+    return hashlib.sha256(repr(data).encode("utf-8")).hexdigest()
+
+
+def upsert_statements(statements, temporary:str, same:str):
+    """
+    Fills in the SQL dialect of the statements which merge the staging tables (see SQL_UPSERT_PREPARE)
+    :param statements: the statements
+    :param temporary: the keyword which creates a temporary table
+    :param same: the operator which compares two values, where null is the same as null
+    :return: the list of statements
+    """
+    return [statement.format(temporary=temporary, same=same) for statement in statements]
+
+
+def sql_value(value):
+    """
+    converts an arguement's default value to the value stored in a database
+    :param value: the default value
+    :return: the value to store
+    """
+
+    # missing values are stored as null, and booleans as numbers
+    if value is None:
+        return None
+    if type(value) is bool:
+        return int(value)
+    if type(value) in (int, float, str):
+        return value
+    return str(value)
+
+
+def sql_string(text):
+    """
+    converts text to a quoted SQL string (used in the files of SQL commands)
+    :param text: the text
+    :return: the SQL text of the string
+    """
+    return "'{}'".format(str(text).replace("'", "''"))
+
+
+def sql_literal(value):
+    """
+    converts an arguement's default value to the SQL text of the value (used in the files of SQL commands)
+    :param value: the default value
+    :return: the SQL text of the value
+    """
+
+    # if the arguement does not specify a value, set to null
+    if value is None:
+        return 'null'
+
+    # booleans are written as numbers
+    if type(value) is bool:
+        return str(int(value))
+
+    # if the item is a number, do not surround with quotes
+    try:
+        int(value)
+        return str(value)
+    except (ValueError, TypeError, OverflowError):
+        return sql_string(value)
+
+
+def reference_values(rows):
+    """
+    converts the references of a module (see iter_rows) to the SQL text of each row (used in the files of SQL commands)
+    :param rows: the list of reference rows
+    :return: a generator of the SQL text of each row
+    """
+    for i, arg_id, kind, symbol, file_id, class_id, function_id in rows:
+        yield "({}, {}, '{}', '{}', {}, {}, {})".format(
+            i, arg_id, kind, symbol, file_id, "null" if class_id is None else class_id, "null" if function_id is None else function_id
+        )
+
+
+def iter_insert_statements(prefix:str, values, max_rows:int=SQL_INSERT_MAX_ROWS, max_bytes:int=SQL_INSERT_MAX_BYTES):
+    """
+    Splits rows into INSERT statements, which are each limited by their number of rows and their size
+    (a single row larger than the size limit is still placed in a statement on its own)
+    :param prefix: the start of the statement (ex. "INSERT INTO files VALUES ")
+    :param values: an iterable of the SQL text of each row (ex. "(1, 'name')")
+    :param max_rows: the maximum number of rows in each statement
+    :param max_bytes: the maximum size of each statement in bytes (UTF-8 encoded)
+    :return: a generator of INSERT statements
+    """
+
+    # the size of the prefix, and the closing ";\n"
+    base_size = len(prefix.encode("utf-8")) + 2
+
+    chunk = []
+    size = base_size
+    for value in values:
+
+        # the size of the row, and its ", " separator
+        row_size = len(value.encode("utf-8")) + 2
+
+        # start a new statement when the current one is full
+        if len(chunk) > 0 and (len(chunk) >= max_rows or size + row_size > max_bytes):
+            yield prefix + ", ".join(chunk) + ";\n"
+            chunk = []
+            size = base_size
+
+        chunk.append(value)
+        size += row_size
+
+    # finish the last statement
+    if len(chunk) > 0:
+        yield prefix + ", ".join(chunk) + ";\n"
@@ -0,0 +1,166 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+from Documenter.GlobalVariable import EXTRACTOR_VERSION, CACHE_MAX_SIZE
+
+# the entries are pickled, and loading a pickle can run any code, so only use a cache directory which only trusted users can write to
+# (ex. not a directory shared with other users, or restored from an untrusted CI cache)
+
+# the extension of each cache entry (used to tell entries apart from temporary files)
+CACHE_EXTENSION = ".pickle"
+
+
+def get_cache_key(source, ignore_no_docstr:bool, dotted_types:bool=False):
+    """
+    Generates the cache key of a file (based on the file's contents, and the options which affect its doc dict)
+    :param source: the contents of the file (as bytes, or a string)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param dotted_types: If an arguement's dotted type is documented by its name (see Py2Dict.file_to_dict)
+    :return: the cache key as a hex string
+    """
+
+    key = hashlib.sha256()
+    key.update("{}:{}:".format(EXTRACTOR_VERSION, int(bool(ignore_no_docstr))).encode())
+
+    # the option is only added to the key when it is used, so the keys of the entries cached without it do not change
+    if dotted_types:
+        key.update(b"dotted:")
+    if isinstance(source, str):
+        source = source.encode("utf-8", "surrogatepass")
+    key.update(source)
+    return key.hexdigest()
+
+
+def get_cache_path(cache_dir:str, key:str):
+    """
+    Gets the path of a cache entry (entries are split into subdirectories by the first 2 characters of the key)
+    :param cache_dir: the cache directory
+    :param key: the cache key
+    :return: the path to the cache entry
+    """
+    return os.path.join(cache_dir, key[:2], key + CACHE_EXTENSION)
+
+
+def load_cached(cache_dir:str, key:str):
+    """
+    Loads a doc dict from the cache
+    The entry is unpickled, so the cache directory must only be writable by trusted users
+    :param cache_dir: the cache directory
+    :param key: the cache key
+    :return: the cached doc dict, or None if it is not cached
+    """
+
+    path = get_cache_path(cache_dir, key)
+
+    try:
+        with open(path, 'rb') as f:
+            output = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        # a damaged entry is treated as a miss, and removed so it gets rewritten
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    # mark the entry as recently used (the modification time is used for LRU eviction)
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+    return output
+
+
+def store_cached(cache_dir:str, key:str, doc:dict):
+    """
+    Stores a doc dict in the cache
+    The entry is written to a temporary file which is then renamed, so other processes never see a partial entry
+    :param cache_dir: the cache directory
+    :param key: the cache key
+    :param doc: the doc dict to store
+    """
+
+    path = get_cache_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            pickle.dump(doc, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # another process may be writing (or evicting) the same entry, the cache is only an optimization
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def prune_cache(cache_dir:str, max_size:int=CACHE_MAX_SIZE):
+    """
+    Removes the least recently used entries from the cache, until the cache is no larger than the specified size
+    :param cache_dir: the cache directory
+    :param max_size: the maximum size of the cache in bytes
+    :return: the number of entries removed
+    """
+
+    entries = []
+    total = 0
+
+    # get the size, and last use time of each entry
+    for sub in _scandir(cache_dir):
+        if not sub.is_dir():
+            continue
+        for entry in _scandir(sub.path):
+            if not entry.name.endswith(CACHE_EXTENSION):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    # remove the oldest entries first
+    removed = 0
+    entries.sort()
+    for mtime, size, path in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            # the entry was already removed by another process
+            pass
+        total -= size
+
+    return removed
+
+
+def clear_cache(cache_dir:str):
+    """
+    Removes every entry from the cache
+    :param cache_dir: the cache directory
+    """
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def _scandir(path:str):
+    """
+    Lists a directory, returning nothing if it does not exist
+    :param path: the directory to list
+    :return: the list of directory entries
+    """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
@@ -1,16 +1,27 @@
 import ast
 import _ast
+import time
 
+from Documenter.FastExtractor import skeleton_source
 from Documenter.GlobalVariable import MISSING_DOCSTRING_MESSAGE
 from Documenter.misc import path_to_dot_notation
+from Documenter.ParseCache import get_cache_key, load_cached, store_cached
+from Documenter.Reader import read_source, decode_source
+from Documenter.Stats import hooks_enabled, emit, instrument
 
 
-def file_to_dict(filename:str, start_dir:str, ignore_no_docstr:bool):
+def file_to_dict(filename:str, start_dir:str, ignore_no_docstr:bool, cache_dir:str=None, fast:bool=False, source:bytes=None,
+                 dotted_types:bool=False):
     """
     This function converts a file to dictionary notation
     :param filename: the path to the Python file
     :param start_dir: the path to the start location of the dot notation,
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param cache_dir: the directory of the parse cache (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings, see FastExtractor)
+    :param source: the contents of the file, if it has already been read (ex. by Reader.prefetch_sources)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
+        (used to link the types to their definitions, see Symbols.SymbolIndex)
     :return: the doc dict
     """
 
@@ -19,40 +30,107 @@ def file_to_dict(filename:str, start_dir:str, ignore_no_docstr:bool):
         start_dir = filename
 
     output = {}
+    path = filename
 
-    # read the file into memory
-    fdata = open(filename, 'r').read()
+    # only measure the file if its statistics are being collected
+    start = time.perf_counter() if hooks_enabled() else None
+
+    # read the file into memory (as bytes, so the encoding declared by the file is used to decode it)
+    if source is None:
+        source = read_source(filename)
 
     # get the dot notation of the filename
     filename = path_to_dot_notation(filename, start_dir)
 
     # if the file is empty, skip it
-    if fdata == "":
+    if len(source) == 0:
         return None
 
+    # if the file has not changed since it was cached, skip parsing it
+    cache_key = None
+    if cache_dir is not None:
+        cache_key = get_cache_key(source, ignore_no_docstr, dotted_types)
+        cached = load_cached(cache_dir, cache_key)
+        if cached is not None:
+            cached["file"] = filename
+            if start is not None:
+                emit_file_event(path, start, source, None)
+            return cached
+
+    # parse the skeleton of the Python file (falling back to the full file if the skeleton can not be used)
+    tree = None
+    if fast:
+        try:
+            tree = ast.parse(skeleton_source(decode_source(source)))
+            output = tree_to_dict(tree, ignore_no_docstr, dotted_types)
+        except Exception:
+            output = {}
+
     # parse the Python file
-    tree = ast.parse(fdata)
+    if len(output) == 0:
+        tree = ast.parse(source)
+        output = tree_to_dict(tree, ignore_no_docstr, dotted_types)
+
+    # cache the result (the dot notation filename is not cached, as it depends on the file's location)
+    if cache_key is not None:
+        store_cached(cache_dir, cache_key, output)
+
+    # add the dot notation filename to the doc dict
+    output["file"] = filename
+
+    if start is not None:
+        emit_file_event(path, start, source, tree)
+
+    # return the result
+    return output
+
+
+def emit_file_event(filename:str, start:float, source:bytes, tree):
+    """
+    Emits the statistics of a documented file to the registered hooks (see Stats)
+    :param filename: the path to the Python file
+    :param start: the time the file started being documented (from time.perf_counter)
+    :param source: the contents of the file
+    :param tree: the syntax tree which was parsed (None if the doc dict was loaded from the cache)
+    """
+    emit("file", {
+        "file": filename,
+        "seconds": time.perf_counter() - start,
+        "bytes": len(source),
+        "nodes": 0 if tree is None else sum(1 for _ in ast.walk(tree)),
+        "cached": tree is None
+    })
+
+
+def tree_to_dict(tree, ignore_no_docstr:bool, dotted_types:bool=False):
+    """
+    This function converts the syntax tree of a file to dictionary notation
+    :param tree: the syntax tree of the file
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
+    :return: the doc dict (without the file name)
+    """
+
+    output = {}
 
     # parse the functions in the file, and add to the dictionary
     func = [f for f in tree.body if isinstance(f, _ast.FunctionDef)]
-    output["functions"] = parse_function(func, ignore_no_docstr)
+    output["functions"] = parse_function(func, ignore_no_docstr, dotted_types)
 
     # parse the classes in the file, and add to the dictionary
     classes = [cls for cls in tree.body if isinstance(cls, _ast.ClassDef)]
-    output["classes"] = parse_class(classes, ignore_no_docstr)
+    output["classes"] = parse_class(classes, ignore_no_docstr, dotted_types)
 
-    # add the dot notation filename to the doc dict
-    output["file"] = filename
-
-    # return the result
     return output
 
 
-def parse_function(func, ignore_no_docstr:bool):
+@instrument
+def parse_function(func, ignore_no_docstr:bool, dotted_types:bool=False):
     """
     This function converts the functions of a file to dict format
     :param func: The function tree
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
     :return: dict of function data
     """
 
@@ -81,10 +159,7 @@ def parse_function(func, ignore_no_docstr:bool):
             # get the arguement accepted datatype ('any' is the default value)
             data_type = "any"
             if a.annotation is not None:
-                if hasattr(a.annotation, 'id'):
-                    data_type = a.annotation.id
-                else:
-                    data_type = "unknown"
+                data_type = annotation_name(a.annotation, dotted_types)
 
             # add the correct information to the arguement
             functions[f.name]["args"].append({"name": a.arg, "type": data_type, "value": None})
@@ -113,6 +188,30 @@ def parse_function(func, ignore_no_docstr:bool):
     return functions
 
 
+def annotation_name(annotation, dotted:bool=False):
+    """
+    gets the name of an arguement's annotation (ex. "Class", or "module.Class" for a dotted name)
+    :param annotation: the annotation's node
+    :param dotted: If the name of a dotted annotation is used (otherwise only a plain name is used)
+    :return: the name, or "unknown" if the annotation is not a name
+    """
+
+    if not dotted:
+        return annotation.id if hasattr(annotation, 'id') else "unknown"
+
+    # a dotted name is an attribute of an attribute ... of a name
+    parts = []
+    while isinstance(annotation, _ast.Attribute):
+        parts.append(annotation.attr)
+        annotation = annotation.value
+
+    if not hasattr(annotation, 'id'):
+        return "unknown"
+
+    parts.append(annotation.id)
+    return ".".join(reversed(parts))
+
+
 def get_docstring(body):
     """
     gets the docstring from the item's body, or returns a default message if is not defined
@@ -131,17 +230,19 @@ def get_docstring(body):
         return MISSING_DOCSTRING_MESSAGE
 
 
-def parse_class(obj, ignore_no_docstr:bool):
+@instrument
+def parse_class(obj, ignore_no_docstr:bool, dotted_types:bool=False):
     """
     Parses the classes of a file, and returns a doc dict
     :param obj: the object to parse
     :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
     :return: the doc dict of classes
     """
     classes = {}
     for c in obj:
         doc = get_docstring(c.body)
-        func = parse_function(c.body, ignore_no_docstr)
+        func = parse_function(c.body, ignore_no_docstr, dotted_types)
         if get_docstring(c.body) == MISSING_DOCSTRING_MESSAGE:
 
             if "__init__" in func:
@@ -155,7 +256,7 @@ def parse_class(obj, ignore_no_docstr:bool):
         #     continue
 
         # for each class, parse the functions, and docstring, and add it to the doc dict
-        classes[c.name] = {"func": parse_function(c.body, ignore_no_docstr), "doc": doc}
+        classes[c.name] = {"func": parse_function(c.body, ignore_no_docstr, dotted_types), "doc": doc}
 
     # return it
     return classes
\ No newline at end of file
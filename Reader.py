@@ -0,0 +1,144 @@
+import io
+import time
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from Documenter.GlobalVariable import PREFETCH_BATCH_SIZE
+
+
+def new_io_stats():
+    """
+    Creates an empty dict of I/O statistics (pass it to the parsing functions to have it filled in, see format_io_stats)
+        files: the number of files read
+        bytes: the number of bytes read
+        read_time: the number of seconds spent reading files
+        wait_time: the number of seconds the parser spent waiting for files to be read
+        total_time: the number of seconds from the start of the run to the last file being parsed
+    :return: the dict of I/O statistics
+    """
+    return {"files": 0, "bytes": 0, "read_time": 0.0, "wait_time": 0.0, "total_time": 0.0, "start": time.perf_counter()}
+
+
+def read_source(filename:str, stats:dict=None):
+    """
+    Reads a Python file as bytes
+    The file is always closed before returning
+    :param filename: the path to the Python file
+    :param stats: the dict of I/O statistics to add the read to (None to not record it)
+    :return: the contents of the file
+    """
+
+    start = time.perf_counter()
+
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    # record the read
+    if stats is not None:
+        stats["files"] += 1
+        stats["bytes"] += len(data)
+        stats["read_time"] += time.perf_counter() - start
+
+    return data
+
+
+def decode_source(data:bytes):
+    """
+    Decodes the contents of a Python file, using the encoding it declares (PEP 263), or UTF-8 if it does not declare one
+    Line endings are converted to line feeds, the same as reading the file in text mode
+    (ast.parse accepts the bytes directly, this is only needed when the source is used as text)
+    :param data: the contents of the file
+    :return: the source as a string
+    """
+
+    # the encoding is declared by a BOM, or a coding comment on one of the first 2 lines
+    encoding = tokenize.detect_encoding(io.BytesIO(data).readline)[0]
+
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_batch(files:List[str], stats:dict=None):
+    """
+    Reads a batch of files
+    :param files: the paths of the files to read
+    :param stats: the dict of I/O statistics to add the reads to (None to not record them)
+    :return: the list of the contents of each file (None for a file which could not be read)
+    """
+
+    output = []
+    for f in files:
+        try:
+            output.append(read_source(f, stats))
+        except OSError:
+            # the error is raised when the file is parsed, so it is reported in the same order as before
+            output.append(None)
+    return output
+
+
+def prefetch_sources(files:List[str], batch_size:int=PREFETCH_BATCH_SIZE, stats:dict=None):
+    """
+    Reads files in batches on a background thread, so the next batch is read while the current batch is parsed
+    :param files: the paths of the files to read
+    :param batch_size: the number of files in each batch
+    :param stats: the dict of I/O statistics to record the reads, and the time spent waiting for them in (None to not record them)
+    :return: a generator of (file path, contents) pairs, in the order of the provided files (the contents are None if the file could not be read)
+    """
+
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+    if len(batches) == 0:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(read_batch, batches[0], stats)
+
+        for i, batch in enumerate(batches):
+
+            # wait for the current batch (if parsing is faster than reading, this is where the time goes)
+            start = time.perf_counter()
+            sources = pending.result()
+            if stats is not None:
+                stats["wait_time"] += time.perf_counter() - start
+
+            # start reading the next batch, before the current batch is parsed
+            if i + 1 < len(batches):
+                pending = reader.submit(read_batch, batches[i + 1], stats)
+
+            for f, data in zip(batch, sources):
+                yield f, data
+
+
+def format_io_stats(stats:dict):
+    """
+    Formats the I/O statistics of a run as a human readable report
+    :param stats: the dict of I/O statistics
+    :return: the report
+    """
+
+    def rate(amount, seconds):
+        """
+        calculates the rate of an amount over a period of time
+        :param amount: the amount (ex. the number of bytes)
+        :param seconds: the number of seconds
+        :return: the amount per second
+        """
+        return amount / seconds if seconds > 0 else 0.0
+
+    mb = stats["bytes"] / (1024 * 1024)
+    total = stats["total_time"]
+
+    lines = ["Documented {} Files ({:.2f} MB) In {:.3f}s: {:.2f} MB/s, {:.1f} Files/s".format(
+        stats["files"], mb, total, rate(mb, total), rate(stats["files"], total)
+    )]
+
+    # the read time is only known when the files are read by this process (a single process run)
+    # each process of a multi-process run reads its own files, while the other processes are parsing
+    if stats["read_time"] > 0:
+        lines.append("Read In {:.3f}s: {:.2f} MB/s, {:.1f} Files/s".format(
+            stats["read_time"], rate(mb, stats["read_time"]), rate(stats["files"], stats["read_time"])
+        ))
+        lines.append("Waited {:.3f}s For Files To Be Read ({})".format(
+            stats["wait_time"], "I/O Bound" if stats["wait_time"] > total / 2 else "CPU Bound"
+        ))
+
+    return "\n".join(lines)
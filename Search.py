@@ -0,0 +1,86 @@
+import os
+import re
+import sqlite3
+
+from Documenter.GlobalVariable import SEARCH_LIMIT
+
+# the weight of a match in each column of the search index, when ranking the results (a match in a name is worth more than one in a docstring)
+# (the columns are kind, sourceId, path, name, and docstring)
+SEARCH_WEIGHTS = (0.0, 0.0, 5.0, 10.0, 1.0)
+
+# the words of a plain text query
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+
+def plain_query(query:str):
+    """
+    Converts a plain text query to an FTS5 query, which matches every word of the query (or a word starting with it)
+    (FTS5 queries have their own syntax, which fails on plain text such as "os.path" or "a-b")
+    :param query: the plain text query
+    :return: the FTS5 query
+    """
+    return " ".join('"{}"*'.format(w) for w in _WORDS.findall(query))
+
+
+def search_docs(db_path:str, query:str, limit:int=SEARCH_LIMIT, raw:bool=False):
+    """
+    Searches the full text search index of a database written by doc_to_sqlite_db(..., search_index=True)
+    The results are ranked by relevance (BM25), with matches in names ranked above matches in docstrings
+    :param db_path: the database filename
+    :param query: the words to search for (every word must match, the last word of a name can be partly typed)
+    :param limit: the maximum number of results
+    :param raw: If the query is passed to FTS5 as it is (allows the FTS5 query syntax, ex. "name:parse OR docstring:file")
+    :return: a list of dicts of each result's "kind" (module, class, or function), dotted "path", "name", "doc", "snippet", and "score"
+    """
+
+    if not raw:
+        query = plain_query(query)
+
+    # a query without any words does not match anything
+    if query.strip() == "":
+        return []
+
+    if not os.path.isfile(db_path):
+        raise FileNotFoundError("The Database {} Does Not Exist".format(db_path))
+
+    # the database is only read
+    conn = sqlite3.connect("file:{}?mode=ro".format(db_path.replace("?", "%3f").replace("#", "%23")), uri=True)
+    try:
+        try:
+            rows = conn.execute(
+                "SELECT `kind`, `path`, `name`, `docstring`, snippet(`search`, 4, '[', ']', '...', 12), bm25(`search`, {}) AS score "
+                "FROM `search` WHERE `search` MATCH ? ORDER BY score LIMIT ?".format(", ".join(str(w) for w in SEARCH_WEIGHTS)),
+                (query, limit)
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                raise ValueError("The Database {} Does Not Have A Search Index (Write It With search_index=True)".format(db_path))
+            if "fts5" in str(e):
+                raise ValueError("{} Is An Invalid Search Query ({})".format(query, e))
+            raise
+    finally:
+        conn.close()
+
+    # BM25 scores are negative (lower is better), so they are negated to make higher scores better
+    return [
+        {"kind": kind, "path": path, "name": name, "doc": doc, "snippet": snippet, "score": -score}
+        for kind, path, name, doc, snippet, score in rows
+    ]
+
+
+def format_results(results):
+    """
+    Formats search results as text
+    :param results: the list of results (see search_docs)
+    :return: the formatted results
+    """
+
+    if len(results) == 0:
+        return "No Results Found"
+
+    lines = []
+    for r in results:
+        lines.append("{:>8.2f}  {:<9}{}".format(r["score"], r["kind"], r["path"]))
+        if r["snippet"]:
+            lines.append("\t\t\t" + r["snippet"].replace("\n", " "))
+    return "\n".join(lines)
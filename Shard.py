@@ -0,0 +1,199 @@
+import contextlib
+import hashlib
+import heapq
+import os
+import pickle
+from typing import List
+
+from Documenter.Documenter import parse_files
+from Documenter.ParseCache import prune_cache
+from Documenter.misc import find_python_files
+
+# the version of the partial snapshot format (shards written by a different version can not be merged)
+SHARD_VERSION = 1
+
+
+def parse_shard(spec:str):
+    """
+    Parses a shard specification (ex. "2/4" is the second of 4 shards)
+    :param spec: the shard specification
+    :return: the shard's number (starting at 1), and the number of shards
+    """
+
+    try:
+        number, count = (int(v) for v in spec.split("/"))
+    except ValueError:
+        raise ValueError("{} Is An Invalid Shard (Use I/N, ex. 1/4)".format(spec))
+
+    if count < 1 or number < 1 or number > count:
+        raise ValueError("{} Is An Invalid Shard (Use I/N, ex. 1/4)".format(spec))
+    return number, count
+
+
+def shard_of(rel_path:str, count:int):
+    """
+    Gets the shard a file belongs to
+    The shard only depends on the file's path relative to the documented directory, so every machine agrees on it
+    :param rel_path: the file's path relative to the documented directory
+    :param count: the number of shards
+    :return: the shard's number (starting at 1)
+    """
+    digest = hashlib.sha1(rel_path.replace(os.sep, "/").encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def listing_hash(rel_paths:List[str]):
+    """
+    Hashes the list of files which were found, so shards written from different files can be detected when merging
+    :param rel_paths: the paths of the files relative to the documented directory
+    :return: the hash
+    """
+    return hashlib.sha256("\n".join(p.replace(os.sep, "/") for p in rel_paths).encode("utf-8")).hexdigest()
+
+
+def write_shard(path:str, filename:str, number:int, count:int, start_dir=None, ignore_no_docstr:bool=False, workers:int=1,
+                cache_dir:str=None, fast:bool=False, io_stats:dict=None, walk_options:dict=None, dotted_types:bool=False):
+    """
+    Documents one shard of the files in a directory (the files are split between the shards by the hash of their path),
+    and writes them to a partial snapshot, which is combined with the other shards by merge_shards
+    Every shard must be run with the same directory and options
+    :param path: the path to the files to generate documentation from
+    :param filename: the file to write the partial snapshot to
+    :param number: the shard's number (starting at 1)
+    :param count: the number of shards
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to parse the files with (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param io_stats: the dict of I/O statistics to record the run in (see Reader.new_io_stats, None to not record them)
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param dotted_types: If an arguement's dotted type (ex. module.Class) is documented by its name, rather than as unknown
+        (so the types can be linked once the shards are merged, see --links)
+    :return: the number of modules written
+    """
+
+    # if no start dir is specified, set it to the provided path
+    if start_dir is None:
+        start_dir = path
+
+    # every shard walks the whole directory (which is fast compared to parsing), so each module's position in the full run is known
+    files = find_python_files(path, walk_options)
+    rel_paths = [os.path.relpath(f, path) for f in files]
+    indexes = [i for i in range(len(files)) if shard_of(rel_paths[i], count) == number]
+
+    modules = 0
+    tmp = filename + ".tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump({
+            "version": SHARD_VERSION,
+            "shard": number,
+            "count": count,
+            "files": listing_hash(rel_paths)
+        }, f, pickle.HIGHEST_PROTOCOL)
+
+        # each module is written with its file's position, as soon as it is parsed
+        for index, val in zip(indexes, parse_files([files[i] for i in indexes], start_dir, ignore_no_docstr, workers, cache_dir, fast, io_stats,
+                                                     dotted_types)):
+            for name, mod in val.items():
+                pickle.dump((index, name, mod), f, pickle.HIGHEST_PROTOCOL)
+                modules += 1
+
+        # marks the end of the shard, so a partly written shard is detected
+        pickle.dump(None, f, pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp, filename)
+
+    # keep the cache within its size limit
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
+    return modules
+
+
+def read_shard_header(f):
+    """
+    Reads the header of a partial snapshot
+    :param f: the partial snapshot file (opened in binary mode)
+    :return: the header dict
+    """
+
+    try:
+        header = pickle.load(f)
+    except (EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        header = None
+
+    if not isinstance(header, dict) or header.get("version") != SHARD_VERSION:
+        raise ValueError("{} Is Not A Partial Snapshot Written By This Version".format(f.name))
+    return header
+
+
+def iter_shard(f):
+    """
+    Reads the modules of a partial snapshot (after its header)
+    :param f: the partial snapshot file (opened in binary mode)
+    :return: a generator of (file position, dotted name, module doc) tuples
+    """
+    while True:
+        try:
+            item = pickle.load(f)
+        except (EOFError, pickle.UnpicklingError):
+            raise ValueError("{} Was Not Completely Written".format(f.name))
+        if item is None:
+            return
+        yield item
+
+
+def iter_merged_shards(filenames:List[str]):
+    """
+    Combines the partial snapshots of every shard, in the same order as documenting the directory on a single machine
+    (the doc_to_* functions accept this generator in place of a doc dict)
+    The shards are checked before this returns, so a missing shard is reported before any output is written
+    :param filenames: the partial snapshot of each shard (in any order)
+    :return: a generator of (dotted name, module doc) pairs
+    """
+
+    if len(filenames) == 0:
+        raise ValueError("No Partial Snapshots To Merge")
+
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open(f, 'rb')) for f in filenames]
+        headers = [read_shard_header(f) for f in files]
+
+        # ensure every shard is present once, and they were all written from the same files
+        count = headers[0]["count"]
+        numbers = sorted(h["shard"] for h in headers)
+        if any(h["count"] != count for h in headers) or numbers != list(range(1, count + 1)):
+            missing = sorted(set(range(1, count + 1)) - set(numbers))
+            if len(missing) > 0:
+                raise ValueError("Shard {} Of {} Is Missing".format(", ".join(str(n) for n in missing), count))
+            raise ValueError("Each Shard Must Be Merged Once, From The Same Number Of Shards")
+        if len(set(h["files"] for h in headers)) > 1:
+            raise ValueError("The Shards Were Written From Different Files")
+
+        # the files are closed by the generator, once every module has been read
+        close = stack.pop_all()
+
+    return merge_modules(files, close)
+
+
+def merge_modules(files, close):
+    """
+    Merges the modules of the partial snapshots by their file's position
+    Each shard is already in order, so they are merged without holding every module in memory
+    :param files: the partial snapshot files (after their headers have been read)
+    :param close: the context manager which closes the files
+    :return: a generator of (dotted name, module doc) pairs
+    """
+    with close:
+        for _, name, mod in heapq.merge(*(iter_shard(f) for f in files), key=lambda item: item[0]):
+            yield name, mod
+
+
+def merge_shards(filenames:List[str]):
+    """
+    Combines the partial snapshots of every shard into a doc dict (the same as get_doc_from_dir on a single machine)
+    :param filenames: the partial snapshot of each shard (in any order)
+    :return: the documentation dictionary
+    """
+    return dict(iter_merged_shards(filenames))
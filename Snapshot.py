@@ -0,0 +1,220 @@
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+from collections.abc import Mapping
+
+from Documenter.Diff import module_hash, HASH_SIZE
+from Documenter.misc import iter_modules
+from Documenter.Stats import instrument_writer
+
+# the first bytes of every snapshot, and the version of the snapshot format
+# (snapshots written by a newer version can not be read, version 1 snapshots are read without the hash of each module)
+SNAPSHOT_MAGIC = b"DOCSNAP\x00"
+SNAPSHOT_VERSION = 2
+
+# the pickle protocol of each module (4 is the newest protocol every supported version of Python can read)
+SNAPSHOT_PROTOCOL = 4
+
+# the header (magic, version, number of modules), and the entry of each module in the table which follows it
+# (the offset and length of the module, the length of its name, and its hash, see Diff.module_hash)
+# the names follow the table, and the modules follow the names, in the order they were written
+SNAPSHOT_HEADER = struct.Struct("<8sII")
+SNAPSHOT_ENTRY = struct.Struct("<QQI{}s".format(HASH_SIZE))
+
+# the entry of each module in a version 1 snapshot (without the module's hash)
+SNAPSHOT_ENTRY_V1 = struct.Struct("<QQI")
+
+
+@instrument_writer
+def doc_to_snapshot(doc:dict, filename:str=None):
+    """
+    outputs the doc dict as a binary snapshot, which can be read one module at a time (see DocSnapshot)
+    The modules are written to a temporary file as they are generated, so the table of where each module is can be written first
+    The hash of each module is stored in the table, so two snapshots can be compared without reading their modules (see Diff.diff_docs)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to write
+    :param filename: the output filename, or an open binary file object - leave blank to have value returned (as bytes)
+    """
+
+    # write the temporary file next to the output, so it is on the same disk
+    directory = os.path.dirname(os.path.abspath(filename)) if isinstance(filename, str) else None
+
+    with tempfile.TemporaryFile(dir=directory) as modules:
+        names = []
+        entries = []
+        position = 0
+
+        for name, mod in iter_modules(doc):
+            # modules of the compact doc model are stored as plain doc dicts
+            if hasattr(mod, "to_dict"):
+                mod = mod.to_dict()
+
+            data = pickle.dumps(mod, SNAPSHOT_PROTOCOL)
+            modules.write(data)
+
+            names.append(name.encode("utf-8"))
+            entries.append((position, len(data), module_hash(mod)))
+            position += len(data)
+
+        # the offset of each module is from the start of the snapshot
+        start = SNAPSHOT_HEADER.size + SNAPSHOT_ENTRY.size * len(entries) + sum(len(n) for n in names)
+        head = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(entries)) + b"".join(
+            SNAPSHOT_ENTRY.pack(start + offset, length, len(name), digest) for (offset, length, digest), name in zip(entries, names)
+        ) + b"".join(names)
+        modules.seek(0)
+
+        # if no output file is specified, return the value
+        if filename is None:
+            return head + modules.read()
+
+        # write to an already open file object
+        if hasattr(filename, "write"):
+            filename.write(head)
+            shutil.copyfileobj(modules, filename)
+            return None
+
+        # the snapshot is replaced at once, so a reader never sees a partly written snapshot
+        tmp = filename + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(head)
+            shutil.copyfileobj(modules, f)
+        os.replace(tmp, filename)
+
+
+def is_snapshot(filename:str):
+    """
+    Checks if a file is a binary snapshot (by its first bytes)
+    :param filename: the file to check
+    :return: If the file is a snapshot
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+class DocSnapshot(Mapping):
+    """
+    A binary snapshot, which is read like a doc dict (and can be passed to every doc_to_* function)
+    The snapshot is memory mapped, and each module is only read from it when it is accessed, so reading a single module
+    does not read the rest of the snapshot (the modules are not kept, each access reads the module again)
+    The modules are pickled, so only open snapshots from a trusted source
+    """
+
+    def __init__(self, filename:str):
+        """
+        :param filename: the snapshot file
+        """
+
+        self.filename = filename
+        self._file = open(filename, 'rb')
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file can not be memory mapped
+            self._file.close()
+            raise ValueError("{} Is Not A Snapshot Written By This Version".format(filename))
+
+        try:
+            self._entries, self._index = self._read_table()
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_table(self):
+        """
+        Reads the table of where each module is in the snapshot
+        :return: the list of (offset, length, hash) of each module (the hash is None in a version 1 snapshot),
+            and a dict of the index of each module by its dotted name
+        """
+
+        size = len(self._map)
+        if size < SNAPSHOT_HEADER.size:
+            raise ValueError("{} Is Not A Snapshot Written By This Version".format(self.filename))
+
+        magic, version, count = SNAPSHOT_HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC or version not in (1, SNAPSHOT_VERSION):
+            raise ValueError("{} Is Not A Snapshot Written By This Version".format(self.filename))
+        entry = SNAPSHOT_ENTRY if version == SNAPSHOT_VERSION else SNAPSHOT_ENTRY_V1
+
+        names_start = SNAPSHOT_HEADER.size + entry.size * count
+        if names_start > size:
+            raise ValueError("{} Was Not Completely Written".format(self.filename))
+
+        entries = []
+        index = {}
+        position = names_start
+        for i, values in enumerate(struct.iter_unpack(entry.format, self._map[SNAPSHOT_HEADER.size:names_start])):
+            offset, length, name_length = values[:3]
+            if position + name_length > size or offset + length > size:
+                raise ValueError("{} Was Not Completely Written".format(self.filename))
+
+            index[self._map[position:position + name_length].decode("utf-8")] = i
+            entries.append((offset, length, values[3] if len(values) > 3 else None))
+            position += name_length
+
+        return entries, index
+
+    def __getitem__(self, name:str):
+        offset, length, _ = self._entries[self._index[name]]
+        return pickle.loads(self._map[offset:offset + length])
+
+    def module_hash(self, name:str):
+        """
+        Gets the hash of a module, without reading the module (see Diff.module_hash)
+        :param name: the module's dotted name
+        :return: the hash (bytes)
+        """
+        digest = self._entries[self._index[name]][2]
+
+        # version 1 snapshots do not store the hash, so the module is read and hashed
+        if digest is None:
+            return module_hash(self[name])
+        return digest
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return "DocSnapshot({!r}, {} Modules)".format(self.filename, len(self))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Closes the snapshot (its modules can not be read after it is closed)
+        """
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def to_doc(self):
+        """
+        Reads every module of the snapshot into a doc dict (the same as the doc dict the snapshot was written from)
+        :return: the doc dict
+        """
+        return dict(self.items())
+
+
+def load_snapshot(filename:str):
+    """
+    Reads a binary snapshot into a doc dict
+    :param filename: the snapshot file
+    :return: the doc dict
+    """
+    with DocSnapshot(filename) as snapshot:
+        return snapshot.to_doc()
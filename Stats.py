@@ -0,0 +1,316 @@
+import functools
+import time
+import tracemalloc
+
+# the registered hooks, each is called with the name of an event, and a dict of its data
+# while no hooks are registered, the instrumented functions only check if this list is empty
+HOOKS = []
+
+# the events which are emitted:
+#     "file": a file was documented by file_to_dict
+#         file (the path), seconds, bytes (the size of the source), nodes (the number of syntax tree nodes parsed), cached (if the cache was used)
+#     "stage": an instrumented function returned (ex. find_python_files, parse_function, parse_class, get_doc_from_dir),
+#         or the generator returned by an instrumented generator function finished (ex. iter_doc_from_files)
+#         stage (the function's name), seconds (for a generator, the time spent generating its items)
+#     "walk": a directory walk finished (see Walker.new_walk_stats for its data)
+#     "writer": a doc_to_* writer returned
+#         writer (the writer's name), seconds (in total), render_seconds (not including the time spent waiting for modules to be parsed)
+
+
+def add_hook(hook):
+    """
+    Registers a hook, which is called with the name and data of every event (see HOOKS)
+    :param hook: the function to call (ex. hook("file", {"file": "a.py", "seconds": 0.1, ...}))
+    """
+    HOOKS.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Unregisters a hook
+    :param hook: the function which was registered
+    """
+    if hook in HOOKS:
+        HOOKS.remove(hook)
+
+
+def hooks_enabled():
+    """
+    Checks if any hooks are registered (events should only be measured if this is True)
+    :return: if any hooks are registered
+    """
+    return len(HOOKS) > 0
+
+
+def emit(event:str, data:dict):
+    """
+    Calls every registered hook with an event
+    :param event: the name of the event
+    :param data: the event's data
+    """
+    for hook in list(HOOKS):
+        hook(event, data)
+
+
+def instrument(func):
+    """
+    A decorator which emits a "stage" event with the time taken each time the function returns
+    :param func: the function to instrument
+    :return: the instrumented function
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if len(HOOKS) == 0:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        emit("stage", {"stage": func.__name__, "seconds": time.perf_counter() - start})
+        return value
+
+    return wrapper
+
+
+def instrument_iter(func):
+    """
+    A decorator which emits a "stage" event with the time spent generating the items of the generator the function returns,
+    once the generator is exhausted or closed
+    :param func: the generator function to instrument
+    :return: the instrumented generator function
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if len(HOOKS) == 0:
+            return func(*args, **kwargs)
+        return timed_stage(func.__name__, func(*args, **kwargs))
+
+    return wrapper
+
+
+def timed_stage(stage:str, iterable):
+    """
+    Iterates over an iterable, and emits a "stage" event with the time spent getting its items once it is exhausted or closed
+    :param stage: the name of the stage
+    :param iterable: the iterable
+    :return: a generator of the iterable's items
+    """
+
+    waited = [0.0]
+    try:
+        yield from timed_iter(iterable, waited)
+    finally:
+        emit("stage", {"stage": stage, "seconds": waited[0]})
+
+
+def instrument_writer(func):
+    """
+    A decorator which emits a "writer" event each time a doc_to_* writer returns
+    When the writer is given a generator of modules, the time spent waiting for each module is not counted as rendering time
+    :param func: the writer to instrument
+    :return: the instrumented writer
+    """
+
+    @functools.wraps(func)
+    def wrapper(doc, *args, **kwargs):
+        if len(HOOKS) == 0:
+            return func(doc, *args, **kwargs)
+
+        # the time spent in the generator of modules (parsing them), rather than rendering them
+        waited = [0.0]
+        if not hasattr(doc, "items"):
+            doc = timed_iter(doc, waited)
+
+        start = time.perf_counter()
+        value = func(doc, *args, **kwargs)
+        total = time.perf_counter() - start
+
+        emit("writer", {"writer": func.__name__, "seconds": total, "render_seconds": total - waited[0]})
+        return value
+
+    return wrapper
+
+
+def timed_iter(iterable, waited:list):
+    """
+    Iterates over an iterable, adding the time spent getting each item to a total
+    :param iterable: the iterable
+    :param waited: a list containing the total number of seconds (the first item is added to)
+    :return: a generator of the iterable's items
+    """
+
+    it = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(it)
+        except StopIteration:
+            waited[0] += time.perf_counter() - start
+            return
+        waited[0] += time.perf_counter() - start
+        yield item
+
+
+def collect_events(func, *args):
+    """
+    Calls a function, and records the events it emits instead of calling the hooks
+    (used to send the events of a worker process back to the main process, see replay_events)
+    :param func: the function to call
+    :param args: the arguements of the function
+    :return: the value the function returned, and the list of (event, data) pairs emitted
+    """
+
+    events = []
+    previous = HOOKS[:]
+    HOOKS[:] = [lambda event, data: events.append((event, data))]
+    try:
+        value = func(*args)
+    finally:
+        HOOKS[:] = previous
+    return value, events
+
+
+def replay_events(events):
+    """
+    Calls every registered hook with the events recorded by collect_events
+    :param events: the list of (event, data) pairs
+    """
+    for event, data in events:
+        emit(event, data)
+
+
+class StatsCollector:
+    """
+    A hook which collects the events of a run, and reports the slowest files and the time taken by each stage
+    """
+
+    def __init__(self, trace_memory:bool=True):
+        """
+        :param trace_memory: If the peak memory is measured with tracemalloc (this slows Python down)
+        """
+        self.trace_memory = trace_memory
+        self.files = []
+        self.stages = {}
+        self.writers = {}
+        self.walk = None
+        self.peak_memory = None
+        self.seconds = 0.0
+        self._start = None
+
+    def __call__(self, event:str, data:dict):
+        if event == "file":
+            self.files.append(data)
+        elif event == "stage":
+            stage = self.stages.setdefault(data["stage"], {"seconds": 0.0, "calls": 0})
+            stage["seconds"] += data["seconds"]
+            stage["calls"] += 1
+        elif event == "walk":
+            if self.walk is None:
+                self.walk = dict(data)
+            else:
+                for k, v in data.items():
+                    self.walk[k] = self.walk.get(k, 0) + v
+        elif event == "writer":
+            writer = self.writers.setdefault(data["writer"], {"seconds": 0.0, "render_seconds": 0.0})
+            writer["seconds"] += data["seconds"]
+            writer["render_seconds"] += data["render_seconds"]
+
+    def start(self):
+        """
+        Registers the collector, and starts measuring the run
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._start = time.perf_counter()
+        add_hook(self)
+
+    def stop(self):
+        """
+        Unregisters the collector, and stops measuring the run
+        """
+        remove_hook(self)
+        self.seconds = time.perf_counter() - self._start
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def to_dict(self, top:int=10):
+        """
+        Converts the collected statistics to a JSON compatible dict
+        :param top: the number of the slowest files to include (None for every file)
+        :return: the dict of statistics
+        """
+        slowest = sorted(self.files, key=lambda f: f["seconds"], reverse=True)
+        return {
+            "seconds": self.seconds,
+            "peak_memory": self.peak_memory,
+            "files": len(self.files),
+            "bytes": sum(f["bytes"] for f in self.files),
+            "nodes": sum(f["nodes"] for f in self.files),
+            "cached": sum(1 for f in self.files if f["cached"]),
+            "parse_seconds": sum(f["seconds"] for f in self.files),
+            "stages": self.stages,
+            "writers": self.writers,
+            "walk": self.walk,
+            "slowest_files": slowest if top is None else slowest[:top]
+        }
+
+    def to_json(self, top:int=10):
+        """
+        Converts the collected statistics to JSON
+        :param top: the number of the slowest files to include (None for every file)
+        :return: the JSON text
+        """
+        # json is only imported when it is needed, so it does not slow down starting the command line
+        import json
+        return json.dumps(self.to_dict(top), indent=4)
+
+    def report(self, top:int=10):
+        """
+        Formats the collected statistics as a human readable report
+        :param top: the number of the slowest files to list
+        :return: the report
+        """
+
+        stats = self.to_dict(top)
+        lines = [
+            "Documented {} Files ({:.2f} MB, {} Nodes, {} Cached) In {:.3f}s".format(
+                stats["files"], stats["bytes"] / (1024 * 1024), stats["nodes"], stats["cached"], stats["seconds"]
+            )
+        ]
+        if stats["peak_memory"] is not None:
+            lines.append("Peak Memory: {:.2f} MB".format(stats["peak_memory"] / (1024 * 1024)))
+
+        # the directories and files which were skipped
+        if self.walk is not None:
+            lines.append("Walked {} Directories: Pruned {} Directories, Excluded {} Files, Skipped {} Large Files, {} Symlink Loops, {} Errors".format(
+                self.walk["dirs"], self.walk["pruned_dirs"], self.walk["excluded_files"], self.walk["large_files"],
+                self.walk["symlink_loops"], self.walk["errors"]
+            ))
+
+        # the time of each stage (the parse time is summed over every process)
+        lines.append("")
+        lines.append("Stages:")
+        lines.append("    {:<24}{:>10.3f}s".format("file_to_dict", stats["parse_seconds"]))
+        for name, stage in self.stages.items():
+            lines.append("    {:<24}{:>10.3f}s  ({} Calls)".format(name, stage["seconds"], stage["calls"]))
+        for name, writer in self.writers.items():
+            lines.append("    {:<24}{:>10.3f}s  ({:.3f}s Rendering)".format(name, writer["seconds"], writer["render_seconds"]))
+
+        # the slowest files
+        lines.append("")
+        lines.append("Slowest {} Files:".format(len(stats["slowest_files"])))
+        for f in stats["slowest_files"]:
+            lines.append("    {:>10.4f}s{:>12.1f} KB{:>10} Nodes  {}{}".format(
+                f["seconds"], f["bytes"] / 1024, f["nodes"], f["file"], " (Cached)" if f["cached"] else ""
+            ))
+
+        return "\n".join(lines)
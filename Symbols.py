@@ -0,0 +1,149 @@
+from Documenter.misc import iter_modules
+
+# the types of an arguement which are not the name of a symbol (see Py2Dict.parse_function)
+UNNAMED_TYPES = ("any", "unknown")
+
+
+class Symbol:
+    """
+    A module, class, or function which an arguement's type can refer to
+    """
+
+    __slots__ = ("kind", "name", "module")
+
+    def __init__(self, kind:str, name:str, module:str):
+        """
+        :param kind: the kind of symbol ("module", "class", or "function")
+        :param name: the symbol's full dotted name (ex. "package.module.Class.method")
+        :param module: the dotted name of the module which defines the symbol
+        """
+        self.kind = kind
+        self.name = name
+        self.module = module
+
+    def __eq__(self, other):
+        return isinstance(other, Symbol) and (self.kind, self.name, self.module) == (other.kind, other.name, other.module)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return "Symbol({!r}, {!r}, {!r})".format(self.kind, self.name, self.module)
+
+
+class SymbolIndex:
+    """
+    An index of the modules, classes and functions of a doc dict, by their full dotted name and each shorter name they can be
+    written as (ex. "package.module.Class" is also found as "module.Class" and "Class")
+    The index is built once, so each arguement's type is resolved with a few dict lookups, rather than by searching the doc dict
+    """
+
+    __slots__ = ("symbols", "suffixes")
+
+    def __init__(self, doc=None):
+        """
+        :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to index (None to start empty, see add_module)
+        """
+
+        # the symbols by their full dotted name, and by each shorter name (None if the shorter name is used by several symbols)
+        self.symbols = {}
+        self.suffixes = {}
+
+        if doc is not None:
+            self.add_doc(doc)
+
+    def add_doc(self, doc):
+        """
+        Adds every module of a doc dict to the index
+        :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to index
+        """
+        for name, mod in iter_modules(doc):
+            self.add_module(name, mod)
+
+    def add_module(self, name:str, mod):
+        """
+        Adds a module, and its classes and functions to the index
+        :param name: the module's dotted name
+        :param mod: the module's doc dict
+        """
+
+        self.add(Symbol("module", name, name))
+
+        for n in mod["functions"]:
+            self.add(Symbol("function", name + "." + n, name))
+
+        for n, c in mod["classes"].items():
+            class_name = name + "." + n
+            self.add(Symbol("class", class_name, name))
+            for m in c["func"]:
+                self.add(Symbol("function", class_name + "." + m, name))
+
+    def add(self, symbol:Symbol):
+        """
+        Adds a single symbol to the index (a symbol whose dotted name is already in the index is not added again)
+        :param symbol: the symbol
+        """
+
+        if symbol.name in self.symbols:
+            return
+
+        self.symbols[symbol.name] = symbol
+
+        # each shorter name, starting from the last part of the dotted name
+        parts = symbol.name.split(".")
+        suffixes = self.suffixes
+        for i in range(len(parts) - 1, 0, -1):
+            suffix = ".".join(parts[i:])
+            if suffix in suffixes:
+                suffixes[suffix] = None
+            else:
+                suffixes[suffix] = symbol
+
+    def resolve(self, name:str, module:str=None):
+        """
+        Finds the symbol an arguement's type refers to
+        A name defined in the module the type is written in is found first, then a full dotted name,
+        then a shorter name which only a single symbol is written as
+        :param name: the type (ex. "Class", or "module.Class")
+        :param module: the dotted name of the module the type is written in (None to not look in a module first)
+        :return: the symbol (None if the type does not refer to a single symbol)
+        """
+
+        if name in UNNAMED_TYPES:
+            return None
+
+        symbols = self.symbols
+        if module is not None:
+            symbol = symbols.get(module + "." + name)
+            if symbol is not None:
+                return symbol
+
+        symbol = symbols.get(name)
+        if symbol is not None:
+            return symbol
+        return self.suffixes.get(name)
+
+    def clear(self):
+        """
+        Removes every symbol from the index
+        """
+        self.symbols.clear()
+        self.suffixes.clear()
+
+    def __contains__(self, name):
+        return name in self.symbols
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return "SymbolIndex({} Symbols)".format(len(self))
+
+
+def build_symbol_index(doc):
+    """
+    Builds the symbol index of a doc dict (see SymbolIndex)
+    :param doc: the doc dict (or generator of (dotted name, module doc) pairs) to index
+    :return: the symbol index
+    """
+    return SymbolIndex(doc)
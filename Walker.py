@@ -0,0 +1,286 @@
+import os
+import re
+from typing import List
+
+from Documenter.Stats import hooks_enabled, emit
+
+
+def new_walk_stats():
+    """
+    Creates an empty dict of directory walk statistics (pass it to walk_python_files to have it filled in)
+        dirs: the number of directories scanned
+        files: the number of Python files found
+        pruned_dirs: the number of directories which were not entered (excluded, ignored, or deeper than the maximum depth)
+        excluded_files: the number of Python files which were excluded, ignored, or not included
+        large_files: the number of Python files which were larger than the maximum file size
+        symlink_loops: the number of symbolic links which were not followed, as their directory was already scanned
+        errors: the number of directories and files which could not be read
+    :return: the dict of walk statistics
+    """
+    return {"dirs": 0, "files": 0, "pruned_dirs": 0, "excluded_files": 0, "large_files": 0, "symlink_loops": 0, "errors": 0}
+
+
+def gitignore_to_regex(pattern:str):
+    """
+    Converts a .gitignore pattern (without its "!" or trailing "/") to a regular expression,
+    which matches paths relative to the directory of the .gitignore file
+    :param pattern: the pattern
+    :return: the compiled regular expression
+    """
+
+    # a pattern with a slash at the start or in the middle only matches relative to the .gitignore file,
+    # otherwise it matches at any level
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    output = "" if anchored else "(?:.*/)?"
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+
+        if pattern.startswith("**/", i):
+            # matches zero or more directories
+            output += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            # matches everything inside of a directory
+            output += ".*"
+            i += 2
+        elif c == "*":
+            output += "[^/]*"
+            i += 1
+        elif c == "?":
+            output += "[^/]"
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                output += re.escape(c)
+                i += 1
+            else:
+                group = pattern[i + 1:end]
+                if group.startswith("!"):
+                    group = "^" + group[1:]
+                output += "[" + group.replace("\\", "\\\\") + "]"
+                i = end + 1
+        elif c == "\\" and i + 1 < len(pattern):
+            output += re.escape(pattern[i + 1])
+            i += 2
+        else:
+            output += re.escape(c)
+            i += 1
+
+    # the contents of a matching directory do not need to match (the directory is pruned without being entered)
+    return re.compile(output)
+
+
+def read_gitignore(filename:str):
+    """
+    Reads the patterns of a .gitignore file
+    :param filename: the path to the .gitignore file
+    :return: a list of (regex, negated, directory only) rules, in the order of the file
+    """
+
+    output = []
+    try:
+        with open(filename, 'r', encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return output
+
+    for line in lines:
+
+        # trailing spaces are ignored, unless they are escaped
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+
+        # skip blank lines and comments
+        if line == "" or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+
+        # a trailing slash only matches directories
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if line == "":
+            continue
+
+        output.append((gitignore_to_regex(line), negated, dir_only))
+
+    return output
+
+
+def is_ignored(rules, rel_path:str, is_dir:bool):
+    """
+    Checks if a path is ignored by the .gitignore rules which apply to it (the last matching rule decides)
+    :param rules: a list of (directory relative to the walk's root, list of rules) of each .gitignore file, from the outermost
+    :param rel_path: the path relative to the walk's root (separated by "/")
+    :param is_dir: if the path is a directory
+    :return: if the path is ignored
+    """
+
+    ignored = False
+    for base, patterns in rules:
+
+        # the path relative to the .gitignore file's directory
+        if base == "":
+            sub = rel_path
+        elif rel_path.startswith(base + "/"):
+            sub = rel_path[len(base) + 1:]
+        else:
+            continue
+
+        for regex, negated, dir_only in patterns:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(sub) is not None:
+                ignored = not negated
+
+    return ignored
+
+
+def matches(patterns, rel_path:str):
+    """
+    Checks if an entry matches any of the compiled glob patterns (see gitignore_to_regex)
+    :param patterns: the list of compiled patterns
+    :param rel_path: the entry's path relative to the walk's root (separated by "/")
+    :return: if any pattern matches
+    """
+    for regex in patterns:
+        if regex.fullmatch(rel_path) is not None:
+            return True
+    return False
+
+
+def iter_python_entries(path:str, includes:List[str]=None, excludes:List[str]=None, gitignore:bool=False, max_depth:int=None,
+                        max_file_size:int=None, follow_symlinks:bool=False, stats:dict=None):
+    """
+    Walks a directory from the top down, so excluded directories are pruned without being entered,
+    and yields the Python files in the same order as os.walk(path, topdown=False) (each directory's subdirectories before its files)
+    :param path: the directory to walk
+    :param includes: the glob patterns of the files to document (None for "*.py")
+    :param excludes: the glob patterns of the directories and files to skip (None to not exclude anything,
+        see GlobalVariable.DEFAULT_EXCLUDES for the directories the command line skips)
+        The patterns use the .gitignore syntax: a pattern without a "/" matches names at any level (ex. "test_*.py"),
+        otherwise it matches paths relative to the walked directory (ex. "docs/*.py", "**/generated")
+    :param gitignore: If the .gitignore files in the walked directories are used to skip directories and files
+    :param max_depth: the maximum number of subdirectories to descend into (None for no limit, 0 for only the directory itself)
+    :param max_file_size: the size in bytes of the largest file to document (None for no limit)
+    :param follow_symlinks: If symbolic links to directories are followed (each directory is only scanned once, so loops are skipped)
+    :param stats: the dict of walk statistics to fill in (see new_walk_stats, None to not record them)
+    :return: a generator of the os.DirEntry of each Python file
+    """
+
+    if includes is None:
+        includes = ["*.py"]
+    if excludes is None:
+        excludes = []
+    if stats is None:
+        stats = new_walk_stats()
+
+    # compile the patterns once, rather than for every entry
+    includes = [gitignore_to_regex(p) for p in includes]
+    excludes = [gitignore_to_regex(p) for p in excludes]
+
+    # the directories which have been scanned (by device and inode), to avoid following a symbolic link loop
+    visited = set()
+
+    def walk(directory, rel_dir, depth, rules):
+        """
+        yields the Python files of a directory, after the Python files of its subdirectories
+        :param directory: the path to the directory
+        :param rel_dir: the directory's path relative to the walk's root ("" for the root)
+        :param depth: the number of subdirectories below the root
+        :param rules: the .gitignore rules which apply to the directory
+        """
+
+        try:
+            if follow_symlinks:
+                st = os.stat(directory)
+                if (st.st_dev, st.st_ino) in visited:
+                    stats["symlink_loops"] += 1
+                    return
+                visited.add((st.st_dev, st.st_ino))
+
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            stats["errors"] += 1
+            return
+
+        stats["dirs"] += 1
+
+        # the .gitignore file of this directory applies to everything inside of it
+        if gitignore:
+            ignore_file = os.path.join(directory, ".gitignore")
+            if os.path.isfile(ignore_file):
+                patterns = read_gitignore(ignore_file)
+                if len(patterns) > 0:
+                    rules = rules + [(rel_dir, patterns)]
+
+        files = []
+        for entry in entries:
+            rel_path = entry.name if rel_dir == "" else rel_dir + "/" + entry.name
+
+            try:
+                is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                if is_dir:
+                    # prune the directory without entering it
+                    if matches(excludes, rel_path) or (gitignore and is_ignored(rules, rel_path, True)) or \
+                            (max_depth is not None and depth >= max_depth):
+                        stats["pruned_dirs"] += 1
+                        continue
+
+                    # walk the subdirectory before this directory's files are yielded
+                    yield from walk(entry.path, rel_path, depth + 1, rules)
+                    continue
+
+                if not entry.is_file():
+                    continue
+            except OSError:
+                stats["errors"] += 1
+                continue
+
+            # only Python files are counted, so the other files in a directory do not inflate the statistics
+            if not matches(includes, rel_path):
+                if entry.name.endswith(".py"):
+                    stats["excluded_files"] += 1
+                continue
+            if matches(excludes, rel_path) or (gitignore and is_ignored(rules, rel_path, False)):
+                stats["excluded_files"] += 1
+                continue
+
+            if max_file_size is not None:
+                try:
+                    if entry.stat().st_size > max_file_size:
+                        stats["large_files"] += 1
+                        continue
+                except OSError:
+                    stats["errors"] += 1
+                    continue
+
+            files.append(entry)
+
+        stats["files"] += len(files)
+        yield from files
+
+    yield from walk(path, "", 0, [])
+
+    # report the statistics of the walk
+    if hooks_enabled():
+        emit("walk", dict(stats))
+
+
+def walk_python_files(path:str, includes:List[str]=None, excludes:List[str]=None, gitignore:bool=False, max_depth:int=None,
+                      max_file_size:int=None, follow_symlinks:bool=False, stats:dict=None):
+    """
+    Lists the Python files in a directory, and its subdirectories, skipping excluded directories without entering them
+    (see iter_python_entries for the arguements)
+    :return: the list of Python file paths
+    """
+    return [e.path for e in iter_python_entries(path, includes, excludes, gitignore, max_depth, max_file_size, follow_symlinks, stats)]
@@ -0,0 +1,131 @@
+import time
+
+from Documenter.Documenter import get_doc_from_file, get_doc_from_files
+from Documenter.GlobalVariable import WATCH_INTERVAL, WATCH_DEBOUNCE
+from Documenter.Walker import iter_python_entries
+from Documenter.misc import path_to_dot_notation, find_python_files
+
+
+def scan_python_files(path:str, walk_options:dict=None):
+    """
+    Gets the modification time and size of every Python file in a directory, and its subdirectories
+    :param path: the path to scan
+    :param walk_options: the options of the directory walk (see Walker.iter_python_entries)
+    :return: a dict of file paths, and their (modification time, size)
+    """
+
+    output = {}
+
+    # the skipped directories are pruned without being entered, so they are not polled either
+    for entry in iter_python_entries(path, **(walk_options or {})):
+        try:
+            stat = entry.stat()
+        except OSError:
+            # the file was removed while scanning
+            continue
+        output[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+    return output
+
+
+def watch_dir(path:str, write, start_dir=None, ignore_no_docstr:bool=False, workers:int=1, cache_dir:str=None, fast:bool=False,
+              interval:float=WATCH_INTERVAL, debounce:float=WATCH_DEBOUNCE, rebuilds:int=None, report=print, walk_options:dict=None, symbols=None):
+    """
+    Documents a directory, then watches it for changes, and re-documents only the modified, added and deleted files
+    :param path: the path to the files to generate documentation from
+    :param write: the function which outputs the doc dict (called with the doc dict after every rebuild)
+    :param start_dir: the relative path to start each file's display name (in dot notation)
+    :param ignore_no_docstr: If the system will ignore functions and classes without docstrings (allows private)
+    :param workers: the number of processes to use for the initial parse (0 or less uses every CPU core)
+    :param cache_dir: the directory to cache parsed files in (None to disable the cache)
+    :param fast: If the fast extractor is used (only parses the signatures and docstrings of each file)
+    :param interval: the number of seconds between each check for changes
+    :param debounce: the number of seconds the files must be unchanged for before rebuilding (groups bursts of saves)
+    :param rebuilds: the number of rebuilds to stop after (None to watch until interrupted)
+    :param report: the function which is called with each progress message
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :param symbols: the symbol index to keep up to date with the doc dict (see Symbols.SymbolIndex, None to not index the modules),
+        it is rebuilt before each time the output is written
+    :return: the final doc dict
+    """
+
+    # if no start dir is specified, set it to the provided path
+    if start_dir is None:
+        start_dir = path
+
+    # document the whole directory once
+    start = time.perf_counter()
+    snapshot = scan_python_files(path, walk_options)
+    doc = get_doc_from_files(find_python_files(path, walk_options), start_dir, ignore_no_docstr, workers, cache_dir, fast, symbols=symbols)
+    write(doc)
+    report("Documented {} Files In {:.3f}s, Watching For Changes...".format(len(snapshot), time.perf_counter() - start))
+
+    count = 0
+    try:
+        while rebuilds is None or count < rebuilds:
+            time.sleep(interval)
+
+            # check if any file has changed
+            current = scan_python_files(path, walk_options)
+            if current == snapshot:
+                continue
+
+            # wait until the files stop changing, so a burst of saves only causes one rebuild
+            while True:
+                time.sleep(debounce)
+                latest = scan_python_files(path, walk_options)
+                if latest == current:
+                    break
+                current = latest
+
+            start = time.perf_counter()
+
+            # find the modified, added, and deleted files
+            changed = [f for f, state in current.items() if snapshot.get(f) != state]
+            deleted = [f for f in snapshot if f not in current]
+
+            # remove the deleted files from the doc dict
+            for f in deleted:
+                doc.pop(path_to_dot_notation(f, start_dir), None)
+
+            # re-document the modified and added files
+            errors = 0
+            for f in changed:
+                try:
+                    val = get_doc_from_file(f, start_dir, ignore_no_docstr, cache_dir, fast, dotted_types=symbols is not None)
+                except Exception as e:
+                    # keep the previous documentation of a file which can not be parsed (it is probably being edited)
+                    report("Could Not Document {}: {}".format(f, e))
+                    errors += 1
+                    continue
+
+                # an empty file is removed from the doc dict
+                if val == {}:
+                    doc.pop(path_to_dot_notation(f, start_dir), None)
+                doc.update(val)
+
+            # put the modules in the order of the directory walk (an added file would otherwise be at the end),
+            # so the output is the same as documenting the directory again
+            names = [path_to_dot_notation(f, start_dir) for f in current]
+            doc = {n: doc[n] for n in names if n in doc}
+
+            # index the updated modules (the symbols of the deleted modules are removed with it)
+            if symbols is not None:
+                symbols.clear()
+                symbols.add_doc(doc)
+
+            # re-emit the output
+            write(doc)
+            snapshot = current
+            count += 1
+
+            report("Rebuilt {} Changed And {} Deleted Files In {:.3f}s{}".format(
+                len(changed) - errors, len(deleted), time.perf_counter() - start,
+                " ({} Failed)".format(errors) if errors > 0 else ""
+            ))
+
+    except KeyboardInterrupt:
+        pass
+
+    # return the doc dict
+    return doc
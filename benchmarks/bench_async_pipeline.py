@@ -0,0 +1,81 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from Documenter.AsyncPipeline import aget_doc_from_dir, aiter_doc_from_dir, adoc_to_formats
+from Documenter.Documenter import get_doc_from_dir, iter_doc_from_dir, doc_to_html
+from Documenter.benchmarks.corpus import generate_package
+
+
+async def measure_lag(coroutine, interval:float=0.01):
+    """
+    Runs a coroutine, while measuring how late a timer on the same event loop wakes up
+    :param coroutine: the coroutine to run
+    :param interval: the number of seconds between each timer
+    :return: the time taken (in seconds), and the longest the timer was late (in seconds)
+    """
+
+    lag = [0.0]
+    done = [False]
+
+    async def ticker():
+        while not done[0]:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag[0] = max(lag[0], time.perf_counter() - start - interval)
+
+    tick = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await coroutine
+    total = time.perf_counter() - start
+
+    done[0] = True
+    await tick
+    return total, lag[0]
+
+
+def main(files:int=200, workers:int=2):
+    """
+    Compares documenting a synthetic package (and writing it as HTML) from an event loop
+    directly, on a thread, and with the asyncio pipeline, measuring how long the event loop is blocked
+    :param files: the number of modules in the synthetic package
+    :param workers: the number of processes the asyncio pipeline parses with
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "package")
+        generate_package(path, files=files, body_lines=50)
+
+        async def blocking():
+            doc_to_html(get_doc_from_dir(path), os.path.join(tmp, "blocking.html"))
+
+        async def thread():
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: doc_to_html(iter_doc_from_dir(path), os.path.join(tmp, "thread.html")))
+
+        async def pipeline():
+            await adoc_to_formats(aiter_doc_from_dir(path, workers=workers), [("html", os.path.join(tmp, "pipeline.html"))])
+
+        async def run():
+            return [(name, await measure_lag(c())) for name, c in [
+                ("Blocking", blocking), ("Thread", thread), ("Pipeline ({} Workers)".format(workers), pipeline)
+            ]]
+
+        results = asyncio.run(run())
+
+        # ensure the outputs are the same
+        with open(os.path.join(tmp, "blocking.html")) as a, open(os.path.join(tmp, "pipeline.html")) as b:
+            assert a.read() == b.read()
+        assert asyncio.run(aget_doc_from_dir(path)) == get_doc_from_dir(path)
+
+    print("{} Files".format(files))
+    for name, (total, lag) in results:
+        print("{:<24}{:>8.3f}s, Event Loop Blocked For Up To {:.1f}ms".format(name, total, lag * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
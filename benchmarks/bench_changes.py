@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from Documenter.benchmarks.corpus import generate_package, generate_source
+
+
+def run_cli(*args):
+    """
+    Runs the command line, and waits for it to finish
+    :param args: the command line arguements
+    :return: the time taken (in seconds)
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "Documenter.Documenter"] + list(args), check=True)
+    return time.perf_counter() - start
+
+
+def git(path:str, *args):
+    """
+    Runs a git command in a repository
+    :param path: the repository
+    :param args: the git command's arguements
+    """
+    subprocess.run(["git", "-C", path] + list(args), check=True, stdout=subprocess.DEVNULL)
+
+
+def main(files:int=1000, changed:int=10):
+    """
+    Documents a synthetic package in a git repository, changes a few of its files (and renames, deletes and adds one),
+    then compares documenting the whole package again against only parsing the changed files (--since and --base),
+    and checks both outputs are the same
+    :param files: the number of modules in the synthetic package
+    :param changed: the number of modules changed
+    """
+
+    if shutil.which("git") is None:
+        print("Git Is Not Installed")
+        return
+
+    formats = "txt,html"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "package")
+        modules = generate_package(path, files=files, depth=2)
+        git(path, "init", "-q")
+        git(path, "add", "-A")
+        git(path, "-c", "user.name=bench", "-c", "user.email=bench@example.com", "commit", "-q", "-m", "base")
+
+        # the snapshot of the previous full run
+        base = os.path.join(tmp, "base.snapshot")
+        run_cli("snapshot", path, base)
+
+        # change a docstring in a few modules, and rename, delete and add a module (without committing the changes)
+        for filename in modules[:changed]:
+            with open(filename, 'r') as f:
+                source = f.read()
+            with open(filename, 'w') as f:
+                f.write(source.replace('"""', '"""changed ', 1))
+        git(path, "mv", modules[-1], os.path.join(os.path.dirname(modules[-1]), "renamed.py"))
+        os.remove(modules[-2])
+        with open(os.path.join(path, "added.py"), 'w') as f:
+            f.write(generate_source(seed=files))
+
+        def outputs(prefix):
+            return ",".join(os.path.join(tmp, prefix + "." + f) for f in formats.split(","))
+
+        full_time = run_cli(formats, path, outputs("full"))
+        changes_time = run_cli(formats, path, outputs("changes"), "--since", "HEAD", "--base", base)
+
+        # ensure only parsing the changed files gives the same outputs as documenting the whole package
+        for f in formats.split(","):
+            with open(os.path.join(tmp, "full." + f), 'rb') as a, open(os.path.join(tmp, "changes." + f), 'rb') as b:
+                assert a.read() == b.read(), f
+
+    print("{} Files, {} Changed, 1 Renamed, 1 Deleted, 1 Added ({})".format(files, changed, formats))
+    print("Whole Package: {:.3f}s".format(full_time))
+    print("--since And --base: {:.3f}s".format(changes_time))
+    print("The Outputs Are The Same")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000, int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,81 @@
+import copy
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from Documenter.Diff import diff_docs
+from Documenter.Output.outTxt import doc_to_txt
+from Documenter.Snapshot import doc_to_snapshot, DocSnapshot
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def changed_doc(doc:dict, every:int=100):
+    """
+    Copies a doc dict, and changes a function's docstring and default value in every few modules
+    :param doc: the doc dict
+    :param every: the number of modules between each changed module
+    :return: the changed doc dict, and the number of functions changed
+    """
+
+    output = copy.deepcopy(doc)
+    changed = 0
+    for i, mod in enumerate(output.values()):
+        if i % every == 0:
+            func = next(iter(mod["functions"].values()))
+            func["doc"] += " changed"
+            func["args"][0]["value"] = "changed"
+            changed += 1
+    return output, changed
+
+
+def main(modules:int=5000):
+    """
+    Compares diffing the text output of two versions of a synthetic corpus, against diff_docs on the doc dicts and on snapshots
+    (each module has 5 functions, and a class with 5 methods, so 5000 modules have 50000 functions)
+    :param modules: the number of modules in the corpus
+    """
+
+    old = generate_doc(modules=modules, functions=5, classes=1, methods=5, args=3)
+    new, changed = changed_doc(old)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_file = os.path.join(tmp, "old.snapshot")
+        new_file = os.path.join(tmp, "new.snapshot")
+        doc_to_snapshot(old, old_file)
+        doc_to_snapshot(new, new_file)
+
+        # the text outputs are compared with the diff command, if it is installed (difflib takes minutes on outputs this large)
+        text_time = None
+        if shutil.which("diff") is not None:
+            start = time.perf_counter()
+            doc_to_txt(old, os.path.join(tmp, "old.txt"))
+            doc_to_txt(new, os.path.join(tmp, "new.txt"))
+            lines = subprocess.run(
+                ["diff", "-u", os.path.join(tmp, "old.txt"), os.path.join(tmp, "new.txt")], stdout=subprocess.PIPE
+            ).stdout.count(b"\n")
+            text_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dict_changes = diff_docs(old, new)
+        dict_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with DocSnapshot(old_file) as a, DocSnapshot(new_file) as b:
+            snapshot_changes = diff_docs(a, b)
+        snapshot_time = time.perf_counter() - start
+
+    # ensure both find every changed function
+    assert dict_changes == snapshot_changes and len(dict_changes) == changed
+
+    print("{} Modules, {} Functions, {} Changed".format(modules, modules * 10, changed))
+    if text_time is not None:
+        print("{:<32}{:>8.3f}s ({} Lines)".format("doc_to_txt And diff -u", text_time, lines))
+    print("{:<32}{:>8.3f}s".format("diff_docs (Doc Dicts)", dict_time))
+    print("{:<32}{:>8.3f}s".format("diff_docs (Snapshots)", snapshot_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
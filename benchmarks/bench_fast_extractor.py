@@ -0,0 +1,115 @@
+import ast
+import glob
+import os
+import sys
+import sysconfig
+import time
+
+from Documenter.FastExtractor import skeleton_source
+from Documenter.Py2Dict import tree_to_dict
+from Documenter.benchmarks.corpus import generate_source
+
+
+def extract(source:str, fast:bool):
+    """
+    Generates the doc dict of some source, the same way file_to_dict does
+    :param source: the Python source
+    :param fast: If the fast extractor is used (falls back to the ast module if the skeleton can not be used)
+    :return: the doc dict, or the type of the exception raised
+    """
+    try:
+        if fast:
+            try:
+                return tree_to_dict(ast.parse(skeleton_source(source)), False)
+            except Exception:
+                pass
+        return tree_to_dict(ast.parse(source), False)
+    except Exception as e:
+        return type(e)
+
+
+def check_parity(sources):
+    """
+    Checks the fast extractor produces the same doc dict as the ast module
+    The fast extractor does not check the syntax of the code it skips, so files with syntax errors outside of the
+    signatures and docstrings are documented, instead of raising a SyntaxError (these are counted separately)
+    :param sources: a dict of names, and their source
+    :return: the number of sources which were the same, the number with skipped syntax errors, and the list of the names of those which were different
+    """
+    same = 0
+    lenient = 0
+    different = []
+    for name, source in sources.items():
+        fast = extract(source, True)
+        full = extract(source, False)
+        if fast == full:
+            same += 1
+        elif full is SyntaxError and isinstance(fast, dict):
+            lenient += 1
+        else:
+            different.append(name)
+    return same, lenient, different
+
+
+def throughput(sources, fast:bool):
+    """
+    Measures the throughput of an extractor
+    :param sources: a dict of names, and their source
+    :param fast: If the fast extractor is used
+    :return: the number of megabytes extracted per second
+    """
+    size = sum(len(s) for s in sources.values())
+    start = time.perf_counter()
+    for source in sources.values():
+        extract(source, fast)
+    return size / (time.perf_counter() - start) / 1024 / 1024
+
+
+def read_sources(pattern:str):
+    """
+    Reads every file which matches a glob pattern
+    :param pattern: the glob pattern
+    :return: a dict of the file names, and their source
+    """
+    output = {}
+    for filename in sorted(glob.glob(pattern, recursive=True)):
+        try:
+            with open(filename, 'r', encoding="utf-8") as f:
+                output[filename] = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+    return output
+
+
+def main():
+    """
+    Checks the parity of the fast extractor on the standard library, this package, and generated files,
+    then compares the throughput of both extractors on large generated files
+    """
+
+    corpora = {
+        "standard library": read_sources(os.path.join(sysconfig.get_paths()["stdlib"], "**", "*.py")),
+        "Documenter": read_sources(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "**", "*.py")),
+        "generated": {"generated{}".format(i): generate_source(body_lines=i * 5, seed=i) for i in range(20)}
+    }
+
+    failed = False
+    for name, sources in corpora.items():
+        same, lenient, different = check_parity(sources)
+        print("Parity ({}): {}/{} Files Identical, {} With Syntax Errors In Skipped Code".format(name, same, len(sources), lenient))
+        for d in different[:10]:
+            print("\tDifferent: {}".format(d))
+        failed = failed or len(different) > 0
+
+    # large files with long function bodies (where skipping the bodies matters most)
+    large = {"large{}".format(i): generate_source(functions=50, classes=20, methods=10, body_lines=40, seed=i) for i in range(5)}
+    print("Generated {:.1f} MB Of Source".format(sum(len(s) for s in large.values()) / 1024 / 1024))
+    print("ast:  {:.2f} MB/s".format(throughput(large, False)))
+    print("fast: {:.2f} MB/s".format(throughput(large, True)))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Documenter.Output import outJSON
+from Documenter.Output.outJSON import doc_to_json, doc_to_ndjson
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def measure(function):
+    """
+    Runs a function twice, measuring the time taken, then the peak memory used
+    (tracemalloc slows Python down, so the time is measured without it)
+    :param function: the function to run
+    :return: the time taken (in seconds), and the peak memory (in bytes)
+    """
+    start = time.perf_counter()
+    function()
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total, peak
+
+
+def main(modules:int=2000):
+    """
+    Compares writing a synthetic corpus as JSON with json.dumps on the whole doc dict, against the streaming
+    JSON, indented JSON and NDJSON writers (with orjson if it is installed)
+    :param modules: the number of modules in the corpus
+    """
+
+    doc = generate_doc(modules=modules, functions=10, classes=2, methods=5, args=3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def whole():
+            with open(os.path.join(tmp, "whole.json"), 'w') as f:
+                f.write(json.dumps(doc, indent=2, ensure_ascii=False))
+
+        results = [
+            ("json.dumps (Indented)", measure(whole)),
+            ("doc_to_json", measure(lambda: doc_to_json(doc, os.path.join(tmp, "docs.json")))),
+            ("doc_to_json (Indented)", measure(lambda: doc_to_json(doc, os.path.join(tmp, "indented.json"), indent=2))),
+            ("doc_to_ndjson", measure(lambda: doc_to_ndjson(doc, os.path.join(tmp, "docs.ndjson"))))
+        ]
+
+        # ensure the streamed output is the same as json.dumps
+        with open(os.path.join(tmp, "whole.json")) as a, open(os.path.join(tmp, "indented.json")) as b:
+            assert a.read() == b.read()
+        size = os.path.getsize(os.path.join(tmp, "whole.json"))
+
+    print("{} Modules ({:.1f}MB Of JSON), Encoder: {}".format(modules, size / 1024 / 1024, "orjson" if outJSON.orjson is not None else "json"))
+    for name, (total, peak) in results:
+        print("{:<24}{:>8.3f}s, Peak Memory {:.1f}MB".format(name, total, peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,43 @@
+import gc
+import sys
+import tracemalloc
+
+from Documenter.DocModel import compact_doc
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def measure(build):
+    """
+    Measures the memory held by the result of a function
+    :param build: the function which builds the value to measure
+    :return: the value, and the number of bytes it holds
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return value, size
+
+
+def main(modules:int=2000):
+    """
+    Compares the memory used by the plain doc dict, and the compact doc model of the same synthetic corpus
+    :param modules: the number of modules in the corpus
+    """
+
+    kwargs = {"modules": modules, "functions": 10, "classes": 3, "methods": 6, "args": 3}
+
+    # build the same corpus in both forms (the compact model is converted one module at a time)
+    doc, dict_size = measure(lambda: generate_doc(**kwargs))
+    model, model_size = measure(lambda: compact_doc(iter(generate_doc(**kwargs).items())))
+
+    print("Modules: {}".format(len(doc)))
+    print("doc dict:      {:>8.1f} MB".format(dict_size / 1024 / 1024))
+    print("compact model: {:>8.1f} MB ({:.0%} of the doc dict)".format(model_size / 1024 / 1024, model_size / dict_size))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import time
+
+from Documenter.Documenter import iter_doc_from_dir
+from Documenter.Output.outMulti import doc_to_formats, OUTPUT_TYPES
+from Documenter.benchmarks.corpus import generate_package
+
+
+def main(files:int=200):
+    """
+    Compares writing the txt, html, md and json outputs from a single parse, against parsing the package once for each output
+    :param files: the number of modules in the synthetic package
+    """
+
+    formats = ["txt", "html", "md", "json"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "package")
+        generate_package(path, files=files)
+
+        # parse the package once for each output (the same as running the command line once for each file type)
+        start = time.perf_counter()
+        for f in formats:
+            OUTPUT_TYPES[f](iter_doc_from_dir(path), os.path.join(tmp, "separate." + f))
+        separate_time = time.perf_counter() - start
+
+        # parse the package once, and write every output from it
+        start = time.perf_counter()
+        doc_to_formats(iter_doc_from_dir(path), [(f, os.path.join(tmp, "single." + f)) for f in formats])
+        single_time = time.perf_counter() - start
+
+        # ensure the outputs are the same
+        for f in formats:
+            with open(os.path.join(tmp, "separate." + f)) as a, open(os.path.join(tmp, "single." + f)) as b:
+                assert a.read() == b.read(), f
+
+    print("{} Files, {}".format(files, ", ".join(formats)))
+    print("Parsed Once For Each Output: {:.3f}s".format(separate_time))
+    print("Parsed Once (doc_to_formats): {:.3f}s".format(single_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
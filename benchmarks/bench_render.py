@@ -0,0 +1,155 @@
+import sys
+import time
+
+from Documenter.GlobalVariable import MISSING_DOCSTRING_MESSAGE
+from Documenter.Output.outHTML import doc_to_html
+from Documenter.Output.outMD import doc_to_md
+from Documenter.Output.outTxt import doc_to_txt
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def legacy_module2ascii(mod:dict):
+    """
+    The ASCII tree renderer before the outputs were rendered with templates (see Output/render.py), kept to compare against
+    :param mod: the module's doc dict
+    :return: the module in a text ASCII tree format
+    """
+
+    output = [mod["file"] + "\n"]
+    if len(mod["classes"]) < 1 and len(mod["functions"]) < 1:
+        output.append("\tThis File Does Not Contain Any Functions Or Classes.\n\n")
+
+    if len(mod["classes"]) > 0:
+        output.append("\tClasses:\n")
+        for name, c in mod["classes"].items():
+            output.append("\t\t" + name + "\n")
+            if c["doc"] != MISSING_DOCSTRING_MESSAGE:
+                output.append("\t\t\t" + c["doc"].replace("\n\t", "\n").replace(":param ", "").replace(":return: ", "Returns ") + "\n")
+            output.append("\t\t\tMethods:\n")
+            for n, f in c["func"].items():
+                if not n.startswith("__"):
+                    output.append(legacy_display_function(4, n, f))
+
+    if len(mod["functions"]) > 0:
+        output.append("\tFunctions:\n")
+        for n, f in mod["functions"].items():
+            output.append(legacy_display_function(2, n, f))
+
+    return "".join(output)
+
+
+def legacy_display_function(tab_level:int, func_name, func):
+    """
+    The function renderer before the outputs were rendered with templates, kept to compare against
+    :param tab_level: the number of tabs to place before the function
+    :param func_name: the function's display name
+    :param func: the function as a dict
+    :return: the ASCII tree function
+    """
+
+    base_tab = "\t" * tab_level
+    output_text = base_tab + func_name + "\n"
+    display_params = not(":param " in func["doc"] or ":return:" in func["doc"])
+
+    if func["doc"] != MISSING_DOCSTRING_MESSAGE:
+        for i in func["doc"].split("\n"):
+            if ":param " in i or ":return:" in i:
+                output_text += base_tab + "\t\t" + i.replace("\t", "").replace(":param ", "").replace(":return:", "Returns") + "\n"
+            else:
+                output_text += base_tab + "\t\t" + i.replace("\t", "").replace("\n", "\n\t\t") + "\n"
+
+    if len(func["args"]) > 0 and display_params:
+        output_text += base_tab + "\tArguements:\n"
+        for arg in func["args"]:
+            output_text += base_tab + "\t\t" + arg["name"]
+            if arg["type"] != "any":
+                output_text += " (" + arg["type"] + ")"
+            if arg["value"] is not None:
+                output_text += " = " + str(arg["value"])
+            output_text += "\n"
+        output_text += "\n"
+
+    return output_text
+
+
+def legacy_html(doc:dict):
+    """
+    Renders the doc dict as HTML by rendering the ASCII tree, then converting it (the same as doc_to_html before templates)
+    :param doc: the doc dict
+    :return: the HTML text
+    """
+    return "<div>" + "".join(
+        legacy_module2ascii(mod).replace("\t", "&nbsp;" * 4).replace("\n", "<br>") for mod in doc.values()
+    ) + "</div>"
+
+
+def legacy_md(doc:dict):
+    """
+    Renders the doc dict as markdown by rendering the ASCII tree, then converting it (the same as doc_to_md before templates)
+    :param doc: the doc dict
+    :return: the markdown text
+    """
+    return "".join(legacy_module2ascii(mod).replace("\t", "&nbsp;" * 4).replace("\n", "\n\n") for mod in doc.values())
+
+
+def extracted_docstring(text:str, index:int):
+    """
+    Formats a generated docstring the way Py2Dict extracts docstrings (several lines, each indented with tabs),
+    with every other docstring describing its arguements
+    :param text: the generated docstring
+    :param index: the function's position (used to decide if the docstring describes its arguements)
+    :return: the formatted docstring
+    """
+    words = text.split(" ")
+    lines = [" ".join(words[i:i + 8]) for i in range(0, len(words), 8)]
+    if index % 2 == 0:
+        lines += [":param arg0: " + lines[0], ":param arg1: " + lines[-1], ":return: " + lines[0]]
+    return "\n\t\t\t\t".join(lines)
+
+
+def best_time(function, runs:int=3):
+    """
+    Runs a function several times
+    :param function: the function to run
+    :param runs: the number of times to run it
+    :return: the value it returned, and the shortest time taken (in seconds)
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        value = function()
+        times.append(time.perf_counter() - start)
+    return value, min(times)
+
+
+def main(modules:int=5000):
+    """
+    Compares rendering a synthetic corpus with the templates against rendering the ASCII tree and converting it,
+    and checks the outputs are the same
+    :param modules: the number of modules in the corpus
+    """
+
+    # multi-line docstrings, so every docstring is split into lines and indented
+    doc = generate_doc(modules=modules, functions=10, classes=2, methods=5, args=3, doc_length=40)
+    for mod in doc.values():
+        for functions in [mod["functions"]] + [c["func"] for c in mod["classes"].values()]:
+            for i, func in enumerate(functions.values()):
+                func["doc"] = extracted_docstring(func["doc"], i)
+
+    print("{} Modules".format(modules))
+    for name, legacy, current in [
+        ("txt", lambda: "".join(legacy_module2ascii(mod) for mod in doc.values()), lambda: doc_to_txt(doc)),
+        ("html", lambda: legacy_html(doc), lambda: doc_to_html(doc)),
+        ("md", lambda: legacy_md(doc), lambda: doc_to_md(doc))
+    ]:
+        legacy_text, legacy_time = best_time(legacy)
+        text, current_time = best_time(current)
+        assert text == legacy_text, name
+
+        print("{:<6}ASCII Tree, Then Converted: {:.3f}s, Templates: {:.3f}s ({:.1f}MB)".format(
+            name, legacy_time, current_time, len(text) / 1024 / 1024
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from Documenter.Output.outSQLite import doc_to_sqlite_db
+from Documenter.Search import search_docs
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def percentile(times, p:float):
+    """
+    gets a percentile of a list of times
+    :param times: the list of times
+    :param p: the percentile (0 to 1)
+    :return: the time at the percentile
+    """
+    times = sorted(times)
+    return times[min(len(times) - 1, int(len(times) * p))]
+
+
+def main(function_count:int=300000, queries:int=200):
+    """
+    Writes a synthetic corpus with the specified number of functions into a SQLite3 database with a search index,
+    and compares the latency of searching it against scanning the docstrings with LIKE
+    :param function_count: the total number of functions (and methods) in the corpus
+    :param queries: the number of queries to time
+    """
+
+    # 10 functions, and 2 classes of 5 methods in each module (with 5000 extra words, so each word only matches some docstrings)
+    doc = generate_doc(modules=max(1, function_count // 20), functions=10, classes=2, methods=5, args=3, vocabulary=5000)
+    words = ["term{}".format(i * 37 % 5000) for i in range(queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "docs.db")
+
+        start = time.perf_counter()
+        doc_to_sqlite_db(doc, db)
+        plain_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        doc_to_sqlite_db(doc, db, search_index=True)
+        index_time = time.perf_counter() - start
+
+        # the latency of each search
+        search_times = []
+        for w in words:
+            start = time.perf_counter()
+            search_docs(db, w)
+            search_times.append(time.perf_counter() - start)
+
+        # the latency of finding every matching docstring by scanning them (ranking the results needs every match)
+        conn = sqlite3.connect(db)
+        like_times = []
+        for w in words:
+            start = time.perf_counter()
+            conn.execute("SELECT `name` FROM `functions` WHERE `docstring` LIKE ?", ("%" + w + "%",)).fetchall()
+            like_times.append(time.perf_counter() - start)
+        rows = conn.execute("SELECT COUNT(*) FROM `search`").fetchone()[0]
+        conn.close()
+
+    print("{} Functions, {} Rows In The Search Index".format(function_count, rows))
+    print("doc_to_sqlite_db: {:.3f}s, With The Search Index: {:.3f}s".format(plain_time, index_time))
+    print("search_docs: p50 {:.2f}ms, p95 {:.2f}ms".format(percentile(search_times, 0.5) * 1000, percentile(search_times, 0.95) * 1000))
+    print("LIKE Scan:   p50 {:.2f}ms, p95 {:.2f}ms".format(percentile(like_times, 0.5) * 1000, percentile(like_times, 0.95) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from Documenter.benchmarks.corpus import generate_package
+
+
+def run_cli(*args):
+    """
+    Runs the command line in a new process
+    :param args: the command line arguements
+    :return: the process (once it has been started)
+    """
+    return subprocess.Popen([sys.executable, "-m", "Documenter.Documenter"] + list(args))
+
+
+def main(files:int=200, shards:int=4):
+    """
+    Documents a synthetic package split into shards, with a process standing in for each machine, merges the shards,
+    and compares the time taken with documenting the package in a single process
+    (tests/test_shard.py checks the merged output is the same)
+    :param files: the number of modules in the synthetic package
+    :param shards: the number of shards
+    """
+
+    formats = "txt,html,json"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "package")
+        generate_package(path, files=files, depth=2)
+
+        def outputs(prefix):
+            return ",".join(os.path.join(tmp, prefix + "." + f) for f in formats.split(","))
+
+        # document the package in a single process
+        start = time.perf_counter()
+        assert run_cli(formats, path, outputs("single")).wait() == 0
+        single_time = time.perf_counter() - start
+
+        # document each shard in its own process (at the same time), then merge them
+        start = time.perf_counter()
+        snapshots = [os.path.join(tmp, "shard{}.pickle".format(i)) for i in range(1, shards + 1)]
+        processes = [run_cli(path, snapshots[i - 1], "--shard", "{}/{}".format(i, shards)) for i in range(1, shards + 1)]
+        assert all(p.wait() == 0 for p in processes)
+        shard_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert run_cli("merge", formats, *(snapshots[::-1] + [outputs("merged")])).wait() == 0
+        merge_time = time.perf_counter() - start
+
+        sizes = [os.path.getsize(s) for s in snapshots]
+
+    print("{} Files, {} Shards ({})".format(files, shards, formats))
+    print("Single Process: {:.3f}s".format(single_time))
+    print("Shards: {:.3f}s (Partial Snapshots Of {} To {} KB), Merge: {:.3f}s".format(
+        shard_time, min(sizes) // 1024, max(sizes) // 1024, merge_time
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, int(sys.argv[2]) if len(sys.argv) > 2 else 4)
@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+from Documenter.Output.outJSON import doc_to_json
+from Documenter.Snapshot import doc_to_snapshot, DocSnapshot, load_snapshot
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def main(modules:int=5000):
+    """
+    Compares reading a single module, and every module, from a binary snapshot against a JSON file of a synthetic corpus
+    :param modules: the number of modules in the corpus
+    """
+
+    doc = generate_doc(modules=modules, functions=10, classes=2, methods=5, args=3)
+    name = list(doc)[modules // 2]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = os.path.join(tmp, "docs.json")
+        snapshot_file = os.path.join(tmp, "docs.snapshot")
+
+        start = time.perf_counter()
+        doc_to_json(doc, json_file)
+        json_write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        doc_to_snapshot(doc, snapshot_file)
+        snapshot_write = time.perf_counter() - start
+
+        # read a single module (the JSON file must be read in full)
+        start = time.perf_counter()
+        with open(json_file) as f:
+            json_module = json.load(f)[name]
+        json_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with DocSnapshot(snapshot_file) as snapshot:
+            snapshot_module = snapshot[name]
+        snapshot_one = time.perf_counter() - start
+
+        # read every module
+        start = time.perf_counter()
+        with open(json_file) as f:
+            json.load(f)
+        json_all = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = load_snapshot(snapshot_file)
+        snapshot_all = time.perf_counter() - start
+
+        # ensure the snapshot is the same as the doc dict it was written from
+        assert snapshot_module == json_module == doc[name]
+        assert loaded == doc and list(loaded) == list(doc)
+
+        sizes = os.path.getsize(json_file), os.path.getsize(snapshot_file)
+
+    print("{} Modules (JSON {:.1f}MB, Snapshot {:.1f}MB)".format(modules, sizes[0] / 1024 / 1024, sizes[1] / 1024 / 1024))
+    print("{:<18}{:>12}{:>12}".format("", "JSON", "Snapshot"))
+    print("{:<18}{:>11.3f}s{:>11.3f}s".format("Write", json_write, snapshot_write))
+    print("{:<18}{:>11.3f}s{:>11.3f}s".format("Read One Module", json_one, snapshot_one))
+    print("{:<18}{:>11.3f}s{:>11.3f}s".format("Read Every Module", json_all, snapshot_all))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from Documenter.Output.outSQLite import doc_to_sqlite, doc_to_sqlite_db
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def main(function_count:int=100000):
+    """
+    Writes a synthetic corpus with the specified number of functions directly into a SQLite3 database,
+    checks every row was loaded, and compares the time taken against generating the file of SQLite3 commands
+    :param function_count: the total number of functions (and methods) in the corpus
+    """
+
+    # 10 functions, and 2 classes of 5 methods in each module
+    doc = generate_doc(modules=max(1, function_count // 20), functions=10, classes=2, methods=5, args=3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "docs.db")
+
+        start = time.perf_counter()
+        doc_to_sqlite_db(doc, db)
+        db_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        doc_to_sqlite(doc, os.path.join(tmp, "docs.sql"))
+        sql_time = time.perf_counter() - start
+
+        # ensure every row was loaded
+        conn = sqlite3.connect(db)
+        counts = {t: conn.execute("SELECT COUNT(*) FROM `{}`".format(t)).fetchone()[0] for t in ["files", "classes", "functions", "args"]}
+        conn.close()
+
+    assert counts["functions"] == sum(len(m["functions"]) + sum(len(c["func"]) for c in m["classes"].values()) for m in doc.values())
+    assert counts["args"] == counts["functions"] * 3
+
+    print("Rows: {}".format(counts))
+    print("doc_to_sqlite_db: {:.3f}s".format(db_time))
+    print("doc_to_sqlite (commands file only, not loaded): {:.3f}s".format(sql_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
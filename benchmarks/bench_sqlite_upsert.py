@@ -0,0 +1,78 @@
+import copy
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from Documenter.Output.outSQLite import doc_to_sqlite_db
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def dump(db:str):
+    """
+    Reads every row of the documentation tables of a database, with each id replaced by the name it refers to
+    (the rows of changed modules are inserted again, so their ids are not the same as reloading the database)
+    :param db: the database file
+    :return: a dict of each table's rows
+    """
+    conn = sqlite3.connect(db)
+    try:
+        return {
+            "files": sorted(conn.execute("SELECT name, hash FROM files").fetchall()),
+            "classes": sorted(conn.execute(
+                "SELECT f.name, c.name, c.docstring FROM classes c JOIN files f ON f.id = c.fileId"
+            ).fetchall()),
+            "functions": sorted(conn.execute(
+                "SELECT f.name, IFNULL(c.name, ''), fn.name, fn.docstring FROM functions fn JOIN files f ON f.id = fn.fileId "
+                "LEFT JOIN classes c ON c.id = fn.classId"
+            ).fetchall()),
+            "args": sorted(conn.execute(
+                "SELECT f.name, IFNULL(c.name, ''), fn.name, a.`order`, a.name, IFNULL(a.type, ''), IFNULL(a.value, '') FROM args a "
+                "JOIN functions fn ON fn.id = a.functionId JOIN files f ON f.id = fn.fileId LEFT JOIN classes c ON c.id = fn.classId"
+            ).fetchall())
+        }
+    finally:
+        conn.close()
+
+
+def main(function_count:int=100000, changed:int=1):
+    """
+    Compares reloading a database of a synthetic corpus against updating it incrementally after a few modules changed,
+    and checks the updated database is the same as reloading it
+    :param function_count: the total number of functions (and methods) in the corpus
+    :param changed: the number of modules to change
+    """
+
+    # 10 functions, and 2 classes of 5 methods in each module
+    doc = generate_doc(modules=max(1, function_count // 20), functions=10, classes=2, methods=5, args=3)
+
+    # change the docstrings of the first few modules' functions
+    new_doc = copy.deepcopy(doc)
+    for name in list(new_doc)[:changed]:
+        for func in new_doc[name]["functions"].values():
+            func["doc"] += " (Changed)"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full = os.path.join(tmp, "full.db")
+        db = os.path.join(tmp, "docs.db")
+        doc_to_sqlite_db(doc, db, incremental=True)
+
+        start = time.perf_counter()
+        doc_to_sqlite_db(new_doc, full)
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        counts = doc_to_sqlite_db(new_doc, db, incremental=True)
+        upsert_time = time.perf_counter() - start
+
+        # ensure the updated database is the same as reloading it
+        assert dump(db) == dump(full)
+
+    print("{} Modules, {} Changed: {}".format(len(doc), changed, counts))
+    print("Full Reload: {:.3f}s".format(full_time))
+    print("Incremental: {:.3f}s".format(upsert_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else 1)
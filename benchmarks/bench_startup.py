@@ -0,0 +1,102 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from Documenter.Output.outMulti import OUTPUT_TYPES
+from Documenter.benchmarks.corpus import generate_package
+
+# runs the command line, then writes the output modules which were imported to a file
+# (importlib.import_module is not reported by -X importtime, so the imported modules are read from sys.modules)
+RUNNER = """
+import json, runpy, sys
+modules_file, eager = sys.argv[1], sys.argv[2] == "1"
+sys.argv = ["Documenter"] + sys.argv[3:]
+if eager:
+    from Documenter.Output.outMulti import OUTPUT_TYPES
+    for output_type in list(OUTPUT_TYPES):
+        OUTPUT_TYPES[output_type]
+try:
+    runpy.run_module("Documenter.Documenter", run_name="__main__")
+finally:
+    with open(modules_file, "w") as f:
+        json.dump(sorted(m for m in sys.modules if m.startswith("Documenter.Output.")), f)
+"""
+
+
+def import_time(statement:str):
+    """
+    Measures the time taken to import modules with python -X importtime
+    :param statement: the import statement to run
+    :return: the total time taken by the top level imports (in seconds)
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    # only the top level imports are counted, as they include the time of the imports inside of them
+    total = 0
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total / 1000000
+
+
+def run_cli(output_type:str, path:str, output:str, eager:bool, modules_file:str):
+    """
+    Runs the command line in a new process
+    :param output_type: the file type to write
+    :param path: the directory to document
+    :param output: the output file
+    :param eager: If every output is imported first (the same as before the outputs were imported when they are used)
+    :param modules_file: the file to write the imported output modules to
+    :return: the time taken (in seconds), and the output modules which were imported
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", RUNNER, modules_file, "1" if eager else "0", output_type, path, output], check=True)
+    total = time.perf_counter() - start
+
+    with open(modules_file) as f:
+        return total, json.load(f)
+
+
+def main(runs:int=20, output_types=("txt", "html", "json", "sqlitedb")):
+    """
+    Compares the time taken to start the command line (on a small package, the same as a pre-commit hook)
+    when only the selected output is imported, against importing every output, and checks only the selected output is imported
+    :param runs: the number of times each command is run
+    :param output_types: the file types to write
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "package")
+        generate_package(path, files=3, depth=1)
+        modules_file = os.path.join(tmp, "modules.json")
+
+        print("Import Documenter.Documenter: {:.1f}ms".format(import_time("import Documenter.Documenter") * 1000))
+        print("Import Every Output: {:.1f}ms".format(import_time("import " + ", ".join(sorted(set(
+            "Documenter.Output." + m for m in ["outTxt", "outJSON", "outXML", "outMySQL", "outHTML", "outSQLite", "outMD", "outPages"]
+        )))) * 1000))
+
+        for output_type in output_types:
+            output = os.path.join(tmp, "out." + output_type)
+            times = {}
+            for eager in (True, False):
+                results = [run_cli(output_type, path, output, eager, modules_file) for _ in range(runs)]
+                times[eager] = statistics.median(t for t, _ in results)
+                modules = results[0][1]
+
+            # only the selected output (and the modules it uses) is imported
+            imported = [m for m in modules if m.split(".")[-1].startswith("out") and m != "Documenter.Output.outMulti"]
+            assert OUTPUT_TYPES[output_type].__module__ in imported, output_type
+            assert len(imported) <= 2, imported
+
+            print("{:<10} Every Output: {:.1f}ms, Selected Output: {:.1f}ms (Imports {})".format(
+                output_type, times[True] * 1000, times[False] * 1000, ", ".join(m.split(".")[-1] for m in imported)
+            ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
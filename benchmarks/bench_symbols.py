@@ -0,0 +1,102 @@
+import random
+import sys
+import time
+
+from Documenter.Output.outHTML import doc_to_html
+from Documenter.Output.outSQLite import doc_to_sqlite
+from Documenter.Symbols import SymbolIndex
+from Documenter.benchmarks.corpus import generate_doc
+
+
+def scan_doc(doc:dict, data_type:str, module:str):
+    """
+    Finds the class an arguement's type refers to by searching the doc dict (how a type was linked without the symbol index)
+    :param doc: the doc dict
+    :param data_type: the arguement's type
+    :param module: the dotted name of the module the type is written in
+    :return: the full dotted name of the class (None if no single class has the name)
+    """
+
+    if data_type in doc[module]["classes"]:
+        return module + "." + data_type
+
+    found = []
+    for name, mod in doc.items():
+        for c in mod["classes"]:
+            full = name + "." + c
+            if full == data_type or full.endswith("." + data_type):
+                found.append(full)
+    return found[0] if len(found) == 1 else None
+
+
+def linked_doc(modules:int, classes:int=2):
+    """
+    Generates a synthetic corpus, where the arguements' types are the classes of other modules
+    (written as the class's name, the module and class's name, or a built in type)
+    :param modules: the number of modules in the corpus
+    :param classes: the number of classes in each module
+    :return: the doc dict
+    """
+
+    doc = generate_doc(modules=modules, functions=10, classes=classes, methods=5, args=3)
+    rand = random.Random(0)
+    for mod in doc.values():
+        for functions in [mod["functions"]] + [c["func"] for c in mod["classes"].values()]:
+            for func in functions.values():
+                for arg in func["args"]:
+                    m, c = rand.randrange(modules), rand.randrange(classes)
+                    arg["type"] = rand.choice(["module{}.Class{}".format(m, c), "Class{}".format(c), "int"])
+    return doc
+
+
+def main(modules:int=2000):
+    """
+    Compares resolving every arguement's type of a synthetic corpus with the symbol index against searching the doc dict,
+    and times the html and sqlite outputs with and without links
+    :param modules: the number of modules in the corpus
+    """
+
+    doc = linked_doc(modules)
+    types = [
+        (name, arg["type"])
+        for name, mod in doc.items()
+        for functions in [mod["functions"]] + [c["func"] for c in mod["classes"].values()]
+        for func in functions.values()
+        for arg in func["args"]
+    ]
+
+    start = time.perf_counter()
+    symbols = SymbolIndex(doc)
+    index_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolved = [symbols.resolve(data_type, name) for name, data_type in types]
+    index_resolve = time.perf_counter() - start
+
+    # searching the doc dict is slow, so only a sample of the types is resolved with it, and the time is scaled up
+    sample = types[::max(1, len(types) // 500)]
+    start = time.perf_counter()
+    scanned = [scan_doc(doc, data_type, name) for name, data_type in sample]
+    scan_resolve = (time.perf_counter() - start) * len(types) / len(sample)
+
+    # ensure both find the same classes
+    by_type = dict(zip(types, resolved))
+    assert [None if by_type[t] is None else by_type[t].name for t in sample] == scanned
+
+    print("{} Modules, {} Arguements ({} Linked)".format(modules, len(types), sum(s is not None for s in resolved)))
+    print("Searching The Doc Dict: {:.3f}s (Estimated From {} Arguements)".format(scan_resolve, len(sample)))
+    print("Symbol Index: {:.3f}s To Build, {:.3f}s To Resolve".format(index_build, index_resolve))
+
+    for name, writer in [("html", doc_to_html), ("sqlite", doc_to_sqlite)]:
+        start = time.perf_counter()
+        writer(doc)
+        plain = time.perf_counter() - start
+
+        start = time.perf_counter()
+        writer(doc, symbols=symbols)
+        linked = time.perf_counter() - start
+        print("{:<8}Without Links: {:.3f}s, With Links: {:.3f}s".format(name, plain, linked))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
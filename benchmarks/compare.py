@@ -0,0 +1,110 @@
+import json
+import sys
+
+from Documenter.misc import pop_cli_option
+
+# the relative increase in a stage's time or peak memory which counts as a regression
+REGRESSION_THRESHOLD = 0.10
+
+# changes smaller than these are ignored (very fast stages vary by more than the threshold between runs)
+MIN_SECONDS = 0.005
+MIN_MEMORY = 64 * 1024
+
+
+def load_results(filename:str):
+    """
+    Loads benchmark results written by run.write_results
+    :param filename: the results filename
+    :return: the results dict
+    """
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def compare_results(base:dict, current:dict, threshold:float=REGRESSION_THRESHOLD):
+    """
+    Compares two benchmark results, stage by stage
+    :param base: the results to compare against (ex. from the previous release)
+    :param current: the new results
+    :param threshold: the relative increase which counts as a regression (ex. 0.1 for 10%)
+    :return: a list of dicts of each stage and metric, with its "base" and "current" values, relative "change", and if it is a "regression"
+    """
+
+    output = []
+
+    # only the stages in both results can be compared
+    for stage, values in current["stages"].items():
+        if stage not in base["stages"]:
+            continue
+
+        for metric, minimum in (("seconds", MIN_SECONDS), ("peak_memory", MIN_MEMORY)):
+            old = base["stages"][stage][metric]
+            new = values[metric]
+            change = (new - old) / old if old > 0 else 0.0
+
+            output.append({
+                "stage": stage,
+                "metric": metric,
+                "base": old,
+                "current": new,
+                "change": change,
+                "regression": change > threshold and new - old > minimum
+            })
+
+    return output
+
+
+def format_comparison(rows):
+    """
+    Formats a comparison as a table
+    :param rows: the comparison (see compare_results)
+    :return: the table
+    """
+
+    def value(metric, amount):
+        """
+        formats the value of a metric
+        :param metric: the metric's name
+        :param amount: the value
+        :return: the formatted value (seconds, or megabytes of memory)
+        """
+        if metric == "peak_memory":
+            return "{:.2f} MB".format(amount / (1024 * 1024))
+        return "{:.4f}s".format(amount)
+
+    lines = ["{:<20}{:<13}{:>14}{:>14}{:>10}".format("Stage", "Metric", "Base", "Current", "Change")]
+    for row in rows:
+        lines.append("{:<20}{:<13}{:>14}{:>14}{:>+9.1f}%{}".format(
+            row["stage"], row["metric"], value(row["metric"], row["base"]), value(row["metric"], row["current"]), row["change"] * 100,
+            "  REGRESSION" if row["regression"] else ""
+        ))
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    try:
+        threshold = float(pop_cli_option(args, "--threshold", REGRESSION_THRESHOLD))
+    except ValueError as e:
+        print(e)
+        quit(-1)
+
+    if len(args) < 2:
+        print("SYNTAX:\n    python -m Documenter.benchmarks.compare BASE_RESULTS CURRENT_RESULTS [--threshold 0.1]")
+        quit(-1)
+
+    base_results = load_results(args[0])
+    current_results = load_results(args[1])
+
+    # results from different corpora are not comparable
+    if base_results["meta"].get("corpus") != current_results["meta"].get("corpus"):
+        print("Warning: The Results Were Generated From Different Corpora")
+
+    comparison = compare_results(base_results, current_results, threshold)
+    print(format_comparison(comparison))
+
+    # exit with a code of 1 if anything regressed, so the comparison can fail a build
+    regressions = [r for r in comparison if r["regression"]]
+    if len(regressions) > 0:
+        print("{} Regressions Found".format(len(regressions)))
+        quit(1)
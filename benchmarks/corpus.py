@@ -0,0 +1,169 @@
+import os
+import random
+
+
+def generate_doc(modules:int=100, functions:int=10, classes:int=5, methods:int=5, args:int=3, doc_length:int=20, seed:int=0,
+                 vocabulary:int=0):
+    """
+    Generates a synthetic doc dict (the same structure as get_doc_from_dir returns), without parsing any files
+    The same arguements always generate the same doc dict
+    :param modules: the number of modules
+    :param functions: the number of functions in each module
+    :param classes: the number of classes in each module
+    :param methods: the number of methods in each class
+    :param args: the number of arguements of each function and method
+    :param doc_length: the number of words in each docstring
+    :param seed: the random seed
+    :param vocabulary: the number of extra words ("term0", "term1", ...) docstrings are made of (so searches only match some of them)
+    :return: the doc dict
+    """
+
+    rand = random.Random(seed)
+    words = ["the", "value", "returns", "file", "list", "of", "each", "module", "path", "name", "data", "to"]
+    words += ["term{}".format(i) for i in range(vocabulary)]
+
+    def docstring():
+        """
+        generates a docstring
+        :return: the docstring
+        """
+        return " ".join(rand.choice(words) for _ in range(doc_length))
+
+    def function_doc():
+        """
+        generates the doc dict of a function
+        :return: the function doc dict
+        """
+        return {
+            "args": [
+                {
+                    "name": "arg{}".format(i),
+                    "type": rand.choice(["any", "int", "str", "unknown"]),
+                    "value": rand.choice([None, 1, "text", True, 1.5])
+                } for i in range(args)
+            ],
+            "doc": docstring()
+        }
+
+    output = {}
+    for m in range(modules):
+        name = "package.sub{}.module{}".format(m % 10, m)
+        output[name] = {
+            "functions": {"function{}".format(f): function_doc() for f in range(functions)},
+            "classes": {
+                "Class{}".format(c): {
+                    "func": {"method{}".format(f): function_doc() for f in range(methods)},
+                    "doc": docstring()
+                } for c in range(classes)
+            },
+            "file": name
+        }
+
+    return output
+
+
+def generate_source(functions:int=10, classes:int=5, methods:int=5, args:int=3, doc_length:int=20, body_lines:int=10, seed:int=0):
+    """
+    Generates the source of a synthetic Python module
+    The same arguements always generate the same source
+    :param functions: the number of top level functions
+    :param classes: the number of classes
+    :param methods: the number of methods in each class
+    :param args: the number of arguements of each function and method
+    :param doc_length: the number of words in each docstring
+    :param body_lines: the number of statements in the body of each function and method
+    :param seed: the random seed
+    :return: the module's source
+    """
+
+    rand = random.Random(seed)
+    words = ["the", "value", "returns", "file", "list", "of", "each", "module", "path", "name", "data", "to"]
+    defaults = ["None", "1", "'text'", "True", "1.5", "(1, 2)", "[]"]
+    types = ["", ":int", ":str", ":float"]
+
+    def docstring(indent):
+        """
+        generates a docstring in the repo's style
+        :param indent: the indentation of the docstring
+        :return: the docstring lines
+        """
+        return [
+            indent + '"""',
+            indent + " ".join(rand.choice(words) for _ in range(doc_length)),
+            indent + ":param a: " + " ".join(rand.choice(words) for _ in range(3)),
+            indent + ":return: " + " ".join(rand.choice(words) for _ in range(3)),
+            indent + '"""'
+        ]
+
+    def function(name, indent, method):
+        """
+        generates a function
+        :param name: the function's name
+        :param indent: the indentation of the function
+        :param method: if the function is a method
+        :return: the function lines
+        """
+        params = ["self"] if method else []
+        for i in range(args):
+            param = "arg{}{}".format(i, rand.choice(types))
+            if i >= args // 2:
+                param += "=" + rand.choice(defaults)
+            params.append(param)
+
+        output = ["", indent + "def {}({}):".format(name, ", ".join(params))]
+        output += docstring(indent + "    ")
+        for i in range(body_lines):
+            output.append(indent + "    value{} = [x * {} for x in range({})]  # {}".format(i, i, rand.randint(1, 99), rand.choice(words)))
+            if i % 5 == 4:
+                output.append(indent + "    if value{} and (value{} or".format(i, i))
+                output.append(indent + "            value0):")
+                output.append(indent + "        value0 = {'key': \"\"\"multi")
+                output.append("line string\"\"\", 'other': (1, 2)}")
+        output.append(indent + "    return value0")
+        return output
+
+    lines = ['"""', "synthetic module", '"""', "import os", ""]
+    for c in range(classes):
+        lines += ["", "class Class{}(object):".format(c)]
+        lines += docstring("    ")
+        lines.append("    attribute = {}".format(c))
+        for m in range(methods):
+            lines += function("method{}".format(m), "    ", True)
+    for f in range(functions):
+        lines += function("function{}".format(f), "", False)
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_package(path:str, files:int=100, functions:int=10, classes:int=5, methods:int=5, args:int=3, doc_length:int=20,
+                     depth:int=2, body_lines:int=10, seed:int=0):
+    """
+    Writes a synthetic package of Python modules to a directory
+    The same arguements always generate the same package
+    :param path: the directory to write the package to (created if it does not exist)
+    :param files: the number of modules
+    :param functions: the number of top level functions in each module
+    :param classes: the number of classes in each module
+    :param methods: the number of methods in each class
+    :param args: the number of arguements of each function and method
+    :param doc_length: the number of words in each docstring
+    :param depth: the number of levels of subpackages the modules are spread over (0 places every module in the directory itself)
+    :param body_lines: the number of statements in the body of each function and method
+    :param seed: the random seed
+    :return: the list of the paths of the modules written
+    """
+
+    output = []
+    for i in range(files):
+
+        # spread the modules over the subpackages (each level has up to 4 subpackages)
+        parts = ["sub{}".format((i // (4 ** level)) % 4) for level in range(depth)]
+        directory = os.path.join(path, *parts)
+        os.makedirs(directory, exist_ok=True)
+
+        filename = os.path.join(directory, "module{}.py".format(i))
+        with open(filename, 'w') as f:
+            f.write(generate_source(functions, classes, methods, args, doc_length, body_lines, seed + i))
+        output.append(filename)
+
+    return output
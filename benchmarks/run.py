@@ -0,0 +1,190 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Documenter.Documenter import doc_to_txt, doc_to_json, doc_to_xml, doc_to_html, doc_to_md, doc_to_sqlite, doc_to_sqlite_db, \
+    doc_to_mysql, doc_to_mysql_tsv
+from Documenter.Py2Dict import file_to_dict
+from Documenter.Reader import read_source
+from Documenter.benchmarks.corpus import generate_package
+from Documenter.misc import find_python_files, path_to_dot_notation, pop_cli_option
+
+# the version of the results file (change this when the structure of the results changes)
+RESULTS_VERSION = 1
+
+# the number of times each stage is run (the fastest run is recorded)
+DEFAULT_REPEAT = 3
+
+# the output writers which are timed, and if each one writes to a directory rather than a file
+WRITERS = {
+    "doc_to_txt": (doc_to_txt, False),
+    "doc_to_json": (doc_to_json, False),
+    "doc_to_xml": (doc_to_xml, False),
+    "doc_to_html": (doc_to_html, False),
+    "doc_to_md": (doc_to_md, False),
+    "doc_to_sqlite": (doc_to_sqlite, False),
+    "doc_to_sqlite_db": (doc_to_sqlite_db, False),
+    "doc_to_mysql": (doc_to_mysql, False),
+    "doc_to_mysql_tsv": (doc_to_mysql_tsv, True)
+}
+
+# the options of the synthetic corpus, and their defaults (see corpus.generate_package)
+CORPUS_OPTIONS = {
+    "files": 200,
+    "functions": 10,
+    "classes": 5,
+    "methods": 5,
+    "args": 3,
+    "doc_length": 20,
+    "depth": 2,
+    "body_lines": 10,
+    "seed": 0
+}
+
+
+def measure(func, repeat:int=DEFAULT_REPEAT):
+    """
+    Measures the time and peak memory of a stage
+    The stage is timed without tracemalloc (which slows Python down), then run once more to measure its peak memory
+    :param func: the stage (called with no arguements)
+    :param repeat: the number of times to time the stage (the fastest run is recorded)
+    :return: the dict of the stage's results, and the value returned by the stage
+    """
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    tracemalloc.start()
+    try:
+        value = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "peak_memory": peak}, value
+
+
+def run_benchmarks(path:str=None, repeat:int=DEFAULT_REPEAT, report=print, **corpus):
+    """
+    Times each stage of documenting a package separately: walking the directory, reading the files, parsing them (file_to_dict),
+    and each output writer
+    :param path: the package to document (None to generate a synthetic package)
+    :param repeat: the number of times to run each stage (the fastest run is recorded)
+    :param report: the function which is called with the results of each stage as it finishes (None to not report)
+    :param corpus: the options of the synthetic package (see CORPUS_OPTIONS)
+    :return: the results dict (see write_results)
+    """
+
+    options = dict(CORPUS_OPTIONS)
+    options.update(corpus)
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        # generate the synthetic package
+        if path is None:
+            path = os.path.join(tmp, "package")
+            generate_package(path, **options)
+        else:
+            options = None
+
+        stages = {}
+
+        def record(name, func):
+            """
+            measures a stage, and adds it to the results
+            :param name: the name of the stage
+            :param func: the stage
+            :return: the value returned by the stage
+            """
+            stages[name], value = measure(func, repeat)
+            if report is not None:
+                report("{:<20}{:>10.4f}s{:>10.2f} MB".format(name, stages[name]["seconds"], stages[name]["peak_memory"] / (1024 * 1024)))
+            return value
+
+        files = record("walk", lambda: find_python_files(path))
+        sources = record("read", lambda: [read_source(f) for f in files])
+
+        # the files are parsed from memory, so the parsing time does not include reading them
+        def parse():
+            """
+            parses each file which was read
+            :return: the doc dict
+            """
+            output = {}
+            for f, source in zip(files, sources):
+                val = file_to_dict(f, path, False, source=source)
+                if val is not None:
+                    output[path_to_dot_notation(f, path)] = val
+            return output
+
+        doc = record("file_to_dict", parse)
+
+        # each writer writes the same doc dict to a new file
+        output_dir = os.path.join(tmp, "output")
+        os.makedirs(output_dir)
+        for name, (writer, is_directory) in WRITERS.items():
+            target = os.path.join(output_dir, name)
+
+            def write(writer=writer, target=target, is_directory=is_directory):
+                """
+                writes the doc dict with a writer (replacing its previous output)
+                """
+                if not is_directory and os.path.exists(target):
+                    os.remove(target)
+                writer(doc, target)
+
+            record(name, write)
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "corpus": options,
+            "files": len(files),
+            "bytes": sum(len(s) for s in sources)
+        },
+        "stages": stages
+    }
+
+
+def write_results(results:dict, filename:str):
+    """
+    Writes benchmark results as JSON
+    The results contain the "meta" data of the run (the Python version, platform, and corpus options),
+    and the "stages", each with its fastest time in "seconds", and its "peak_memory" in bytes
+    :param results: the results dict
+    :param filename: the output filename
+    """
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=4)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    try:
+        output = pop_cli_option(args, "--output")
+        repeat = int(pop_cli_option(args, "--repeat", DEFAULT_REPEAT))
+        corpus = {k: int(pop_cli_option(args, "--" + k.replace("_", "-"), v)) for k, v in CORPUS_OPTIONS.items()}
+    except ValueError as e:
+        print(e)
+        quit(-1)
+
+    # an existing package can be benchmarked in place of the synthetic one
+    results = run_benchmarks(args[0] if len(args) > 0 else None, repeat, **corpus)
+
+    if output is not None:
+        write_results(results, output)
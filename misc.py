@@ -1,3 +1,9 @@
+from typing import List
+
+from Documenter.Stats import instrument
+from Documenter.Walker import walk_python_files
+
+
 def path_to_dot_notation(filename:str, start_dir = None):
     """
     This function returns the file name in dot notation
@@ -7,4 +13,117 @@ def path_to_dot_notation(filename:str, start_dir = None):
     """
 
     # convert and return the filename
-    return filename.replace(start_dir, "")[1:].replace(".py", "").replace("/", ".").replace("\\", ".")
\ No newline at end of file
+    return filename.replace(start_dir, "")[1:].replace(".py", "").replace("/", ".").replace("\\", ".")
+
+
+@instrument
+def find_python_files(path:str, walk_options:dict=None):
+    """
+    Lists every Python file in a directory, and its subdirectories
+    (files are listed in the same order they have always been documented in)
+    Only the directories and files excluded by the walk options are skipped (ex. {"excludes": DEFAULT_EXCLUDES}, as the command line does)
+    :param path: the path to search
+    :param walk_options: the options of the directory walk (ex. {"excludes": ["tests"], "gitignore": True}, see Walker.iter_python_entries)
+    :return: the list of Python file paths
+    """
+
+    # walk the directory, pruning the skipped directories without entering them
+    return walk_python_files(path, **(walk_options or {}))
+
+
+def iter_modules(doc):
+    """
+    Iterates over the modules of a doc dict, or of a generator of (dotted name, module doc) pairs
+    :param doc: the doc dict, or generator of (dotted name, module doc) pairs
+    :return: an iterator of (dotted name, module doc) pairs
+    """
+
+    # doc dicts are iterated over by their items, anything else is already a sequence of pairs
+    if hasattr(doc, "items"):
+        return iter(doc.items())
+    return iter(doc)
+
+
+def write_output(chunks, filename=None):
+    """
+    Writes the chunks of text produced by an output writer to a file, as each chunk is produced
+    :param chunks: an iterable of strings
+    :param filename: the output filename, or an open file object - leave blank to have value returned
+    :return: the full text if no filename is specified
+    """
+
+    # if no output file is specified, return the value
+    if filename is None:
+        return "".join(chunks)
+
+    # write to an already open file object
+    if hasattr(filename, "write"):
+        for chunk in chunks:
+            filename.write(chunk)
+        return None
+
+    with open(filename, 'w') as tmp:
+        for chunk in chunks:
+            tmp.write(chunk)
+
+
+def pop_cli_option(args:List[str], flag:str, default=None):
+    """
+    Removes a command line option (ex. "--jobs 4" or "--jobs=4") from the argument list, and returns its value
+    :param args: the list of command line arguments (modified in place)
+    :param flag: the option to search for (ex. "--jobs")
+    :param default: the value to return if the option is not specified
+    :return: the value of the option
+    """
+
+    # iterate over each arguement
+    for i, arg in enumerate(args):
+
+        # the "--flag=value" form
+        if arg.startswith(flag + "="):
+            del args[i]
+            return arg[len(flag) + 1:]
+
+        # the "--flag value" form
+        if arg == flag:
+            if i + 1 >= len(args):
+                raise ValueError("The Option {} Requires A Value".format(flag))
+            value = args[i + 1]
+            del args[i:i + 2]
+            return value
+
+    # the option was not specified
+    return default
+
+
+def pop_cli_options(args:List[str], flag:str):
+    """
+    Removes every occurence of a command line option which can be specified more than once (ex. "--exclude tests --exclude docs")
+    :param args: the list of command line arguments (modified in place)
+    :param flag: the option to search for (ex. "--exclude")
+    :return: the list of the option's values (empty if it was not specified)
+    """
+
+    output = []
+    while True:
+        value = pop_cli_option(args, flag)
+        if value is None:
+            return output
+        output.append(value)
+
+
+def pop_cli_flag(args:List[str], flag:str):
+    """
+    Removes a command line flag (ex. "--watch") from the argument list
+    :param args: the list of command line arguments (modified in place)
+    :param flag: the flag to search for
+    :return: if the flag was specified
+    """
+
+    if flag not in args:
+        return False
+
+    # remove every occurence of the flag
+    while flag in args:
+        args.remove(flag)
+    return True
@@ -0,0 +1,186 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from Documenter import AsyncPipeline
+from Documenter.AsyncPipeline import aget_doc_from_dir, aiter_doc_from_dir, aiter_doc_from_files
+from Documenter.Documenter import get_doc_from_dir, get_doc_from_file, iter_doc_from_files
+from Documenter.benchmarks.corpus import generate_package
+from Documenter.misc import find_python_files
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """
+    An executor which records each time it is shut down (used in place of the process pool)
+    """
+
+    shutdowns = []
+
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers=max_workers)
+
+    def shutdown(self, wait=True):
+        RecordingExecutor.shutdowns.append(wait)
+        super().shutdown(wait)
+
+
+def other_tasks():
+    """
+    Gets the tasks of the running event loop, apart from the current task
+    :return: the set of tasks which have not finished
+    """
+    return {t for t in asyncio.all_tasks() if t is not asyncio.current_task() and not t.done()}
+
+
+class AsyncPipelineTests(unittest.TestCase):
+    """
+    The asyncio pipeline must yield the same modules in the same order as iter_doc_from_files, and stop every stage once it is closed
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        generate_package(self.path, files=12, depth=2)
+        self.files = find_python_files(self.path)
+        RecordingExecutor.shutdowns = []
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_order(self):
+        expected = list(iter_doc_from_files(self.files, self.path))
+
+        async def run(**kwargs):
+            return [item async for item in aiter_doc_from_files(self.files, self.path, **kwargs)]
+
+        for kwargs in ({}, {"workers": 3, "readers": 5, "queue_size": 2}, {"executor": ThreadPoolExecutor(max_workers=4), "queue_size": 1}):
+            with self.subTest(kwargs=list(kwargs)):
+                self.assertEqual(asyncio.run(run(**kwargs)), expected)
+
+        # the directory is walked by the pipeline
+        doc = asyncio.run(aget_doc_from_dir(self.path, workers=2))
+        self.assertEqual(list(doc), list(get_doc_from_dir(self.path)))
+        self.assertEqual(doc, get_doc_from_dir(self.path))
+
+    def test_parse_error(self):
+        # a file which can not be parsed raises its error once the files before it have been yielded
+        broken = self.files[5]
+        with open(broken, 'w') as f:
+            f.write("def broken(:\n")
+        expected = [name for name, _ in iter_doc_from_files(self.files[:5], self.path)]
+
+        async def run():
+            names = []
+            with self.assertRaises(SyntaxError):
+                async for name, _ in aiter_doc_from_files(self.files, self.path, workers=2, executor=ThreadPoolExecutor(max_workers=2)):
+                    names.append(name)
+            return names
+
+        self.assertEqual(asyncio.run(run()), expected)
+
+    def test_missing_file(self):
+        async def run():
+            with self.assertRaises(OSError):
+                async for _ in aiter_doc_from_files(self.files[:2] + [os.path.join(self.path, "missing.py")], self.path):
+                    pass
+
+        asyncio.run(run())
+
+    def test_aclose(self):
+        closed = []
+
+        async def files():
+            try:
+                for f in self.files:
+                    yield f
+            finally:
+                closed.append(True)
+
+        async def run():
+            docs = aiter_doc_from_files(files(), self.path, workers=2, queue_size=2)
+            await docs.__anext__()
+            self.assertGreater(len(other_tasks()), 0)
+
+            await docs.aclose()
+            self.assertEqual(other_tasks(), set())
+
+        with mock.patch.object(AsyncPipeline, "ProcessPoolExecutor", RecordingExecutor):
+            asyncio.run(run())
+        self.assertEqual(closed, [True])
+        self.assertEqual(RecordingExecutor.shutdowns, [True])
+
+    def test_cancel(self):
+        # cancelled while waiting for a file to be parsed, the pipeline is closed at once
+        started = []
+        parsed = []
+
+        def slow_parse(filename, *args):
+            parsed.append(filename)
+            if len(parsed) > 1:
+                time.sleep(0.5)
+            return get_doc_from_file(filename, *args)
+
+        async def consume():
+            async for name, _ in aiter_doc_from_dir(self.path, workers=2, queue_size=2):
+                started.append(name)
+
+        async def run():
+            task = asyncio.ensure_future(consume())
+            while len(started) == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(other_tasks(), set())
+
+        with mock.patch.object(AsyncPipeline, "ProcessPoolExecutor", RecordingExecutor), \
+                mock.patch.object(AsyncPipeline, "get_doc_from_file", slow_parse):
+            asyncio.run(run())
+        self.assertEqual(len(started), 1)
+        self.assertEqual(RecordingExecutor.shutdowns, [True])
+
+    def test_cancel_consumer(self):
+        # cancelled while using a module, the pipeline is closed by the event loop once the generator is no longer used
+        started = []
+
+        async def consume():
+            async for name, _ in aiter_doc_from_dir(self.path, workers=2, queue_size=2):
+                started.append(name)
+                await asyncio.sleep(10)
+
+        async def run():
+            task = asyncio.ensure_future(consume())
+            while len(started) == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            for _ in range(100):
+                if len(other_tasks()) == 0:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(other_tasks(), set())
+
+        with mock.patch.object(AsyncPipeline, "ProcessPoolExecutor", RecordingExecutor):
+            asyncio.run(run())
+        self.assertEqual(len(started), 1)
+        self.assertEqual(RecordingExecutor.shutdowns, [True])
+
+    def test_own_executor(self):
+        # an executor which is passed in is left for the caller to shut down
+        executor = RecordingExecutor(max_workers=2)
+
+        async def run():
+            return [name async for name, _ in aiter_doc_from_files(self.files, self.path, executor=executor)]
+
+        self.assertEqual(len(asyncio.run(run())), len(self.files))
+        self.assertEqual(RecordingExecutor.shutdowns, [])
+        executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Documenter import ParseCache, Py2Dict
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.ParseCache import get_cache_key, get_cache_path, load_cached, store_cached, prune_cache, clear_cache
+from Documenter.benchmarks.corpus import generate_package
+
+
+class CacheTests(unittest.TestCase):
+    """
+    A cached file must give the same doc dict as parsing it, and must be parsed again once it (or the extractor) changes
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        self.filename = os.path.join(self.tmp, "module.py")
+        self.write('def f(a:int=1):\n    """first"""\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, source:str):
+        with open(self.filename, 'w') as f:
+            f.write(source)
+
+    def parse(self, cache:bool=True, ignore_no_docstr:bool=False):
+        """
+        Documents the file, counting the times it is parsed
+        :param cache: If the cache is used
+        :param ignore_no_docstr: If functions and classes without docstrings are ignored
+        :return: the doc dict, and the number of times the file was parsed
+        """
+        with mock.patch.object(Py2Dict, "tree_to_dict", wraps=Py2Dict.tree_to_dict) as tree_to_dict:
+            doc = Py2Dict.file_to_dict(self.filename, self.tmp, ignore_no_docstr, self.cache_dir if cache else None)
+        return doc, tree_to_dict.call_count
+
+    def test_hit(self):
+        uncached, _ = self.parse(cache=False)
+        self.assertEqual(self.parse(), (uncached, 1))
+        self.assertEqual(self.parse(), (uncached, 0))
+
+    def test_source_edit(self):
+        self.parse()
+        self.write('def f(a:int=2):\n    """second"""\n')
+        uncached, _ = self.parse(cache=False)
+        self.assertEqual(self.parse(), (uncached, 1))
+        self.assertEqual(self.parse(), (uncached, 0))
+
+    def test_options(self):
+        self.parse()
+        uncached, _ = self.parse(cache=False, ignore_no_docstr=True)
+        self.assertEqual(self.parse(ignore_no_docstr=True), (uncached, 1))
+
+    def test_extractor_version(self):
+        self.parse()
+        with mock.patch.object(ParseCache, "EXTRACTOR_VERSION", ParseCache.EXTRACTOR_VERSION + 1):
+            self.assertEqual(self.parse()[1], 1)
+            self.assertEqual(self.parse()[1], 0)
+
+    def test_moved_file(self):
+        # the dotted name is not cached, as it depends on where the file is
+        self.parse()
+        os.makedirs(os.path.join(self.tmp, "package"))
+        moved = os.path.join(self.tmp, "package", "module.py")
+        os.replace(self.filename, moved)
+        self.assertEqual(Py2Dict.file_to_dict(moved, self.tmp, False, self.cache_dir)["file"], "package.module")
+
+    def test_damaged_entry(self):
+        uncached, _ = self.parse(cache=False)
+        self.parse()
+        with open(self.filename, 'rb') as f:
+            path = get_cache_path(self.cache_dir, get_cache_key(f.read(), False))
+        with open(path, 'wb') as f:
+            f.write(b"damaged")
+
+        self.assertEqual(self.parse(), (uncached, 1))
+        self.assertEqual(self.parse(), (uncached, 0))
+
+    def test_prune(self):
+        keys = ["{:02x}".format(i) * 32 for i in range(10)]
+        for i, key in enumerate(keys):
+            store_cached(self.cache_dir, key, {"functions": {}, "classes": {}, "doc": "x" * 1000})
+            os.utime(get_cache_path(self.cache_dir, key), (1000 + i, 1000 + i))
+
+        # loading an entry marks it as recently used, so the oldest entries other than it are removed
+        self.assertIsNotNone(load_cached(self.cache_dir, keys[0]))
+        size = os.path.getsize(get_cache_path(self.cache_dir, keys[0]))
+        self.assertEqual(prune_cache(self.cache_dir, size * 3), 7)
+        self.assertEqual([load_cached(self.cache_dir, k) is not None for k in keys], [True] + [False] * 7 + [True, True])
+
+        clear_cache(self.cache_dir)
+        self.assertIsNone(load_cached(self.cache_dir, keys[0]))
+
+    def test_directory(self):
+        path = os.path.join(self.tmp, "package")
+        generate_package(path, files=20, depth=1)
+        uncached = get_doc_from_dir(path)
+        self.assertEqual(get_doc_from_dir(path, cache_dir=self.cache_dir), uncached)
+        self.assertEqual(get_doc_from_dir(path, cache_dir=self.cache_dir), uncached)
+        self.assertEqual(get_doc_from_dir(path, workers=2, cache_dir=self.cache_dir), uncached)
+
+
+if __name__ == '__main__':
+    unittest.main()
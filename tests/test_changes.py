@@ -0,0 +1,131 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import Documenter
+from Documenter import Changes
+from Documenter.Changes import git_changed_files, iter_doc_from_changes
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Output.outSQLite import doc_to_sqlite
+from Documenter.Output.outTxt import doc_to_txt
+from Documenter.Snapshot import doc_to_snapshot, DocSnapshot
+
+# the directory containing the Documenter package, so the command line can be run in a new process
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(Documenter.__file__)))
+
+
+def write_module(path:str, name:str, doc:str):
+    """
+    Writes a module with a function (whose default values are a tuple and a dict) and a class
+    :param path: the directory
+    :param name: the module's filename
+    :param doc: the function's docstring
+    """
+    with open(os.path.join(path, name), 'w') as f:
+        f.write('def f(a=(1, 2), b={1: (3,)}):\n    """' + doc + '"""\n\n\nclass C:\n    """C"""\n    def m(self, x:int=1):\n        """m"""\n')
+
+
+def git(path:str, *args):
+    """
+    Runs a git command in a repository
+    :param path: the repository
+    :param args: the git command's arguements
+    """
+    subprocess.run(["git", "-C", path, "-c", "user.name=test", "-c", "user.email=test@example.com"] + list(args), check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class ChangesTests(unittest.TestCase):
+    """
+    Only parsing the changed files, and reading every other module from a snapshot, must give the same output as a full run
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "src")
+        os.makedirs(os.path.join(self.path, "pkg"))
+        for i in range(5):
+            write_module(os.path.join(self.path, "pkg"), "mod{}.py".format(i), "doc {}".format(i))
+        write_module(self.path, "space name.py", "space")
+        git(self.path, "init", "-q")
+        git(self.path, "add", "-A")
+        git(self.path, "commit", "-q", "-m", "base")
+
+        self.base = os.path.join(self.tmp, "base.snapshot")
+        doc_to_snapshot(get_doc_from_dir(self.path), self.base)
+
+        # modify, rename (and modify), delete, and add modules, committing some of the changes
+        write_module(os.path.join(self.path, "pkg"), "mod1.py", "changed")
+        git(self.path, "mv", "pkg/mod2.py", "pkg/renamed.py")
+        git(self.path, "rm", "-q", "pkg/mod3.py")
+        git(self.path, "commit", "-q", "-m", "changes")
+        write_module(os.path.join(self.path, "pkg"), "renamed.py", "renamed")
+        write_module(os.path.join(self.path, "pkg"), "added.py", "added")
+        write_module(self.path, "space name.py", "space changed")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_changed_files(self):
+        changed, deleted = git_changed_files(self.path, "HEAD~1")
+        self.assertEqual(sorted(os.path.relpath(f, self.path) for f in changed), sorted([
+            os.path.join("pkg", "mod1.py"), os.path.join("pkg", "renamed.py"), os.path.join("pkg", "added.py"), "space name.py"
+        ]))
+        self.assertEqual(sorted(os.path.relpath(f, self.path) for f in deleted), [os.path.join("pkg", "mod2.py"), os.path.join("pkg", "mod3.py")])
+
+    def test_same_as_full_run(self):
+        full = get_doc_from_dir(self.path)
+        changed, _ = git_changed_files(self.path, "HEAD~1")
+        with DocSnapshot(self.base) as base:
+            merged = dict(iter_doc_from_changes(self.path, changed, base))
+
+        self.assertEqual(list(merged), list(full))
+        self.assertEqual(doc_to_txt(merged), doc_to_txt(full))
+        self.assertEqual(doc_to_sqlite(merged), doc_to_sqlite(full))
+
+    def test_symlinked_checkout(self):
+        # git reports the real path of the repository, which must still match the files walked through the link
+        link = os.path.join(self.tmp, "link")
+        os.symlink(self.path, link)
+        full = get_doc_from_dir(link)
+        changed, _ = git_changed_files(link, "HEAD~1")
+        with DocSnapshot(self.base) as base, mock.patch.object(Changes, "parse_files", wraps=Changes.parse_files) as parse_files:
+            merged = dict(iter_doc_from_changes(link, changed, base))
+
+        self.assertEqual(merged, full)
+        self.assertEqual(sorted(os.path.basename(f) for f in parse_files.call_args[0][0]), ["added.py", "mod1.py", "renamed.py", "space name.py"])
+
+    def test_empty_file(self):
+        # an empty file is never in the previous documentation, so it is only parsed when it changes
+        open(os.path.join(self.path, "pkg", "__init__.py"), 'w').close()
+        with DocSnapshot(self.base) as base, mock.patch.object(Changes, "parse_files", wraps=Changes.parse_files) as parse_files:
+            merged = dict(iter_doc_from_changes(self.path, [], base))
+
+        self.assertEqual(sorted(os.path.basename(f) for f in parse_files.call_args[0][0]), ["added.py", "renamed.py"])
+        self.assertNotIn("pkg", merged)
+
+    def test_command_line(self):
+        def run(*args):
+            env = dict(os.environ, PYTHONPATH=PACKAGE_PARENT)
+            return subprocess.run([sys.executable, "-m", "Documenter.Documenter"] + list(args), env=env, stdout=subprocess.PIPE).returncode
+
+        outputs = [os.path.join(self.tmp, name) for name in ("full.txt", "full.sql", "merged.txt", "merged.sql")]
+        self.assertEqual(run("txt,sqlite", self.path, ",".join(outputs[:2])), 0)
+        self.assertEqual(run("txt,sqlite", self.path, ",".join(outputs[2:]), "--since", "HEAD~1", "--base", self.base), 0)
+        for full, merged in (outputs[0::2], outputs[1::2]):
+            with open(full, 'rb') as a, open(merged, 'rb') as b:
+                self.assertEqual(a.read(), b.read())
+
+        # a json output is not accepted as the base, as tuples are written as lists
+        base_json = os.path.join(self.tmp, "base.json")
+        self.assertEqual(run("json", self.path, base_json), 0)
+        self.assertNotEqual(run("txt", self.path, outputs[2], "--since", "HEAD~1", "--base", base_json), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
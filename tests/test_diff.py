@@ -0,0 +1,41 @@
+import json
+import unittest
+
+from Documenter.Diff import diff_docs, value_text
+
+
+def defaults_doc(value):
+    """
+    Generates a doc dict of a single function, with an arguement's default value
+    :param value: the default value
+    :return: the doc dict
+    """
+    return {"package.module": {
+        "functions": {"f": {"args": [{"name": "a", "type": "any", "value": value}], "doc": "f"}},
+        "classes": {"C": {"doc": "C", "func": {"m": {"args": [{"name": "b", "type": "any", "value": value}], "doc": "m"}}}}
+    }}
+
+
+class DiffTests(unittest.TestCase):
+    """
+    A doc dict read back from the json output must compare the same as the doc dict it was written from
+    """
+
+    def test_json_round_trip(self):
+        for value in [(1, 2), {1: (3,)}, {"x": [(1,), {True: None}]}, 1.5, "text", None]:
+            doc = defaults_doc(value)
+            read = json.loads(json.dumps(doc))
+            self.assertEqual(diff_docs(doc, read), [], value)
+            self.assertEqual(diff_docs(read, doc), [], value)
+
+    def test_changed_default(self):
+        changes = diff_docs(defaults_doc((1, 2)), defaults_doc([1, 3]))
+        self.assertEqual([c["name"] for c in changes], ["package.module.f", "package.module.C.m"])
+        self.assertEqual(changes[0]["details"], [{"field": "default", "arg": "a", "old": "[1, 2]", "new": "[1, 3]"}])
+
+    def test_set_order(self):
+        self.assertEqual(value_text({"b", "a", "c"}), value_text({"c", "a", "b"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+import ast
+import os
+import shutil
+import tempfile
+import unittest
+
+from Documenter.FastExtractor import AmbiguousSource, skeleton_source
+from Documenter.Py2Dict import file_to_dict, tree_to_dict
+from Documenter.benchmarks.corpus import generate_source
+
+# sources with the constructs the fast extractor must skip or keep correctly
+SOURCES = {
+    "decorators": '''
+import functools
+
+@functools.lru_cache(maxsize=None)
+def cached(a:int, b=(1, 2)):
+    """cached"""
+    return a
+
+@decorator(
+    "multi line", key=[1,
+                       2])
+@other
+class Decorated:
+    """Decorated"""
+
+    @property
+    def value(self):
+        """value"""
+        return 1
+
+    @staticmethod
+    @functools.wraps(cached)
+    def wrapped(x=None, *args, **kwargs):
+        """wrapped"""
+''',
+    "nested classes": '''
+class Outer:
+    """Outer"""
+
+    class Inner:
+        """Inner"""
+
+        def inner_method(self, a:str="text"):
+            """inner method"""
+
+        class Innermost:
+            def deep(self):
+                pass
+
+    def method(self, b:"Outer.Inner"=None):
+        """method"""
+        class Local:
+            def local(self):
+                """local"""
+        return Local
+
+    def after(self):
+        return 2
+''',
+    "async defs": '''
+import asyncio
+
+async def fetch(url:str, timeout:float=1.5):
+    """fetch"""
+    async with session() as s:
+        return await s.get(url)
+
+def sync(a):
+    """sync"""
+
+class Client:
+    """Client"""
+
+    async def get(self, path:str):
+        """get"""
+        async for item in stream():
+            yield item
+
+    def close(self):
+        """close"""
+''',
+    "multi line signatures": '''
+def long_signature(
+    first:int,
+    second:str = "a ) string ( with brackets",
+    third:dict = {"key": [1, 2, (3, 4)]},  # a comment with a ) bracket
+    *args,
+    fourth:"module.Class" = None,
+    **kwargs
+):
+    """long
+    signature"""
+    return first
+
+def continued(a, \\
+              b=1):
+    \'\'\'single quoted docstring\'\'\'
+
+class Signatures:
+    """Signatures"""
+    def method(self,
+               a:int=-1,
+               b:bool=False): return a
+''',
+    "statements": '''
+"""module docstring"""
+import os
+
+VALUE = """
+def not_a_function():
+    pass
+"""
+
+if os.name == "nt":
+    def platform():
+        """windows"""
+else:
+    def platform():
+        """other"""
+
+try:
+    import fast
+except ImportError:
+    fast = None
+finally:
+    pass
+
+def after_blocks(x=[1,
+                    2]):
+    text = """
+class NotAClass:
+    pass
+"""
+    if x:
+        return {"a": (1,
+                      2)}
+    else:
+        return lambda: x
+
+def no_docstring(a, b): return a + b
+
+class Empty: pass
+
+class Base(object, metaclass=type):
+    "Base"; x = 1
+    def method(self): "string docstring"
+
+class InitOnly:
+    def __init__(self, a=1,
+                 b=None):
+        """init"""
+    def other(self): pass
+''',
+}
+
+
+def extract(source:str, ignore_no_docstr:bool, fast:bool):
+    """
+    Generates the doc dict of some source, with the fast extractor or the ast module
+    (the fast extractor is not allowed to fall back to the ast module, so a source it can not handle fails the test)
+    :param source: the Python source
+    :param ignore_no_docstr: If functions and classes without docstrings are ignored
+    :param fast: If the fast extractor is used
+    :return: the doc dict
+    """
+    if fast:
+        source = skeleton_source(source)
+    return tree_to_dict(ast.parse(source), ignore_no_docstr)
+
+
+class FastExtractorTests(unittest.TestCase):
+    """
+    The fast extractor must give the same doc dict as parsing the whole file with the ast module
+    """
+
+    def test_tricky_sources(self):
+        for name, source in SOURCES.items():
+            for ignore_no_docstr in (False, True):
+                with self.subTest(name=name, ignore_no_docstr=ignore_no_docstr):
+                    self.assertEqual(extract(source, ignore_no_docstr, True), extract(source, ignore_no_docstr, False))
+
+    def test_generated_sources(self):
+        for seed in range(20):
+            source = generate_source(functions=5, classes=3, methods=4, seed=seed)
+            self.assertEqual(extract(source, False, True), extract(source, False, False), seed)
+
+    def test_ambiguous_sources(self):
+        # sources the fast extractor can not be sure of are parsed by the ast module instead
+        for source in ["    def indented(): pass\n", "def tabs():\n\t'''tab'''\n", "def unbalanced(a, b:\n    pass\n"]:
+            with self.assertRaises(AmbiguousSource):
+                skeleton_source(source)
+
+    def test_file_to_dict(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            for i, source in enumerate(list(SOURCES.values()) + ["def tabs():\n\t'''tab'''\n"]):
+                filename = os.path.join(tmp, "module{}.py".format(i))
+                with open(filename, 'w', encoding="utf-8") as f:
+                    f.write(source)
+                self.assertEqual(file_to_dict(filename, tmp, False, fast=True), file_to_dict(filename, tmp, False, fast=False), filename)
+        finally:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    unittest.main()
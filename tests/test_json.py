@@ -0,0 +1,69 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from Documenter.Output import outJSON
+
+
+def values_doc():
+    """
+    Generates a doc dict whose default values are written differently by orjson and the json module
+    :return: the doc dict
+    """
+
+    values = [None, True, 1, -2 ** 63, 2 ** 64 - 1, 2 ** 70, -2 ** 70, 0.1, 1e16, 1e-7, float("inf"), float("nan"), "text", "é",
+              (1, (2, 3)), [1e16], {"a": 2 ** 70}]
+    return {
+        "package.plain": {
+            "functions": {"f": {"args": [{"name": "a", "type": "int", "value": 1}, {"name": "b", "type": "float", "value": 1.5}], "doc": "plain é"}},
+            "classes": {}
+        },
+        "package.values": {
+            "functions": {
+                "f{}".format(i): {"args": [{"name": "a", "type": "any", "value": v}], "doc": "value {}".format(i)}
+                for i, v in enumerate(values)
+            },
+            "classes": {"C": {"doc": "lone \ud800 surrogate", "func": {"m": {"args": [{"name": "b", "type": "int", "value": 2 ** 80}], "doc": ""}}}}
+        }
+    }
+
+
+class JSONOutputTests(unittest.TestCase):
+    """
+    The JSON outputs must be the same as the json module's, with or without orjson
+    """
+
+    def check_outputs(self):
+        doc = values_doc()
+
+        self.assertEqual(outJSON.doc_to_json(doc), json.dumps(doc))
+        self.assertEqual(outJSON.doc_to_json(doc, indent=2), json.dumps(doc, indent=2, ensure_ascii=False))
+        self.assertEqual(outJSON.doc_to_json(doc, indent=4), json.dumps(doc, indent=4, ensure_ascii=False))
+
+        lines = outJSON.doc_to_ndjson(doc)
+        self.assertEqual(lines, "".join(
+            json.dumps({"name": name, "module": mod}, ensure_ascii=False, separators=(",", ":")) + "\n" for name, mod in doc.items()
+        ))
+
+        # the wide integers are read back as integers (the tuples become lists)
+        read = dict(outJSON.iter_ndjson(io.StringIO(lines)))
+        self.assertEqual(read, json.loads(json.dumps(doc)))
+        self.assertEqual(read["package.values"]["functions"]["f5"]["args"][0]["value"], 2 ** 70)
+
+    @unittest.skipIf(outJSON.orjson is None, "orjson is not installed")
+    def test_with_orjson(self):
+        self.check_outputs()
+
+    def test_without_orjson(self):
+        with mock.patch.object(outJSON, "orjson", None):
+            self.check_outputs()
+
+    def test_plain_module(self):
+        doc = values_doc()
+        self.assertTrue(outJSON.plain_module(doc["package.plain"]))
+        self.assertFalse(outJSON.plain_module(doc["package.values"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
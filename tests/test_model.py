@@ -0,0 +1,42 @@
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir, doc_to_txt, doc_to_html, doc_to_md, doc_to_json, model_to_doc, compact_doc
+from Documenter.DocModel import ModuleDoc
+from Documenter.benchmarks.corpus import generate_package
+
+
+class CompactModelTests(unittest.TestCase):
+    """
+    The compact doc model must be written the same as the doc dict it was built from
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        generate_package(self.path, files=12, depth=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_compact(self):
+        doc = get_doc_from_dir(self.path)
+        model = get_doc_from_dir(self.path, compact=True)
+
+        self.assertEqual(list(model), list(doc))
+        self.assertTrue(all(isinstance(m, ModuleDoc) for m in model.values()))
+        self.assertEqual(model_to_doc(model), doc)
+        self.assertEqual(model_to_doc(compact_doc(doc)), doc)
+
+        for writer in (doc_to_txt, doc_to_html, doc_to_md, doc_to_json):
+            with self.subTest(writer=writer.__name__):
+                self.assertEqual(writer(model), writer(doc))
+
+    def test_pickle(self):
+        model = get_doc_from_dir(self.path, compact=True)
+        self.assertEqual(model_to_doc(pickle.loads(pickle.dumps(model))), model_to_doc(model))
+
+
+if __name__ == '__main__':
+    unittest.main()
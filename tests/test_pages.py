@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Output.outPages import MANIFEST_VERSION, doc_to_pages, page_filename, read_manifest
+
+
+def write_modules(path:str, names:list):
+    """
+    Writes a module with a single function for each dotted name, and documents them
+    :param path: the directory to write the modules to
+    :param names: the dotted name of each module
+    :return: the doc dict
+    """
+    for name in names:
+        filename = os.path.join(path, *name.split(".")) + ".py"
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as f:
+            f.write('def f(a=1):\n    """' + name + '"""\n')
+    return get_doc_from_dir(path)
+
+
+class PagesTests(unittest.TestCase):
+    """
+    Every module must be written to its own page, without replacing the index page or the page of another module
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmp, "src")
+        self.path = os.path.join(self.tmp, "pages")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_index_module(self):
+        names = ["index", "index_", "Index", "pkg.index", "other"]
+        self.assertEqual(len(set(page_filename(n, ".html") for n in names)), len(names))
+        self.assertNotIn("index.html", [page_filename(n, ".html").lower() for n in names])
+
+        doc = write_modules(self.source, names)
+        self.assertEqual(sorted(doc), sorted(names))
+        for page_type in ("html", "md", "txt"):
+            with self.subTest(page_type=page_type):
+                extension = "." + page_type
+                self.assertEqual(doc_to_pages(doc, self.path, page_type), {"written": 5, "unchanged": 0, "removed": 0 if page_type == "html" else 5})
+                self.assertEqual(doc_to_pages(doc, self.path, page_type), {"written": 0, "unchanged": 5, "removed": 0})
+
+                # the index lists every module, and each page is the module's own
+                with open(os.path.join(self.path, "index" + extension), encoding="utf-8") as f:
+                    index = f.read()
+                for name, page in read_manifest(self.path)["pages"].items():
+                    self.assertIn(page["file"], index)
+                    with open(os.path.join(self.path, page["file"]), encoding="utf-8") as f:
+                        self.assertIn(name, f.read())
+
+    def test_upgraded_manifest(self):
+        # a manifest written when the page of a module named index was index.md (and replaced the index page)
+        doc = write_modules(self.source, ["index"])
+        os.makedirs(self.path)
+        with open(os.path.join(self.path, "index.md"), 'w', encoding="utf-8") as f:
+            f.write("old")
+        with open(os.path.join(self.path, "manifest.json"), 'w', encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "type": "md", "index": "index.md", "pages": {"index": {"file": "index.md", "hash": ""}}}, f)
+
+        self.assertEqual(doc_to_pages(doc, self.path, "md"), {"written": 1, "unchanged": 0, "removed": 1})
+        self.assertEqual(sorted(os.listdir(self.path)), ["index.md", "index_.md", "manifest.json"])
+        with open(os.path.join(self.path, "index.md"), encoding="utf-8") as f:
+            self.assertIn("index_.md", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
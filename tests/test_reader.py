@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir, get_doc_from_files
+from Documenter.Py2Dict import file_to_dict
+from Documenter.Reader import read_source, decode_source, new_io_stats, prefetch_sources
+
+# a module which declares its encoding (PEP 263), and is not valid UTF-8
+# (the first and last characters of a docstring are not documented, so each docstring starts and ends with a space)
+LATIN_1 = '# -*- coding: latin-1 -*-\n\ndef f(a:str="café"):\n    """ naïve résumé """\n\n\nclass C:\n    """ Größe """\n    def m(self):\n        """ ü """\n'
+
+
+class ReaderTests(unittest.TestCase):
+    """
+    A file must be read as bytes, and decoded with the encoding it declares
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp, "latin.py")
+        with open(self.filename, 'wb') as f:
+            f.write(LATIN_1.replace("\n", "\r\n").encode("latin-1"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_read_source(self):
+        stats = new_io_stats()
+        data = read_source(self.filename, stats)
+        self.assertEqual(data, LATIN_1.replace("\n", "\r\n").encode("latin-1"))
+        self.assertEqual((stats["files"], stats["bytes"]), (1, len(data)))
+
+        with self.assertRaises(UnicodeDecodeError):
+            data.decode("utf-8")
+        self.assertEqual(decode_source(data), LATIN_1)
+
+    def test_declared_encoding(self):
+        for fast in (False, True):
+            with self.subTest(fast=fast):
+                doc = file_to_dict(self.filename, self.tmp, False, fast=fast)
+                self.assertEqual(doc["functions"]["f"]["args"][0]["value"], "café")
+                self.assertEqual(doc["functions"]["f"]["doc"], "naïve résumé")
+                self.assertEqual(doc["classes"]["C"]["doc"], "Größe")
+                self.assertEqual(doc["classes"]["C"]["func"]["m"]["doc"], "ü")
+
+    def test_prefetch(self):
+        # the files are read ahead of the parser in the same order, and a file which can not be read is passed on as None
+        files = [self.filename, os.path.join(self.tmp, "missing.py"), self.filename]
+        sources = list(prefetch_sources(files, batch_size=1))
+        self.assertEqual([f for f, _ in sources], files)
+        self.assertEqual([s is None for _, s in sources], [False, True, False])
+
+    def test_directory(self):
+        with open(os.path.join(self.tmp, "utf8.py"), 'w', encoding="utf-8") as f:
+            f.write('def g(b="ü"):\n    """ü"""\n')
+        doc = get_doc_from_dir(self.tmp)
+        self.assertEqual(doc, get_doc_from_files([self.filename, os.path.join(self.tmp, "utf8.py")], self.tmp, workers=2))
+        self.assertEqual(doc["utf8"]["functions"]["g"]["args"][0]["value"], "ü")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Shard import parse_shard, write_shard, merge_shards, iter_merged_shards
+from Documenter.benchmarks.corpus import generate_package
+from Documenter.tests.test_changes import PACKAGE_PARENT
+
+# the number of shards the package is split into
+SHARDS = 3
+
+
+class ShardTests(unittest.TestCase):
+    """
+    Merging the partial snapshots of every shard (in any order) must give the same output as documenting the directory at once
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "package")
+        generate_package(self.path, files=30, depth=2)
+        self.snapshots = [os.path.join(self.tmp, "shard{}.pickle".format(i)) for i in range(1, SHARDS + 1)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_shards(self):
+        """
+        Documents each shard of the package
+        :return: the number of modules written to each shard
+        """
+        return [write_shard(self.path, self.snapshots[i - 1], i, SHARDS) for i in range(1, SHARDS + 1)]
+
+    def test_merge(self):
+        modules = self.write_shards()
+        full = get_doc_from_dir(self.path)
+        self.assertEqual(sum(modules), len(full))
+        self.assertTrue(all(m > 0 for m in modules))
+
+        merged = merge_shards(self.snapshots[::-1])
+        self.assertEqual(list(merged), list(full))
+        self.assertEqual(merged, full)
+
+    def test_command_line(self):
+        formats = "txt,html,json"
+
+        def run(*args):
+            env = dict(os.environ, PYTHONPATH=PACKAGE_PARENT)
+            return subprocess.run([sys.executable, "-m", "Documenter.Documenter"] + list(args), env=env, stdout=subprocess.PIPE).returncode
+
+        def outputs(prefix):
+            return [os.path.join(self.tmp, prefix + "." + f) for f in formats.split(",")]
+
+        self.assertEqual(run(formats, self.path, ",".join(outputs("single"))), 0)
+        for i in range(1, SHARDS + 1):
+            self.assertEqual(run(self.path, self.snapshots[i - 1], "--shard", "{}/{}".format(i, SHARDS)), 0)
+        self.assertEqual(run("merge", formats, *(self.snapshots[::-1] + [",".join(outputs("merged"))])), 0)
+
+        for single, merged in zip(outputs("single"), outputs("merged")):
+            with open(single, 'rb') as a, open(merged, 'rb') as b:
+                self.assertEqual(a.read(), b.read(), single)
+
+        # a missing shard is reported before any output is written
+        os.remove(outputs("merged")[0])
+        self.assertNotEqual(run("merge", "txt", self.snapshots[0], self.snapshots[2], outputs("merged")[0]), 0)
+        self.assertFalse(os.path.exists(outputs("merged")[0]))
+
+    def test_missing_shard(self):
+        self.write_shards()
+        with self.assertRaisesRegex(ValueError, "Shard 2 Of 3 Is Missing"):
+            iter_merged_shards([self.snapshots[0], self.snapshots[2]])
+        with self.assertRaisesRegex(ValueError, "Each Shard Must Be Merged Once"):
+            iter_merged_shards(self.snapshots + [self.snapshots[1]])
+        with self.assertRaisesRegex(ValueError, "No Partial Snapshots"):
+            iter_merged_shards([])
+
+    def test_mismatched_listing(self):
+        # a file is added after the first shard was written, so the shards do not agree on the files
+        write_shard(self.path, self.snapshots[0], 1, SHARDS)
+        with open(os.path.join(self.path, "added.py"), 'w') as f:
+            f.write('def added():\n    """added"""\n')
+        for i in range(2, SHARDS + 1):
+            write_shard(self.path, self.snapshots[i - 1], i, SHARDS)
+
+        with self.assertRaisesRegex(ValueError, "Different Files"):
+            iter_merged_shards(self.snapshots)
+
+    def test_damaged_shard(self):
+        self.write_shards()
+
+        # a partly written shard is detected while merging
+        with open(self.snapshots[1], 'rb') as f:
+            data = f.read()
+        with open(self.snapshots[1], 'wb') as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaisesRegex(ValueError, "Was Not Completely Written"):
+            merge_shards(self.snapshots)
+
+        # a file which is not a partial snapshot
+        with open(self.snapshots[1], 'wb') as f:
+            f.write(b"not a shard")
+        with self.assertRaisesRegex(ValueError, "Is Not A Partial Snapshot"):
+            iter_merged_shards(self.snapshots)
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for spec in ("0/4", "5/4", "1/0", "1", "a/b"):
+            with self.assertRaises(ValueError):
+                parse_shard(spec)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Output.outSQLite import doc_to_sqlite, doc_to_sqlite_db
+from Documenter.Symbols import build_symbol_index
+from Documenter.benchmarks.corpus import generate_package
+
+# a module with the default values and docstrings which must be escaped in the file of SQLite3 commands
+# (the double quotes of a function's docstring are written as single quotes, so none are used here)
+SPECIAL = '''
+class Quotes:
+    """it's a "class"; with -- comments"""
+
+    def method(self, a:str="it's", b=(1, "two"), c={"k": [None, 1.5]}, d=-1, e=b"bytes", f=True):
+        """unicode é and a
+        new line"""
+
+
+def no_docstring(x:int, *args, y:"models.User"=None, **kwargs):
+    pass
+'''
+
+
+def read_tables(filename:str):
+    """
+    Reads every row of every table of a database
+    :param filename: the database filename
+    :return: a dict of each table's name, and its rows
+    """
+    conn = sqlite3.connect(filename)
+    try:
+        tables = [row[0] for row in conn.execute("SELECT `name` FROM `sqlite_master` WHERE `type` = 'table' AND `name` NOT LIKE 'sqlite_%'")]
+        return {table: conn.execute("SELECT * FROM `{}` ORDER BY `rowid`".format(table)).fetchall() for table in sorted(tables)}
+    finally:
+        conn.close()
+
+
+def run_script(script:str, filename:str):
+    """
+    Runs a file of SQLite3 commands on a database
+    :param script: the commands
+    :param filename: the database filename
+    """
+    conn = sqlite3.connect(filename)
+    try:
+        conn.executescript(script)
+    finally:
+        conn.close()
+
+
+class SQLiteTests(unittest.TestCase):
+    """
+    Loading the file of SQLite3 commands must give the same rows as writing the database directly
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "src")
+        generate_package(self.path, files=10, depth=1)
+        with open(os.path.join(self.path, "special.py"), 'w', encoding="utf-8") as f:
+            f.write(SPECIAL)
+        self.doc = get_doc_from_dir(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_script_same_as_db(self):
+        for symbols in (None, build_symbol_index(self.doc)):
+            with self.subTest(references=symbols is not None):
+                script = os.path.join(self.tmp, "script.db")
+                direct = os.path.join(self.tmp, "direct.db")
+                run_script(doc_to_sqlite(self.doc, symbols=symbols), script)
+                doc_to_sqlite_db(self.doc, direct, symbols=symbols)
+
+                tables = read_tables(direct)
+                self.assertEqual(read_tables(script), tables)
+                self.assertEqual("references" in tables, symbols is not None)
+                self.assertGreater(len(tables["args"]), 0)
+
+    def test_small_statements(self):
+        # splitting the rows into many INSERT statements gives the same rows
+        script = os.path.join(self.tmp, "script.db")
+        direct = os.path.join(self.tmp, "direct.db")
+        run_script(doc_to_sqlite(self.doc, max_rows=3, max_bytes=200), script)
+        doc_to_sqlite_db(self.doc, direct, batch_size=7)
+        self.assertEqual(read_tables(script), read_tables(direct))
+
+
+def read_contents(filename:str):
+    """
+    Reads the rows of a database by the names they refer to, rather than their IDs (which depend on the order the rows were written in)
+    :param filename: the database filename
+    :return: a dict of each table's name, and its sorted rows
+    """
+    conn = sqlite3.connect(filename)
+    try:
+        tables = {
+            "files": conn.execute("SELECT `name`, `hash` FROM `files`").fetchall(),
+            "classes": conn.execute(
+                "SELECT `f`.`name`, `c`.`name`, `c`.`docstring` FROM `classes` `c` JOIN `files` `f` ON `f`.`id` = `c`.`fileId`"
+            ).fetchall(),
+            "functions": conn.execute(
+                """SELECT `f`.`name`, `c`.`name`, `fn`.`name`, `fn`.`docstring` FROM `functions` `fn` JOIN `files` `f` ON `f`.`id` = `fn`.`fileId`
+                    LEFT JOIN `classes` `c` ON `c`.`id` = `fn`.`classId`"""
+            ).fetchall(),
+            "args": conn.execute(
+                """SELECT `f`.`name`, `c`.`name`, `fn`.`name`, `a`.`order`, `a`.`name`, `a`.`type`, `a`.`value` FROM `args` `a`
+                    JOIN `functions` `fn` ON `fn`.`id` = `a`.`functionId` JOIN `files` `f` ON `f`.`id` = `fn`.`fileId`
+                    LEFT JOIN `classes` `c` ON `c`.`id` = `fn`.`classId`"""
+            ).fetchall()
+        }
+        if conn.execute("SELECT COUNT(*) FROM `sqlite_master` WHERE `name` = 'search'").fetchone()[0] > 0:
+            tables["search"] = conn.execute("SELECT `kind`, `path`, `name`, `docstring` FROM `search`").fetchall()
+
+            # each search row is still built from the row it refers to
+            tables["search_sources"] = conn.execute("""SELECT COUNT(*) FROM `search` WHERE NOT (
+                (`kind` = 'module' AND `rowid` = `sourceId` * 3 AND `sourceId` IN (SELECT `id` FROM `files`)) OR
+                (`kind` = 'class' AND `rowid` = `sourceId` * 3 + 1 AND `sourceId` IN (SELECT `id` FROM `classes`)) OR
+                (`kind` = 'function' AND `rowid` = `sourceId` * 3 + 2 AND `sourceId` IN (SELECT `id` FROM `functions`))
+            )""").fetchall()
+        return {table: sorted(rows, key=repr) for table, rows in tables.items()}
+    finally:
+        conn.close()
+
+
+def read_ids(filename:str, module:str):
+    """
+    Reads the IDs of the rows of a module
+    :param filename: the database filename
+    :param module: the module's dotted name
+    :return: the ID of the file, and the IDs of its classes, functions and arguements
+    """
+    conn = sqlite3.connect(filename)
+    try:
+        file_id = conn.execute("SELECT `id` FROM `files` WHERE `name` = ?", (module,)).fetchone()[0]
+        return (
+            file_id,
+            conn.execute("SELECT `id` FROM `classes` WHERE `fileId` = ? ORDER BY `id`", (file_id,)).fetchall(),
+            conn.execute("SELECT `id` FROM `functions` WHERE `fileId` = ? ORDER BY `id`", (file_id,)).fetchall(),
+            conn.execute(
+                "SELECT `id` FROM `args` WHERE `functionId` IN (SELECT `id` FROM `functions` WHERE `fileId` = ?) ORDER BY `id`", (file_id,)
+            ).fetchall()
+        )
+    finally:
+        conn.close()
+
+
+class IncrementalTests(unittest.TestCase):
+    """
+    Updating a database in the incremental mode must give the same rows as writing it from scratch,
+    without changing the IDs of the rows of the unchanged modules
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "src")
+        generate_package(self.path, files=6, depth=1)
+        with open(os.path.join(self.path, "special.py"), 'w', encoding="utf-8") as f:
+            f.write(SPECIAL)
+        self.old = get_doc_from_dir(self.path)
+        self.names = list(self.old)
+
+        # modify a module, delete one, add one (walked before the others), and rename a class
+        with open(os.path.join(self.path, self.names[1].replace(".", os.sep) + ".py"), 'a') as f:
+            f.write('\n\ndef added_function(z:int=3):\n    """added"""\n')
+        os.remove(os.path.join(self.path, self.names[2].replace(".", os.sep) + ".py"))
+        with open(os.path.join(self.path, "aaa_added.py"), 'w') as f:
+            f.write('class Added:\n    """Added"""\n    def m(self, a=1):\n        """m"""\n')
+        with open(os.path.join(self.path, "special.py"), 'w', encoding="utf-8") as f:
+            f.write(SPECIAL.replace("class Quotes:", "class Renamed:"))
+        self.new = get_doc_from_dir(self.path)
+        self.unchanged = self.names[3]
+
+        self.fresh = os.path.join(self.tmp, "fresh.db")
+        doc_to_sqlite_db(self.new, self.fresh, search_index=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_sqlite_db(self):
+        db = os.path.join(self.tmp, "incremental.db")
+        doc_to_sqlite_db(self.old, db, search_index=True)
+        ids = read_ids(db, self.unchanged)
+
+        self.assertEqual(doc_to_sqlite_db(self.new, db, incremental=True), {"inserted": 1, "updated": 2, "unchanged": len(self.names) - 3, "removed": 1})
+        self.assertEqual(read_contents(db), read_contents(self.fresh))
+        self.assertEqual(read_ids(db, self.unchanged), ids)
+
+        # updating it again changes nothing
+        self.assertEqual(doc_to_sqlite_db(self.new, db, incremental=True)["unchanged"], len(self.new))
+        self.assertEqual(read_contents(db), read_contents(self.fresh))
+
+    def test_sqlite_script(self):
+        db = os.path.join(self.tmp, "incremental.db")
+        run_script(doc_to_sqlite(self.old), db)
+        ids = read_ids(db, self.unchanged)
+
+        run_script(doc_to_sqlite(self.new, incremental=True), db)
+        fresh = read_contents(self.fresh)
+        del fresh["search"], fresh["search_sources"]
+        self.assertEqual(read_contents(db), fresh)
+        self.assertEqual(read_ids(db, self.unchanged), ids)
+
+        # a new database is created by the script
+        db = os.path.join(self.tmp, "new.db")
+        run_script(doc_to_sqlite(self.new, incremental=True), db)
+        self.assertEqual(read_contents(db), fresh)
+
+    def test_without_hash(self):
+        # tables written before the hash was stored
+        db = os.path.join(self.tmp, "old.db")
+        doc_to_sqlite_db(self.old, db)
+        conn = sqlite3.connect(db)
+        conn.executescript("""
+            CREATE TABLE `old_files` AS SELECT `id`, `name` FROM `files`;
+            DROP TABLE `files`;
+            CREATE TABLE `files` (`id` INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, `name` TEXT);
+            INSERT INTO `files` SELECT * FROM `old_files`;
+            DROP TABLE `old_files`;
+        """)
+        conn.close()
+        before = read_tables(db)
+
+        # the script stops before changing anything
+        with self.assertRaises(sqlite3.OperationalError) as error:
+            run_script(doc_to_sqlite(self.new, incremental=True), db)
+        self.assertIn("hash", str(error.exception))
+        self.assertEqual(read_tables(db), before)
+
+        # the database is given the column, and every module is written again
+        self.assertEqual(doc_to_sqlite_db(self.new, db, incremental=True)["updated"], len(self.new) - 1)
+        fresh = read_contents(self.fresh)
+        del fresh["search"], fresh["search_sources"]
+        self.assertEqual(read_contents(db), fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
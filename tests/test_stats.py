@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from Documenter import Stats
+from Documenter.Documenter import get_doc_from_dir, iter_doc_from_dir
+from Documenter.Stats import add_hook, remove_hook, StatsCollector
+from Documenter.benchmarks.corpus import generate_package
+from Documenter.tests.test_changes import PACKAGE_PARENT
+
+# the number of files in the package which is documented
+FILES = 6
+
+
+class StatsTests(unittest.TestCase):
+    """
+    Every stage of a run must be reported to the hooks, and nothing must be measured while there are no hooks
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "src")
+        generate_package(self.path, files=FILES, depth=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def collect(self, func, *args):
+        """
+        Calls a function with a hook registered
+        :param func: the function to call
+        :param args: the arguements of the function
+        :return: the value the function returned, and the list of (event, data) pairs emitted
+        """
+        events = []
+        hook = lambda event, data: events.append((event, data))
+        add_hook(hook)
+        try:
+            value = func(*args)
+        finally:
+            remove_hook(hook)
+        return value, events
+
+    def test_hooks(self):
+        doc, events = self.collect(get_doc_from_dir, self.path)
+        stages = [data["stage"] for event, data in events if event == "stage"]
+        self.assertEqual(stages.count("get_doc_from_dir"), 1)
+        self.assertEqual(stages.count("iter_doc_from_files"), 1)
+        self.assertIn("find_python_files", stages)
+        self.assertIn("parse_function", stages)
+        self.assertEqual(len([data for event, data in events if event == "file"]), FILES)
+        self.assertEqual(doc, get_doc_from_dir(self.path))
+
+    def test_generator(self):
+        # the stage of a generator is emitted once it is exhausted (not when it is created)
+        doc, events = self.collect(lambda: dict(iter_doc_from_dir(self.path)))
+        self.assertEqual([data["stage"] for event, data in events if event == "stage"].count("iter_doc_from_files"), 1)
+        self.assertEqual(doc, get_doc_from_dir(self.path))
+
+        # or once it is closed
+        events = []
+        hook = lambda event, data: events.append((event, data))
+        add_hook(hook)
+        try:
+            docs = iter_doc_from_dir(self.path)
+            next(docs)
+            self.assertNotIn("iter_doc_from_files", [data["stage"] for event, data in events if event == "stage"])
+            docs.close()
+        finally:
+            remove_hook(hook)
+        self.assertIn("iter_doc_from_files", [data["stage"] for event, data in events if event == "stage"])
+
+    def test_no_hooks(self):
+        # without hooks the generator is not wrapped, and no events are emitted
+        self.assertEqual(Stats.HOOKS, [])
+        with mock.patch.object(Stats, "emit") as emit, mock.patch.object(Stats, "timed_iter") as timed_iter:
+            docs = iter_doc_from_dir(self.path)
+            self.assertEqual(docs.__name__, "iter_doc_from_files")
+            doc = dict(docs)
+        emit.assert_not_called()
+        timed_iter.assert_not_called()
+        self.assertEqual(doc, get_doc_from_dir(self.path))
+
+    def test_collector(self):
+        with StatsCollector(trace_memory=False) as stats:
+            get_doc_from_dir(self.path)
+        self.assertEqual(stats.to_dict()["files"], FILES)
+        self.assertEqual(stats.stages["iter_doc_from_files"]["calls"], 1)
+        self.assertIn("iter_doc_from_files", stats.report())
+
+    def test_stats_json(self):
+        output = os.path.join(self.tmp, "out.txt")
+        stats_json = os.path.join(self.tmp, "stats.json")
+        env = dict(os.environ, PYTHONPATH=PACKAGE_PARENT)
+        subprocess.run([sys.executable, "-m", "Documenter.Documenter", "txt", self.path, output, "--stats-json", stats_json], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+
+        with open(stats_json) as f:
+            stats = json.load(f)
+        self.assertEqual(stats["files"], FILES)
+        for stage in ("find_python_files", "iter_doc_from_files", "parse_function"):
+            self.assertIn(stage, stats["stages"])
+        self.assertIn("doc_to_txt", stats["writers"])
+
+
+if __name__ == '__main__':
+    unittest.main()
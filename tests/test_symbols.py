@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Output.outHTML import doc_to_html
+from Documenter.Symbols import Symbol, SymbolIndex
+
+# a package whose arguement types are plain and dotted names of classes in other modules
+MODULES = {
+    "models.py": 'class User:\n    """User"""\n\n\nclass Group:\n    """Group"""\n',
+    "admin.py": 'class User:\n    """admin User"""\n',
+    "views.py": (
+        'import models\n\n\n'
+        'class Group:\n    """local Group"""\n\n\n'
+        'def show(a:models.User, b:Group, c:int, d:"text"=None):\n    """show"""\n'
+    )
+}
+
+
+def module(functions=(), classes=()):
+    """
+    Generates the doc dict of a module
+    :param functions: the names of the module's functions
+    :param classes: the names of the module's classes, and the names of each one's methods
+    :return: the module's doc dict
+    """
+    return {
+        "functions": {n: {"args": [], "doc": n} for n in functions},
+        "classes": {n: {"func": {m: {"args": [], "doc": m} for m in methods}, "doc": n} for n, methods in classes}
+    }
+
+
+class SymbolIndexTests(unittest.TestCase):
+    """
+    Each type must resolve to the single symbol it refers to, looking in its own module first
+    """
+
+    def setUp(self):
+        self.symbols = SymbolIndex({
+            "app.models": module(classes=[("User", ["save"])]),
+            "app.admin": module(functions=["User"], classes=[("Site", [])]),
+            "app.views": module(functions=["show"], classes=[("Site", [])])
+        })
+
+    def test_module_first(self):
+        self.assertEqual(self.symbols.resolve("Site", "app.views"), Symbol("class", "app.views.Site", "app.views"))
+        self.assertEqual(self.symbols.resolve("Site", "app.admin"), Symbol("class", "app.admin.Site", "app.admin"))
+        self.assertEqual(self.symbols.resolve("User", "app.admin"), Symbol("function", "app.admin.User", "app.admin"))
+
+    def test_ambiguous_suffix(self):
+        # Site and User are defined in more than one module
+        self.assertIsNone(self.symbols.resolve("Site"))
+        self.assertIsNone(self.symbols.resolve("User", "app.views"))
+
+        # a longer name only one symbol has is found
+        self.assertEqual(self.symbols.resolve("models.User", "app.views"), Symbol("class", "app.models.User", "app.models"))
+        self.assertEqual(self.symbols.resolve("User.save"), Symbol("function", "app.models.User.save", "app.models"))
+
+    def test_full_name(self):
+        self.assertEqual(self.symbols.resolve("app.admin.Site"), Symbol("class", "app.admin.Site", "app.admin"))
+        self.assertEqual(self.symbols.resolve("app.views"), Symbol("module", "app.views", "app.views"))
+        self.assertIsNone(self.symbols.resolve("app.missing.Site"))
+
+    def test_unnamed_types(self):
+        self.assertIsNone(self.symbols.resolve("any"))
+        self.assertIsNone(self.symbols.resolve("unknown"))
+
+    def test_clear(self):
+        self.assertEqual(len(self.symbols), 9)
+        self.symbols.clear()
+        self.assertEqual(len(self.symbols), 0)
+        self.assertIsNone(self.symbols.resolve("User.save"))
+
+
+class DottedTypeTests(unittest.TestCase):
+    """
+    A dotted type must only be documented by its name when the types are linked, so the other outputs do not change
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "src")
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        os.makedirs(self.path)
+        for name, source in MODULES.items():
+            with open(os.path.join(self.path, name), 'w') as f:
+                f.write(source)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def types(self, doc):
+        return [a["type"] for a in doc["views"]["functions"]["show"]["args"]]
+
+    def test_dotted_types(self):
+        for cache_dir in (None, self.cache_dir, self.cache_dir):
+            with self.subTest(cache_dir=cache_dir):
+                self.assertEqual(self.types(get_doc_from_dir(self.path, cache_dir=cache_dir)), ["unknown", "Group", "int", "unknown"])
+
+                symbols = SymbolIndex()
+                doc = get_doc_from_dir(self.path, cache_dir=cache_dir, workers=2, symbols=symbols)
+                self.assertEqual(self.types(doc), ["models.User", "Group", "int", "unknown"])
+
+                # the dotted type is linked to its class, and the plain type to the class in its own module
+                self.assertEqual(symbols.resolve("models.User", "views"), Symbol("class", "models.User", "models"))
+                self.assertEqual(symbols.resolve("Group", "views"), Symbol("class", "views.Group", "views"))
+                html = doc_to_html(doc, symbols=symbols)
+                self.assertIn('href="#models.User"', html)
+                self.assertIn('href="#views.Group"', html)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from Documenter.Documenter import get_doc_from_dir
+from Documenter.Watch import watch_dir
+
+
+def write_module(path:str, doc:str):
+    """
+    Writes a module with a single function
+    :param path: the module's path
+    :param doc: the function's docstring
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('def f(a=1):\n    """' + doc + '"""\n')
+
+
+class WatchTests(unittest.TestCase):
+    """
+    The documentation rebuilt by watch mode must be the same as documenting the directory again
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        for name in ("b.py", "d.py", os.path.join("sub", "c.py"), os.path.join("sub", "e.py")):
+            write_module(os.path.join(self.path, name), name)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_rebuild_order(self):
+        written = []
+        started = threading.Event()
+
+        def write(doc):
+            written.append(dict(doc))
+            started.set()
+
+        thread = threading.Thread(target=watch_dir, args=(self.path, write), kwargs={
+            "interval": 0.05, "debounce": 0.2, "rebuilds": 1, "report": lambda message: None
+        })
+        thread.start()
+        self.assertTrue(started.wait(10))
+
+        # add modules which are walked before the existing ones, modify one, and delete one
+        write_module(os.path.join(self.path, "a.py"), "added")
+        write_module(os.path.join(self.path, "sub", "a.py"), "added")
+        write_module(os.path.join(self.path, "d.py"), "modified")
+        os.remove(os.path.join(self.path, "sub", "e.py"))
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+
+        full = get_doc_from_dir(self.path)
+        self.assertEqual(len(written), 2)
+        self.assertEqual(list(written[-1]), list(full))
+        self.assertEqual(written[-1], full)
+
+
+if __name__ == '__main__':
+    unittest.main()